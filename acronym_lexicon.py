@@ -0,0 +1,172 @@
+import hashlib
+import re
+
+from segmentation import SENTENCE_TERMINATORS
+
+
+DEFAULT_ACRONYMS = (
+    "AADHAAR",
+    "AADHAR",
+    "NITI Aayog",
+    "ISRO",
+    "NABARD",
+    "NASSCOM",
+    "SEBI",
+    "NIFT",
+    "NIMHANS",
+    "AIIMS",
+    "BARC",
+    "TRAI",
+    "BHEL",
+    "SAIL",
+    "GAIL",
+    "NHAI",
+    "CREDAI",
+    "ASSOCHAM",
+    "NASSCOM",
+    "UIDAI",
+    "NITI",
+    "NABI",
+    "BITS",
+    "TERI",
+    "HUDCO",
+    "NALCO",
+    "BALCO",
+    "CIDCO",
+    "ICAR",
+    "AMUL",
+    "HAL",
+    "e-NACH",
+    "NASDAQ",
+    "SENSEX",
+    "CIBIL",
+    "NIFTY",
+    "PAN",
+)
+
+# Suffix forms in the order they are reported: possessive, plural, bare word.
+SUFFIXES = ("'s", "s", "")
+
+
+def _trie_to_regex(node):
+    """Render a character trie as a regex alternation that prefers the longest entry."""
+    terminal = "" in node
+    branches = [re.escape(char) + _trie_to_regex(child) for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ""
+    if len(branches) == 1 and not terminal:
+        return branches[0]
+    alternation = "(?:" + "|".join(branches) + ")"
+    return alternation + "?" if terminal else alternation
+
+
+class CompiledLexicon:
+    """
+    An immutable snapshot of lexicon entries: one pattern matching every entry with
+    an optional "'s" or "s" suffix, plus each entry's position in the lexicon.
+    """
+
+    def __init__(self, words):
+        index = {}
+        trie = {}
+        for word in words:
+            if not word or word in index:
+                continue
+            index[word] = len(index)
+            node = trie
+            for char in word:
+                node = node.setdefault(char, {})
+            node[""] = True
+
+        self.index = index
+        # Identifies the entries, so cached results from another lexicon are never reused.
+        self.fingerprint = hashlib.sha256("\n".join(index).encode("utf-8")).hexdigest()[:16]
+        self.pattern = re.compile(rf"\b({_trie_to_regex(trie)})('s|s)?\b") if index else None
+        # Text without any of these characters cannot contain an entry: one character per
+        # entry, preferring an uppercase ASCII letter since those are rare in prose.
+        trigger_chars = {next((char for char in word if "A" <= char <= "Z"), word[0]) for word in index}
+        self.trigger = re.compile("[" + "".join(map(re.escape, sorted(trigger_chars))) + "]") if index else None
+        # Entries such as "U.S. Army" can straddle a sentence boundary.
+        self.has_sentence_punctuation = any(char in word for word in index for char in SENTENCE_TERMINATORS)
+
+    def render(self, match, entities):
+        """
+        Replacement text for a match of pattern, recording the entity in entities, a dict
+        keyed by lexicon position and suffix form.
+        """
+        word, suffix = match.group(1), match.group(2) or ""
+        replacement = f"{word.lower()}s" if suffix else word.lower()
+        key = (self.index[word], SUFFIXES.index(suffix))
+        if key not in entities:
+            entities[key] = (f"{word}{suffix}", replacement)
+        return replacement
+
+    def entity_key(self, original):
+        """The (lexicon position, suffix form) key render used for an entity's original text."""
+        match = self.pattern.fullmatch(original)
+        return self.index[match.group(1)], SUFFIXES.index(match.group(2) or "")
+
+    @staticmethod
+    def ordered_entities(entities):
+        """The (original, replacement) pairs recorded by render, in lexicon order."""
+        return tuple(entities[key] for key in sorted(entities))
+
+    def replace(self, text):
+        if self.pattern is None:
+            return text, ()
+        entities = {}
+        modified_text = self.pattern.sub(lambda match: self.render(match, entities), text)
+        return modified_text, self.ordered_entities(entities)
+
+
+class AcronymLexicon:
+    """
+    Words that are read out as words rather than spelled (e.g. "ISRO", "SEBI").
+
+    All entries are matched in one scan of the text, so the cost stays flat as the
+    lexicon grows. Matched entries are lower-cased, with "'s" and "s" suffixes
+    folded into a trailing "s".
+    """
+
+    def __init__(self, words=DEFAULT_ACRONYMS, path=None):
+        self.path = path
+        self.compiled = CompiledLexicon(words)
+
+    @classmethod
+    def from_file(cls, path):
+        """Load a lexicon with one entry per line; blank lines and '#' comments are ignored."""
+        return cls(cls._read_entries(path), path=path)
+
+    @staticmethod
+    def _read_entries(path):
+        with open(path, encoding="utf-8") as f:
+            return [
+                line.strip() for line in f
+                if line.strip() and not line.lstrip().startswith("#")
+            ]
+
+    def __len__(self):
+        return len(self.compiled.index)
+
+    def __contains__(self, word):
+        return word in self.compiled.index
+
+    def update(self, words):
+        """Replace the lexicon entries. In-flight calls keep using the previous snapshot."""
+        self.compiled = CompiledLexicon(words)
+
+    def reload(self):
+        """Re-read the lexicon from the file it was loaded from."""
+        if self.path is None:
+            raise ValueError("AcronymLexicon was not loaded from a file")
+        self.update(self._read_entries(self.path))
+
+    def replace(self, text):
+        """
+        Replace every lexicon entry in text.
+
+        Returns:
+            tuple: (modified text, tuple of (original, replacement)) with each
+            distinct entry/suffix pair reported once, in lexicon order.
+        """
+        return self.compiled.replace(text)
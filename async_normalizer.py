@@ -0,0 +1,126 @@
+import asyncio
+import pickle
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+from preprocesor import OrpheusTextNormalizer, _init_batch_worker, _process_in_batch_worker
+from schema import DeterministicPreTTSPreprocessingResponse
+
+
+class AsyncOrpheusTextNormalizer:
+    """
+    asyncio front end for OrpheusTextNormalizer that keeps normalization off the event loop.
+
+    The CPU work runs on a thread or process executor. At most max_in_flight
+    requests are submitted to the executor at once; further callers wait in
+    normalize() until a slot frees up, so a burst of requests applies
+    backpressure instead of queueing unbounded work. A slot is held until the
+    executor job actually finishes, even if the awaiting task was cancelled.
+
+    A process executor created here reuses the per-worker normalizer from
+    process_batch. Workers of a process executor passed in were not started with
+    that initializer, so each of them builds a normalizer from this one's
+    worker_config() on its first request and keeps it.
+    """
+
+    def __init__(
+        self,
+        normalizer: OrpheusTextNormalizer = None,
+        executor="thread",
+        max_workers: int = None,
+        max_in_flight: int = 64,
+    ):
+        """
+        Args:
+            normalizer (OrpheusTextNormalizer): Normalizer to run (default: a new one)
+            executor (str | Executor): "thread", "process", or an existing executor to use
+            max_workers (int): Worker count when the executor is created here
+            max_in_flight (int): Maximum requests submitted to the executor at once
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be >= 1")
+        self.normalizer = normalizer if normalizer is not None else OrpheusTextNormalizer()
+        self.max_in_flight = max_in_flight
+
+        self._owns_executor = not isinstance(executor, Executor)
+        if executor == "thread":
+            self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="orpheus-normalizer")
+        elif executor == "process":
+            self._executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_batch_worker,
+                initargs=(self.normalizer.worker_config(),),
+            )
+        elif isinstance(executor, Executor):
+            self._executor = executor
+        else:
+            raise ValueError(f"Unknown executor: {executor!r}")
+        # Pickled worker_config() sent along with each request to a process executor
+        # passed in, so its workers can build a matching normalizer.
+        self._worker_config = None
+        if not self._owns_executor and isinstance(self._executor, ProcessPoolExecutor):
+            self._worker_config = pickle.dumps(self.normalizer.worker_config())
+        self._in_process = executor == "process"
+
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently submitted to the executor."""
+        return self._in_flight
+
+    async def normalize(self, text: str, to_lang: str = "en") -> DeterministicPreTTSPreprocessingResponse:
+        """
+        Normalize text without blocking the event loop. Produces the same result as
+        OrpheusTextNormalizer.process_text.
+        """
+        loop = asyncio.get_running_loop()
+        await self._semaphore.acquire()
+        self._in_flight += 1
+        try:
+            if self._in_process:
+                future = self._executor.submit(_process_in_batch_worker, (text, to_lang))
+            elif self._worker_config is not None:
+                future = self._executor.submit(_process_in_configured_worker, self._worker_config, text, to_lang)
+            else:
+                future = self._executor.submit(self.normalizer.process_text, text, to_lang)
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(self._release))
+        # Cancelling the awaiting task cancels the job if it has not started yet.
+        return await asyncio.wrap_future(future, loop=loop)
+
+    def _release(self):
+        self._in_flight -= 1
+        self._semaphore.release()
+
+    async def normalize_many(self, texts, to_lang: str = "en") -> list[DeterministicPreTTSPreprocessingResponse]:
+        """Normalize several texts concurrently, returning responses in input order."""
+        return await asyncio.gather(*(self.normalize(text, to_lang) for text in texts))
+
+    def close(self):
+        """Shut down the executor if it was created by this instance."""
+        if self._owns_executor:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+
+    async def aclose(self):
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+
+# Normalizers built in the workers of process executors passed in by the caller,
+# keyed by their pickled worker_config().
+_configured_worker_normalizers = {}
+
+
+def _process_in_configured_worker(config, text, to_lang):
+    normalizer = _configured_worker_normalizers.get(config)
+    if normalizer is None:
+        normalizer = _configured_worker_normalizers[config] = OrpheusTextNormalizer(**pickle.loads(config))
+    return normalizer.process_text(text, to_lang=to_lang)
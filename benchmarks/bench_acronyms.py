@@ -0,0 +1,91 @@
+"""
+Acronym stage cost as the lexicon grows: the per-word regex loop versus the
+single-scan AcronymLexicon, at 37, 1k and 50k entries.
+
+    python benchmarks/bench_acronyms.py [--repeat N]
+"""
+import argparse
+import os
+import random
+import re
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from acronym_lexicon import DEFAULT_ACRONYMS, AcronymLexicon
+
+TEXT = (
+    "SEBI's new circular asks every NBFC to verify PAN and AADHAAR details via UIDAI. "
+    "Shares of BHEL and GAIL rose while the NIFTY and SENSEX closed flat; "
+    "ISRO and HAL signed an MoU with NASSCOM members on Tuesday. "
+) * 4
+
+
+def synthetic_lexicon(size, seed=0):
+    rng = random.Random(seed)
+    words = list(dict.fromkeys(DEFAULT_ACRONYMS))
+    seen = set(words)
+    while len(words) < size:
+        word = "".join(rng.choices(string.ascii_uppercase, k=rng.randint(3, 8)))
+        if word not in seen:
+            seen.add(word)
+            words.append(word)
+    return words[:size]
+
+
+def compile_loop(words):
+    return [
+        (original, replacement, re.compile(rf"\b{re.escape(original)}\b"))
+        for word in words
+        for original, replacement in (
+            (f"{word}'s", f"{word.lower()}s"),
+            (f"{word}s", f"{word.lower()}s"),
+            (word, word.lower()),
+        )
+    ]
+
+
+def run_loop(patterns, text):
+    extracted = []
+    for original, replacement, pattern in patterns:
+        text, count = pattern.subn(replacement, text)
+        if count:
+            extracted.append((original, replacement))
+    return text, tuple(extracted)
+
+
+def timed(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--repeat", type=int, default=50)
+    arg_parser.add_argument("--sizes", nargs="+", type=int, default=[37, 1000, 50000])
+    args = arg_parser.parse_args()
+
+    print(f"{'entries':>8}{'build ms':>10}{'loop us':>12}{'trie us':>12}{'speedup':>10}")
+    for size in args.sizes:
+        words = synthetic_lexicon(size)
+
+        start = time.perf_counter()
+        lexicon = AcronymLexicon(words)
+        build = time.perf_counter() - start
+
+        patterns = compile_loop(words)
+        assert run_loop(patterns, TEXT) == lexicon.replace(TEXT)
+
+        # The loop is expensive at large sizes; keep its wall time bounded.
+        loop_repeat = max(1, args.repeat * 37 // size)
+        loop = timed(lambda: run_loop(patterns, TEXT), loop_repeat)
+        trie = timed(lambda: lexicon.replace(TEXT), args.repeat)
+        print(f"{size:>8}{build * 1e3:>10.1f}{loop * 1e6:>12.1f}{trie * 1e6:>12.1f}{loop / trie:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Time AsyncOrpheusTextNormalizer on each kind of executor and check its output.
+
+Runs the same mixed corpus through a thread executor, a process executor created
+by the normalizer, and a ProcessPoolExecutor passed in by the caller. Every response
+must equal process_text's. Exits 1 on any mismatch or exception.
+
+    python benchmarks/bench_async.py [--workers N] [--max-in-flight N] [--texts N]
+"""
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from async_normalizer import AsyncOrpheusTextNormalizer
+from bench_suite import GENERATORS, build_corpus
+from preprocesor import OrpheusTextNormalizer
+
+LANGS = ["en", "hi", "ta"]
+
+
+async def run(normalizer, pairs, warmup):
+    # The warmup round starts the workers; only the second round is timed.
+    await asyncio.gather(*(normalizer.normalize(text, to_lang) for text, to_lang in warmup))
+    start = time.perf_counter()
+    responses = await asyncio.gather(*(normalizer.normalize(text, to_lang) for text, to_lang in pairs))
+    return responses, time.perf_counter() - start
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--workers", type=int, default=2)
+    arg_parser.add_argument("--max-in-flight", type=int, default=16)
+    arg_parser.add_argument("--texts", type=int, default=4, help="texts per (entity type, language) cell")
+    args = arg_parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    pairs = [
+        (text, to_lang)
+        for entity_type in GENERATORS for to_lang in LANGS
+        for text in build_corpus(entity_type, to_lang, args.texts, seed=0)
+    ]
+    reference = [OrpheusTextNormalizer().process_text(*pair) for pair in pairs]
+    caller_pool = ProcessPoolExecutor(max_workers=args.workers)
+    setups = {
+        "thread": "thread",
+        "process": "process",
+        "caller process pool": caller_pool,
+    }
+
+    failures = []
+    print(f"{len(pairs)} texts")
+    print(f"{'executor':<22}{'seconds':>10}{'texts/s':>10}")
+    for label, executor in setups.items():
+        normalizer = AsyncOrpheusTextNormalizer(
+            executor=executor, max_workers=args.workers, max_in_flight=args.max_in_flight
+        )
+        try:
+            responses, seconds = asyncio.run(run(normalizer, pairs, pairs[: args.workers * 4]))
+        except Exception as e:
+            failures.append(f"{label}: {type(e).__name__}: {e}")
+            continue
+        finally:
+            normalizer.close()
+        if responses != reference:
+            failures.append(f"{label}: responses differ from process_text")
+        print(f"{label:<22}{seconds:>10.2f}{len(pairs) / seconds:>10.0f}")
+    caller_pool.shutdown()
+
+    for failure in failures:
+        print(failure)
+    print(f"{len(failures)} failures")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+"""
+process_batch throughput with 1, 2, 4 and 8 worker processes.
+
+The batch mixes repeated prompts with unique ones, so the numbers include the
+effect of in-batch deduplication.
+
+    python benchmarks/bench_batch.py [--size N] [--unique-ratio R]
+"""
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from preprocesor import OrpheusTextNormalizer
+
+TEMPLATES = [
+    "Your OTP is {n6}, valid till {h}:{m} pm.",
+    "₹{amount} debited on {d}/{mo}/2024 from A/C XX{n4}.",
+    "Call us at +91-{n5}-{n5b} for help with your PAN card.",
+    "Vehicle KA {n2} AB {n4} was registered on {d} March 2023.",
+    "Press 1 for balance enquiry. Press 9 to repeat this menu.",
+]
+
+
+def make_batch(size, unique_ratio, seed=0):
+    rng = random.Random(seed)
+    unique = []
+    for _ in range(max(1, int(size * unique_ratio))):
+        template = rng.choice(TEMPLATES)
+        unique.append(template.format(
+            n6=rng.randint(100000, 999999), n5=rng.randint(10000, 99999), n5b=rng.randint(10000, 99999),
+            n4=rng.randint(1000, 9999), n2=rng.randint(10, 99), h=rng.randint(1, 12), m=rng.randint(10, 59),
+            amount=f"{rng.randint(1, 99)},{rng.randint(100, 999)}", d=rng.randint(1, 28), mo=rng.randint(1, 12),
+        ))
+    return [rng.choice(unique) for _ in range(size)]
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--size", type=int, default=4000)
+    arg_parser.add_argument("--unique-ratio", type=float, default=0.5)
+    arg_parser.add_argument("--workers", nargs="+", type=int, default=[1, 2, 4, 8])
+    args = arg_parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    batch = make_batch(args.size, args.unique_ratio)
+    print(f"batch of {len(batch)} texts, {len(set(batch))} unique, {os.cpu_count()} CPUs")
+    print(f"{'workers':>8}{'texts/s':>12}{'speedup':>10}")
+
+    baseline = None
+    for workers in args.workers:
+        with OrpheusTextNormalizer() as normalizer:
+            # Warm up: start the pool and build each worker's normalizer outside the timing.
+            normalizer.process_batch(batch[: workers * 8], workers=workers)
+            start = time.perf_counter()
+            normalizer.process_batch(batch, workers=workers)
+            elapsed = time.perf_counter() - start
+        throughput = len(batch) / elapsed
+        baseline = baseline or throughput
+        print(f"{workers:>8}{throughput:>12.0f}{throughput / baseline:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
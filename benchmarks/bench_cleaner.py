@@ -0,0 +1,48 @@
+"""
+OrpheusTextCleaner versus CompiledOrpheusTextCleaner on long Indic and English
+paragraphs.
+
+    python benchmarks/bench_cleaner.py [--repeat N]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from preprocesor import CompiledOrpheusTextCleaner, OrpheusTextCleaner
+
+PARAGRAPHS = {
+    "hi": "भारतीय रिज़र्व बैंक ने आज रेपो दर में कोई बदलाव नहीं किया; गवर्नर ने कहा कि महंगाई “नियंत्रण” में है। ",
+    "ta": "இந்திய ரிசர்வ் வங்கி இன்று ரெப்போ விகிதத்தில் எந்த மாற்றமும் செய்யவில்லை — ஆளுநர் தெரிவித்தார். ",
+    "bn": "ভারতীয় রিজার্ভ ব্যাংক আজ রেপো হারে কোনো পরিবর্তন করেনি: গভর্নর বলেছেন মূল্যস্ফীতি নিয়ন্ত্রণে আছে। ",
+    "en": "The Reserve Bank left the repo rate unchanged today; the governor said inflation is 'under control'. ",
+}
+
+
+def timed(cleaner, text, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        cleaner(text)
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--repeat", type=int, default=50)
+    arg_parser.add_argument("--copies", type=int, default=40)
+    args = arg_parser.parse_args()
+
+    reference, compiled = OrpheusTextCleaner(), CompiledOrpheusTextCleaner()
+    print(f"{'lang':<6}{'chars':>8}{'reference us':>14}{'compiled us':>14}{'speedup':>10}")
+    for lang, sentence in PARAGRAPHS.items():
+        text = sentence * args.copies
+        assert reference(text) == compiled(text)
+        ref_time = timed(reference, text, args.repeat)
+        fast_time = timed(compiled, text, args.repeat)
+        print(f"{lang:<6}{len(text):>8}{ref_time * 1e6:>14.1f}{fast_time * 1e6:>14.1f}{ref_time / fast_time:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Peak memory of bulk_normalize on plain-text dumps of growing size whose lines are
+whole documents: reading each line into memory (--plain) versus walking a
+memory-mapped file in windows (--mmap). Each run is a fresh process. Checks that
+both write the same normalized text.
+
+    python benchmarks/bench_corpus.py [--sizes 0.5,1,2] [--documents 2] [--window 65536] [--modes plain,mmap]
+"""
+import argparse
+import json
+import logging
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_suite import GENERATORS, LANG_PHRASES, build_corpus
+
+PROSE = [
+    "The committee reviewed the proposal in detail and asked for a revised draft.",
+    "Most of the discussion was about the schedule and who would own each part.",
+    "Nobody expected the weather to change so quickly over the hills.",
+    "She read the letter twice before putting it back in the drawer.",
+]
+
+
+def write_dump(path, size, documents, lang, seed=0):
+    """Write about size bytes of text as the given number of newline-separated documents."""
+    rng = random.Random(seed)
+    entities = [text for entity_type in GENERATORS for text in build_corpus(entity_type, lang, 50, seed)]
+    per_document = size // documents
+    with open(path, "w", encoding="utf-8") as dump:
+        for _ in range(documents):
+            written = 0
+            while written < per_document:
+                sentence = rng.choice(entities) if rng.random() < 0.2 else rng.choice(PROSE)
+                dump.write(sentence)
+                dump.write(" ")
+                written += len(sentence.encode("utf-8")) + 1
+            dump.write("\n")
+
+
+def child(mode, path, output, window, lang):
+    import bulk_normalize
+
+    args = [path, "-o", output, "--lang", lang, "--quiet"]
+    args += ["--mmap", "--window", str(window)] if mode == "mmap" else ["--plain"]
+    start = time.perf_counter()
+    bulk_normalize.main(args)
+    seconds = time.perf_counter() - start
+    print(json.dumps({"seconds": seconds, "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}))
+
+
+def run(mode, path, output, window, lang):
+    result = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child", mode, path, output, "--window", str(window), "--lang", lang],
+        check=True, capture_output=True, text=True,
+    )
+    return json.loads(result.stdout)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--sizes", default="0.5,1,2", help="dump sizes in MB")
+    arg_parser.add_argument("--documents", type=int, default=2, help="documents (lines) per dump")
+    arg_parser.add_argument("--window", type=int, default=1 << 16)
+    arg_parser.add_argument("--modes", default="plain,mmap", help="--plain slows down sharply on long lines")
+    arg_parser.add_argument("--lang", default="en", choices=sorted(LANG_PHRASES))
+    arg_parser.add_argument("--child", nargs=3, metavar=("MODE", "INPUT", "OUTPUT"), help=argparse.SUPPRESS)
+    args = arg_parser.parse_args()
+    logging.disable(logging.CRITICAL)
+    if args.child:
+        child(*args.child, args.window, args.lang)
+        return
+
+    modes = args.modes.split(",")
+    print(f"{'input MB':>9}{'mode':>7}{'peak RSS MB':>13}{'MB/s':>8}")
+    with tempfile.TemporaryDirectory() as directory:
+        dump = os.path.join(directory, "dump.txt")
+        outputs = {"plain": os.path.join(directory, "plain.jsonl"), "mmap": os.path.join(directory, "mmap.txt")}
+        for size in (float(size) for size in args.sizes.split(",")):
+            write_dump(dump, int(size * 1e6), args.documents, args.lang)
+            input_mb = os.path.getsize(dump) / 1e6
+            for mode in modes:
+                result = run(mode, dump, outputs[mode], args.window, args.lang)
+                print(f"{input_mb:>9.1f}{mode:>7}{result['peak_rss_kb'] / 1024:>13.1f}{input_mb / result['seconds']:>8.2f}")
+            if len(modes) == 2:
+                with open(outputs["plain"], encoding="utf-8") as plain, open(outputs["mmap"], encoding="utf-8") as mapped:
+                    assert [json.loads(line)["formatted_text"] for line in plain] == mapped.read().splitlines()
+
+
+if __name__ == "__main__":
+    main()
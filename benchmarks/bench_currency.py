@@ -0,0 +1,85 @@
+"""
+Currency lookup cost on finance-heavy text: the linear symbol scan plus a Babel
+name lookup per amount versus the indexed CurrencyTable.
+
+    python benchmarks/bench_currency.py [--repeat N]
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from babel import numbers
+
+from currency_table import load_currency_table
+from preprocesor import CURRENCY_PATTERN, LEADING_WHITESPACE_PATTERN, OrpheusTextNormalizer
+
+PARAGRAPH = (
+    "Q3 revenue rose to $4.2M from $3.1M, while EUR 850k of bonds matured and "
+    "GBP 1.2 million was repaid. The Tokyo unit booked ¥300 JPY in fees, Sydney "
+    "reported A$ 75k, and the India desk closed at ₹12 crore against Rs. 9.5 lakh "
+    "last year. Dividends of $1, €2.50 and £0.75 per share were declared; CAD 40 "
+    "and AUD 1,250 settled on Friday. "
+)
+
+
+def linear_lookup(mapping, core_match, amount):
+    currency = next((cur for cur in mapping if cur in core_match), None)
+    if currency is None:
+        return None
+    code = mapping[currency]
+    try:
+        return numbers.get_currency_name(code, count=amount, locale="en_US")
+    except Exception:
+        return code.lower()
+
+
+def indexed_lookup(table, core_match, amount):
+    currency = table.find(core_match)
+    if currency is None:
+        return None
+    return table.spoken_name(table.mapping[currency], amount)
+
+
+def timed(function, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--repeat", type=int, default=200)
+    arg_parser.add_argument("--copies", type=int, default=10)
+    args = arg_parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    table = load_currency_table()
+    text = PARAGRAPH * args.copies
+    core_matches = [
+        match.group(0)[len(LEADING_WHITESPACE_PATTERN.match(match.group(0)).group(0)):]
+        for match in CURRENCY_PATTERN.finditer(text)
+    ]
+    assert [linear_lookup(table.mapping, core, 2.0) for core in core_matches] == [
+        indexed_lookup(table, core, 2.0) for core in core_matches
+    ]
+
+    linear = timed(lambda: [linear_lookup(table.mapping, core, 2.0) for core in core_matches], args.repeat)
+    indexed = timed(lambda: [indexed_lookup(table, core, 2.0) for core in core_matches], args.repeat)
+
+    normalizer = OrpheusTextNormalizer()
+    stage = timed(lambda: normalizer._process_currency_entities(text, "en"), max(1, args.repeat // 10))
+
+    print(f"{len(core_matches)} currency matches in {len(text)} chars")
+    print(f"{'lookup':<12}{'per text us':>18}{'per match us':>14}")
+    for name, seconds in (("linear", linear), ("indexed", indexed)):
+        print(f"{name:<12}{seconds * 1e6:>18.1f}{seconds * 1e6 / len(core_matches):>14.2f}")
+    print(f"speedup {linear / indexed:.1f}x; full currency stage {stage * 1e3:.2f} ms per text")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Date stage on a seeded corpus of DATE_PATTERN matches: dateutil versus the fast
+parser per date, and _process_dates with a cold and a warm DATE_WORDS_CACHE.
+Checks that the fast parser reads every date it handles as dateutil does.
+
+    python benchmarks/bench_dates.py [--dates N] [--lang en]
+"""
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import preprocesor
+from preprocesor import DATE_PATTERN, DATE_WORDS_CACHE, OrpheusTextNormalizer
+
+MONTHS = ["Jan", "January", "Feb", "March", "Apr", "May", "June", "Jul", "August", "Sep", "October", "Nov", "December"]
+
+
+def dates(count, seed=0):
+    rng = random.Random(seed)
+    shapes = [
+        lambda: f"{rng.randint(1, 28):02d}/{rng.randint(1, 12):02d}/{rng.randint(1990, 2030)}",
+        lambda: f"{rng.randint(1, 28)}-{rng.randint(1, 12)}-{rng.randint(1990, 2030)}",
+        lambda: f"{rng.randint(1990, 2030)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+        lambda: f"{rng.choice(MONTHS)} {rng.randint(1, 28)}, {rng.randint(1990, 2030)}",
+        lambda: f"{rng.randint(1, 28)}{rng.choice(['', 'th'])} {rng.choice(MONTHS)} {rng.randint(1990, 2030)}",
+        lambda: f"{rng.randint(1, 28)} {rng.choice(MONTHS)}",
+    ]
+    return [rng.choice(shapes)() for _ in range(count)]
+
+
+def dateutil_parse(original):
+    from dateutil import parser
+
+    if preprocesor.YEAR_FIRST_DATE_PATTERN.fullmatch(original) and "-" in original:
+        return datetime.strptime(original, "%Y-%m-%d")
+    return parser.parse(original, dayfirst=True)
+
+
+def per_call(function, values):
+    start = time.perf_counter()
+    for value in values:
+        function(value)
+    return (time.perf_counter() - start) / len(values)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--dates", type=int, default=5000)
+    arg_parser.add_argument("--lang", default="en")
+    args = arg_parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    corpus = dates(args.dates)
+    assert all(DATE_PATTERN.fullmatch(original) for original in corpus)
+    parse_date = OrpheusTextNormalizer._parse_date
+    fast = [original for original in corpus if parse_date(original) is not None]
+    mismatches = sum(parse_date(original) != dateutil_parse(original) for original in fast)
+    print(f"{len(corpus)} dates, {len(fast) / len(corpus):.1%} read by the fast parser, {mismatches} mismatches")
+
+    normalizer = OrpheusTextNormalizer()
+    texts = [f"The payment is due on {original}." for original in corpus]
+    slow = per_call(dateutil_parse, corpus)
+    quick = per_call(parse_date, corpus)
+
+    def cold(text):
+        DATE_WORDS_CACHE.clear()
+        normalizer._process_dates(text, args.lang)
+
+    cold_seconds = per_call(cold, texts)
+    recurring = texts[:1000]
+    DATE_WORDS_CACHE.clear()
+    for text in recurring:
+        normalizer._process_dates(text, args.lang)
+    warm_seconds = per_call(lambda text: normalizer._process_dates(text, args.lang), recurring * 5)
+
+    print(f"{'step':<26}{'us/date':>10}")
+    print(f"{'dateutil parse':<26}{slow * 1e6:>10.1f}")
+    print(f"{'fast parse':<26}{quick * 1e6:>10.1f}")
+    print(f"{'_process_dates, cold memo':<26}{cold_seconds * 1e6:>10.1f}")
+    print(f"{'_process_dates, warm memo':<26}{warm_seconds * 1e6:>10.1f}")
+    print(f"parse speedup {slow / quick:.1f}x, stage speedup with a warm memo {cold_seconds / warm_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
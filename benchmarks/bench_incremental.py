@@ -0,0 +1,84 @@
+"""
+Normalizing a simulated LLM token stream: re-running process_text on the whole
+buffer after every token versus an incremental normalizer that commits settled
+sentences. Reports time per response, characters normalized per input character and
+how far the committed output lags behind the stream, and checks both end with the
+same text.
+
+    python benchmarks/bench_incremental.py [--responses N] [--sentences N] [--lang en]
+"""
+import argparse
+import logging
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_suite import GENERATORS, build_corpus
+from preprocesor import OrpheusTextNormalizer
+
+# Roughly LLM-sized tokens: a few characters, carrying the whitespace before them.
+TOKEN_PATTERN = re.compile(r"\s*\S{1,4}")
+
+
+def responses(count, sentences, lang, seed=0):
+    rng = random.Random(seed)
+    pool = [text for entity_type in GENERATORS for text in build_corpus(entity_type, lang, 20, seed)]
+    return [" ".join(rng.choices(pool, k=sentences)) for _ in range(count)]
+
+
+def rebuffer(normalizer, tokens, lang):
+    buffer = ""
+    normalized = 0
+    for token in tokens:
+        buffer += token
+        formatted = normalizer.process_text(buffer, lang).formatted_text
+        normalized += len(buffer)
+    return formatted, normalized, 0
+
+
+def incremental(normalizer, tokens, lang):
+    stream = normalizer.open_stream(lang)
+    chunks = []
+    normalized = lag = 0
+    for token in tokens:
+        fed = len(stream.pending) + len(token)
+        chunks += stream.feed(token)
+        normalized += fed - len(stream.pending)
+        lag += len(stream.pending)
+    normalized += len(stream.pending)
+    chunks += stream.flush()
+    return " ".join(response.formatted_text for response in chunks), normalized, lag / len(tokens)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--responses", type=int, default=20)
+    arg_parser.add_argument("--sentences", type=int, default=8, help="sentences per response")
+    arg_parser.add_argument("--lang", default="en")
+    args = arg_parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    normalizer = OrpheusTextNormalizer()
+    streams = [TOKEN_PATTERN.findall(text) for text in responses(args.responses, args.sentences, args.lang)]
+    characters = sum(len(token) for tokens in streams for token in tokens)
+    print(f"{args.responses} responses, {characters // args.responses} characters and "
+          f"{sum(map(len, streams)) // args.responses} tokens each")
+    print(f"{'mode':<14}{'ms/response':>13}{'chars normalized':>18}{'pending chars':>15}")
+    results = {}
+    for name, run in (("rebuffer", rebuffer), ("incremental", incremental)):
+        start = time.perf_counter()
+        outputs = [run(normalizer, tokens, args.lang) for tokens in streams]
+        seconds = time.perf_counter() - start
+        results[name] = [formatted for formatted, _, _ in outputs]
+        normalized = sum(count for _, count, _ in outputs) / characters
+        lag = sum(pending for _, _, pending in outputs) / len(outputs)
+        print(f"{name:<14}{seconds / args.responses * 1e3:>13.1f}{normalized:>17.1f}x{lag:>15.0f}")
+    assert results["rebuffer"] == results["incremental"]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Lean mode versus process_text on plain prose and on entity-heavy text: latency per
+call and peak memory allocated per call (via tracemalloc) for the pydantic response,
+process_text_lean with entities and process_text_lean without them.
+
+    python benchmarks/bench_lean.py [--repeat N]
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from preprocesor import OrpheusTextNormalizer
+
+CORPORA = {
+    "prose": [
+        ("en", "The committee met in the afternoon and agreed to revisit the proposal next week."),
+        ("en", "Please hold while we connect you to the next available representative."),
+        ("hi", "कृपया लाइन पर बने रहें, आपकी कॉल हमारे लिए महत्वपूर्ण है।"),
+    ],
+    "entities": [
+        ("en", "The meeting is on 15th March 2024 at 2:30 PM. Call me at +91-98765-43210."),
+        ("en", "₹50,000 debited on 12/05/2023 from A/C XX1234. Avl bal Rs. 1,23,456.78."),
+        ("en", "USD 1.5M was transferred to SEBI's account on 2023-11-04 for 3 GB of data."),
+        ("hi", "आपका ऑर्डर 15 मार्च को ₹2,499 में 3:45 PM तक पहुंचेगा।"),
+    ],
+}
+
+
+def timed(call, texts, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for to_lang, text in texts:
+            call(text, to_lang)
+    return (time.perf_counter() - start) / (repeat * len(texts))
+
+
+def allocated(call, texts, repeat):
+    """Mean peak traced memory per call above what was live before it."""
+    tracemalloc.start()
+    total = 0
+    for _ in range(repeat):
+        for to_lang, text in texts:
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            call(text, to_lang)
+            total += tracemalloc.get_traced_memory()[1] - before
+    tracemalloc.stop()
+    return total / (repeat * len(texts))
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--repeat", type=int, default=500)
+    args = arg_parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    normalizer = OrpheusTextNormalizer()
+    modes = [
+        ("process_text", normalizer.process_text),
+        ("lean + entities", lambda text, to_lang: normalizer.process_text_lean(text, to_lang, entities=True)),
+        ("lean", normalizer.process_text_lean),
+    ]
+    print(f"{'corpus':<10}{'mode':<18}{'us/call':>10}{'speedup':>9}{'peak B/call':>13}")
+    for corpus, texts in CORPORA.items():
+        for to_lang, text in texts:
+            reference = normalizer.process_text(text, to_lang)
+            assert normalizer.process_text_lean(text, to_lang).formatted_text == reference.formatted_text
+            assert normalizer.process_text_lean(text, to_lang, entities=True).to_response() == reference
+        baseline = None
+        for name, call in modes:
+            seconds = timed(call, texts, args.repeat)
+            peak = allocated(call, texts, max(args.repeat // 10, 1))
+            baseline = baseline or seconds
+            print(f"{corpus:<10}{name:<18}{seconds * 1e6:>10.1f}{baseline / seconds:>8.2f}x{peak:>13.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Per-call overhead of process_text on short IVR-style prompts.
+
+Compares the warm path (compiled plan reused across calls) against a cold path
+that drops the cached plan and re's internal cache before every call, which is
+what every request used to pay.
+
+    python benchmarks/bench_plan.py [--repeat N]
+"""
+import argparse
+import logging
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from preprocesor import OrpheusTextNormalizer
+
+IVR_PROMPTS = [
+    "Press 1 for balance enquiry.",
+    "Your OTP is 482913.",
+    "Thank you for calling SBI.",
+    "Please hold, your call is important to us.",
+    "Your PAN is linked to AADHAAR.",
+    "Call us at 1800-425-3800.",
+    "Your EMI of ₹2,500 is due.",
+    "Press 9 to repeat this menu.",
+]
+
+
+def run(normalizer, prompts, to_lang, repeat, cold):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for prompt in prompts:
+            if cold:
+                normalizer._plans.clear()
+                re.purge()
+            normalizer.process_text(prompt, to_lang=to_lang)
+    elapsed = time.perf_counter() - start
+    return elapsed / (repeat * len(prompts))
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--repeat", type=int, default=200)
+    arg_parser.add_argument("--langs", nargs="+", default=["en", "hi"])
+    args = arg_parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    normalizer = OrpheusTextNormalizer()
+
+    print(f"{'lang':<6}{'cold us/call':>14}{'warm us/call':>14}{'speedup':>10}")
+    for to_lang in args.langs:
+        run(normalizer, IVR_PROMPTS, to_lang, 5, cold=False)
+        cold = run(normalizer, IVR_PROMPTS, to_lang, args.repeat, cold=True)
+        warm = run(normalizer, IVR_PROMPTS, to_lang, args.repeat, cold=False)
+        print(f"{to_lang:<6}{cold * 1e6:>14.1f}{warm * 1e6:>14.1f}{cold / warm:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
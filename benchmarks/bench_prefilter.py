@@ -0,0 +1,72 @@
+"""
+Stage prefilters on plain English prose, Indic-only prose and entity-heavy text:
+process_text with prefilter=False versus prefilter=True, plus how often each
+stage was skipped.
+
+    python benchmarks/bench_prefilter.py [--repeat N]
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from preprocesor import OrpheusTextNormalizer
+
+CORPORA = {
+    "en prose": ("en", [
+        "The committee met in the afternoon and agreed to revisit the proposal next week.",
+        "She walked along the river, listening to the birds and thinking about the letter.",
+        "Please hold while we connect you to the next available representative.",
+    ]),
+    "hi prose": ("hi", [
+        "भारतीय रिज़र्व बैंक ने आज रेपो दर में कोई बदलाव नहीं किया।",
+        "कृपया लाइन पर बने रहें, आपकी कॉल हमारे लिए महत्वपूर्ण है।",
+        "मौसम विभाग ने अगले दो दिनों में भारी बारिश की चेतावनी दी है।",
+    ]),
+    "ta prose": ("ta", [
+        "இந்திய ரிசர்வ் வங்கி இன்று ரெப்போ விகிதத்தில் எந்த மாற்றமும் செய்யவில்லை.",
+        "தயவுசெய்து காத்திருக்கவும், உங்கள் அழைப்பு எங்களுக்கு முக்கியமானது.",
+    ]),
+    "en entities": ("en", [
+        "The meeting is on 15th March 2024 at 2:30 PM. Call me at +91-98765-43210.",
+        "₹50,000 debited on 12/05/2023 from A/C XX1234.",
+        "USD 1.5M was transferred to SEBI's account on 2023-11-04.",
+    ]),
+}
+
+
+def timed(normalizer, texts, to_lang, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            normalizer.process_text(text, to_lang)
+    return (time.perf_counter() - start) / (repeat * len(texts))
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--repeat", type=int, default=500)
+    args = arg_parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    print(f"{'corpus':<14}{'off us':>9}{'on us':>9}{'speedup':>9}{'stages skipped':>16}")
+    for name, (to_lang, texts) in CORPORA.items():
+        unfiltered = OrpheusTextNormalizer(prefilter=False)
+        filtered = OrpheusTextNormalizer(prefilter=True)
+        assert [unfiltered.process_text(text, to_lang) for text in texts] == [
+            filtered.process_text(text, to_lang) for text in texts
+        ]
+        off = timed(unfiltered, texts, to_lang, args.repeat)
+        filtered.reset_prefilter_stats()
+        on = timed(filtered, texts, to_lang, args.repeat)
+        stats = filtered.prefilter_stats().values()
+        skipped = sum(stage["skipped"] for stage in stats)
+        total = skipped + sum(stage["runs"] for stage in stats)
+        print(f"{name:<14}{off * 1e6:>9.1f}{on * 1e6:>9.1f}{off / on:>8.1f}x{skipped / total:>15.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Pre-fork workers as a gunicorn-style server starts them: per-worker unique memory
+(USS, pages no other process maps) and time to the first request, for four ways of
+preparing the parent before it forks:
+
+    lazy            each worker imports and builds its own normalizer
+    preload         the parent builds the normalizer; workers share it
+    warmup          the parent also calls warmup()
+    warmup+freeze   gc is disabled in the parent, warmup(freeze=True) freezes it,
+                    and workers turn gc back on
+
+Memory is measured after each worker has served its requests and run one full
+collection. Each mode runs in a fresh parent process. Linux only (fork and /proc).
+
+    python benchmarks/bench_prefork.py [--workers N] [--requests N]
+"""
+import argparse
+import gc
+import json
+import logging
+import os
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_suite import GENERATORS, build_corpus
+
+MODES = ["lazy", "preload", "warmup", "warmup+freeze"]
+LANGS = ["hi", "en", "ta", "bn", "mr", "te"]
+
+
+def memory_kb():
+    """(unique, resident) kB of this process, from /proc/self/smaps_rollup."""
+    fields = {}
+    with open("/proc/self/smaps_rollup") as rollup:
+        for line in rollup:
+            name, _, value = line.partition(":")
+            if value.strip().endswith("kB"):
+                fields[name] = int(value.split()[0])
+    return fields["Private_Clean"] + fields["Private_Dirty"], fields["Rss"]
+
+
+def requests(count):
+    texts = [
+        (text, to_lang)
+        for to_lang in LANGS for entity_type in GENERATORS
+        for text in build_corpus(entity_type, to_lang, 4, 0)
+    ]
+    # The first round has one request per language, as a fresh worker's first callers might.
+    first_round = [texts[index * len(texts) // len(LANGS)] for index in range(len(LANGS))]
+    return first_round + (texts * (count // len(texts) + 1))[:count]
+
+
+def serve(normalizer, workload, write_fd, mode):
+    start = time.perf_counter()
+    if mode == "warmup+freeze":
+        gc.enable()
+    if normalizer is None:
+        from preprocesor import OrpheusTextNormalizer
+
+        normalizer = OrpheusTextNormalizer()
+    normalizer.process_text(*workload[0])
+    first = time.perf_counter() - start
+    for text, to_lang in workload[1:len(LANGS)]:
+        normalizer.process_text(text, to_lang)
+    first_round = time.perf_counter() - start
+    for text, to_lang in workload[len(LANGS):]:
+        normalizer.process_text(text, to_lang)
+    # A long-running worker eventually runs a full collection, which walks every object
+    # it can see, including the ones it inherited, unless they were frozen.
+    gc.collect()
+    unique, resident = memory_kb()
+    result = {"first": first, "first_round": first_round, "unique_kb": unique, "rss_kb": resident}
+    os.write(write_fd, (json.dumps(result) + "\n").encode())
+
+
+def parent(mode, workers, count):
+    if mode == "warmup+freeze":
+        gc.disable()
+    workload = requests(count)
+    normalizer = None
+    if mode != "lazy":
+        from preprocesor import OrpheusTextNormalizer
+
+        normalizer = OrpheusTextNormalizer()
+        if mode != "preload":
+            normalizer.warmup(freeze=mode == "warmup+freeze")
+
+    read_fd, write_fd = os.pipe()
+    pids = []
+    for _ in range(workers):
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            try:
+                logging.disable(logging.CRITICAL)
+                serve(normalizer, workload, write_fd, mode)
+            finally:
+                os._exit(0)
+        pids.append(pid)
+    os.close(write_fd)
+    with os.fdopen(read_fd) as results:
+        lines = results.read().splitlines()
+    for pid in pids:
+        os.waitpid(pid, 0)
+    print(json.dumps([json.loads(line) for line in lines]))
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--workers", type=int, default=4)
+    arg_parser.add_argument("--requests", type=int, default=300, help="requests per worker after the first round")
+    arg_parser.add_argument("--parent", choices=MODES, help=argparse.SUPPRESS)
+    args = arg_parser.parse_args()
+    logging.disable(logging.CRITICAL)
+    if args.parent:
+        parent(args.parent, args.workers, args.requests)
+        return
+
+    print(f"{args.workers} workers, {len(LANGS)} languages, {args.requests} requests per worker")
+    print(f"{'mode':<15}{'first ms':>10}{'first round ms':>16}{'USS MB':>9}{'RSS MB':>9}")
+    for mode in MODES:
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--parent", mode,
+             "--workers", str(args.workers), "--requests", str(args.requests)],
+            check=True, capture_output=True, text=True,
+        ).stdout
+        results = json.loads(output)
+        assert len(results) == args.workers
+
+        def mean(key):
+            return sum(result[key] for result in results) / len(results)
+
+        print(
+            f"{mode:<15}{mean('first') * 1e3:>10.1f}{mean('first_round') * 1e3:>16.1f}"
+            f"{mean('unique_kb') / 1024:>9.1f}{mean('rss_kb') / 1024:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Whole-response cache on a repeated-prompt workload (IVR menus, templated
+notifications): no cache, in-process LRU only, shared SQLite store only, and both tiers.
+
+    python benchmarks/bench_response_cache.py [--requests N] [--distinct N]
+"""
+import argparse
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from preprocesor import OrpheusTextNormalizer
+from response_cache import SQLiteResponseStore, TieredResponseCache
+
+TEMPLATES = [
+    "Your EMI of ₹{amount:,} is due on {day:02d}/{month:02d}/2024. Press 1 to pay now.",
+    "Your OTP is {code}, valid till {hour}:{minute:02d} pm.",
+    "Order {code} worth Rs. {amount} will arrive on {day}th March.",
+    "For account balance press 1, for last {day} transactions press 2, to talk to an agent call 1800-{code}.",
+]
+
+
+def workload(requests, distinct, seed=0):
+    """requests prompts drawn with a Zipf-like skew from distinct templated prompts."""
+    rng = random.Random(seed)
+    prompts = [
+        rng.choice(TEMPLATES).format(
+            amount=rng.randint(100, 99999), day=rng.randint(1, 28), month=rng.randint(1, 12),
+            code=rng.randint(100000, 999999), hour=rng.randint(1, 12), minute=rng.randint(0, 59),
+        )
+        for _ in range(distinct)
+    ]
+    weights = [1 / (rank + 1) for rank in range(distinct)]
+    return rng.choices(prompts, weights=weights, k=requests)
+
+
+def timed(normalizer, texts, to_lang):
+    start = time.perf_counter()
+    for text in texts:
+        normalizer.process_text(text, to_lang)
+    return time.perf_counter() - start
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--requests", type=int, default=5000)
+    arg_parser.add_argument("--distinct", type=int, default=500)
+    arg_parser.add_argument("--memory-size", type=int, default=256)
+    arg_parser.add_argument("--lang", default="en")
+    args = arg_parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    texts = workload(args.requests, args.distinct)
+    with tempfile.TemporaryDirectory() as directory:
+        configs = [
+            ("no cache", None),
+            ("memory LRU", TieredResponseCache(maxsize=args.memory_size)),
+            ("SQLite only", TieredResponseCache(maxsize=0, store=SQLiteResponseStore(os.path.join(directory, "a.db")))),
+            ("LRU + SQLite", TieredResponseCache(
+                maxsize=args.memory_size, store=SQLiteResponseStore(os.path.join(directory, "b.db"))
+            )),
+        ]
+        print(f"{args.requests} requests over {args.distinct} distinct prompts")
+        print(f"{'cache':<14}{'req/s':>10}{'us/req':>10}{'hit rate':>10}")
+        for name, cache in configs:
+            normalizer = OrpheusTextNormalizer(response_cache=cache)
+            seconds = timed(normalizer, texts, args.lang)
+            hit_rate = f"{cache.stats()['hit_rate']:.1%}" if cache is not None else "-"
+            print(f"{name:<14}{len(texts) / seconds:>10.0f}{seconds / len(texts) * 1e6:>10.1f}{hit_rate:>10}")
+            if cache is not None and cache.store is not None:
+                cache.store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+Load generator for normalize_server: keep-alive clients at several concurrency
+levels against a server started per batching policy (or an already running one with
+--url / --unix). Reports throughput, client-side latency percentiles and the server's
+mean batch size and deduplicated requests. Checks every response against process_text.
+Runs offline.
+
+    python benchmarks/bench_server.py [--concurrency 1,8,64] [--batch-sizes 1,32] [--workers 2]
+    python benchmarks/bench_server.py --url http://127.0.0.1:8040
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import subprocess
+import sys
+import time
+from urllib.parse import urlsplit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bench_suite import GENERATORS, build_corpus
+from preprocesor import OrpheusTextNormalizer
+
+LANGS = ["en", "hi", "ta"]
+
+
+def payloads(count, repeat_rate, seed=0):
+    """(text, lang) requests; repeat_rate of them come from a small set of hot payloads."""
+    rng = random.Random(seed)
+    texts = [
+        (text, lang)
+        for lang in LANGS for entity_type in GENERATORS
+        for text in build_corpus(entity_type, lang, 20, seed)
+    ]
+    hot = texts[:: len(texts) // 10]
+    return [rng.choice(hot) if rng.random() < repeat_rate else rng.choice(texts) for _ in range(count)]
+
+
+class Client:
+    """One keep-alive HTTP/1.1 connection."""
+
+    def __init__(self, target):
+        self.target = target
+
+    async def __aenter__(self):
+        if self.target.startswith("unix:"):
+            self.reader, self.writer = await asyncio.open_unix_connection(self.target[len("unix:"):])
+        else:
+            address = urlsplit(self.target)
+            self.reader, self.writer = await asyncio.open_connection(address.hostname, address.port)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.writer.close()
+
+    async def request(self, method, path, payload=None):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8") if payload is not None else b""
+        self.writer.write(
+            f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body
+        )
+        status = int((await self.reader.readline()).split()[1])
+        length = 0
+        while (line := await self.reader.readline()) not in (b"\r\n", b""):
+            name, _, value = line.decode("latin-1").partition(":")
+            if name.lower() == "content-length":
+                length = int(value)
+        return status, json.loads(await self.reader.readexactly(length))
+
+
+async def load(target, requests, concurrency):
+    latencies, responses = [], {}
+
+    async def worker(share):
+        async with Client(target) as client:
+            for text, lang in share:
+                start = time.perf_counter()
+                status, response = await client.request("POST", "/normalize", {"text": text, "lang": lang})
+                latencies.append(time.perf_counter() - start)
+                assert status == 200, response
+                responses[(text, lang)] = response["formatted_text"]
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(requests[index::concurrency]) for index in range(concurrency)))
+    seconds = time.perf_counter() - start
+    async with Client(target) as client:
+        _, health = await client.request("GET", "/health")
+    return seconds, sorted(latencies), responses, health
+
+
+def start_server(workers, max_batch_size, max_wait_ms):
+    server = subprocess.Popen(
+        [sys.executable, "-m", "normalize_server", "--port", "0", "--workers", str(workers), "--langs", ",".join(LANGS),
+         "--max-batch-size", str(max_batch_size), "--max-wait-ms", str(max_wait_ms)],
+        cwd=ROOT, stderr=subprocess.PIPE, text=True,
+    )
+    for line in server.stderr:
+        if line.startswith("listening on "):
+            return server, line.split()[-1]
+    raise RuntimeError("normalize_server exited before listening")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--requests", type=int, default=2000)
+    arg_parser.add_argument("--concurrency", default="1,8,64")
+    arg_parser.add_argument("--batch-sizes", default="1,32", help="--max-batch-size of each server started")
+    arg_parser.add_argument("--max-wait-ms", type=float, default=2.0)
+    arg_parser.add_argument("--workers", type=int, default=2)
+    arg_parser.add_argument("--repeat-rate", type=float, default=0.2, help="share of requests repeating a hot payload")
+    arg_parser.add_argument("--url", help="benchmark a running server at this URL instead of starting one")
+    arg_parser.add_argument("--unix", help="benchmark a running server on this Unix socket")
+    args = arg_parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    requests = payloads(args.requests, args.repeat_rate)
+    normalizer = OrpheusTextNormalizer()
+    expected = {pair: normalizer.process_text(*pair).formatted_text for pair in set(requests)}
+    running = args.url or (args.unix and f"unix:{args.unix}")
+    policies = [None] if running else [int(size) for size in args.batch_sizes.split(",")]
+
+    workers = asyncio.run(load(running, [], 1))[3]["workers"] if running else args.workers
+    print(f"{args.requests} requests, {len(expected)} distinct, {workers} workers")
+    print(f"{'batch':>6}{'conc':>6}{'req/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'mean batch':>12}{'deduped':>9}")
+    for max_batch_size in policies:
+        server = None
+        target = running
+        if max_batch_size is not None:
+            server, target = start_server(args.workers, max_batch_size, args.max_wait_ms)
+        try:
+            for concurrency in (int(level) for level in args.concurrency.split(",")):
+                before = asyncio.run(load(target, [], 1))[3]
+                seconds, latencies, responses, health = asyncio.run(load(target, requests, concurrency))
+                assert responses == {pair: expected[pair] for pair in responses}
+                batches = health["batches"] - before["batches"]
+                batched = health["requests"] - before["requests"]
+                deduplicated = health["deduplicated"] - before["deduplicated"]
+
+                def percentile(p):
+                    return latencies[min(len(latencies) - 1, int(len(latencies) * p / 100))] * 1e3
+
+                print(
+                    f"{max_batch_size or '-':>6}{concurrency:>6}{len(requests) / seconds:>9.0f}{percentile(50):>9.2f}"
+                    f"{percentile(95):>9.2f}{percentile(99):>9.2f}{batched / max(batches, 1):>12.1f}{deduplicated:>9}"
+                )
+        finally:
+            if server is not None:
+                server.terminate()
+                server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Cold-start cost: module import, normalizer construction, currency table load and
+first-request latency, each measured in a fresh interpreter.
+
+    python benchmarks/bench_startup.py [--runs N]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = r"""
+import json, sys, time
+start = time.perf_counter()
+import preprocesor
+imported = time.perf_counter()
+normalizer = preprocesor.OrpheusTextNormalizer()
+constructed = time.perf_counter()
+normalizer.process_text(sys.argv[1], sys.argv[2])
+first = time.perf_counter()
+normalizer.process_text(sys.argv[1], sys.argv[2])
+second = time.perf_counter()
+print(json.dumps({
+    "import": imported - start,
+    "construct": constructed - imported,
+    "first request": first - constructed,
+    "warm request": second - first,
+}))
+"""
+
+TABLE_PROBE = r"""
+import json, time
+import currency_table
+start = time.perf_counter()
+currency_table.{function}()
+print(json.dumps({{"seconds": time.perf_counter() - start}}))
+"""
+
+REQUEST = "Pay $1,250.50 by 12th March 2024 at 5:30 PM, call 9876543210 or visit ISRO."
+
+
+def run(code, *argv):
+    result = subprocess.run(
+        [sys.executable, "-c", code, *argv], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--runs", type=int, default=5)
+    arg_parser.add_argument("--lang", default="en")
+    args = arg_parser.parse_args()
+
+    samples = {}
+    for _ in range(args.runs):
+        for phase, seconds in run(PROBE, REQUEST, args.lang).items():
+            samples.setdefault(phase, []).append(seconds)
+        for function in ("build_currency_mapping", "load_currency_mapping"):
+            seconds = run(TABLE_PROBE.format(function=function))["seconds"]
+            samples.setdefault(f"currency {function.split('_')[0]}", []).append(seconds)
+
+    print(f"{'phase':<22}{'median ms':>12}{'min ms':>10}")
+    for phase, values in samples.items():
+        print(f"{phase:<22}{statistics.median(values) * 1000:>12.1f}{min(values) * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
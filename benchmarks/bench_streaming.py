@@ -0,0 +1,62 @@
+"""
+Time to first chunk with iter_normalized versus total time with process_text on
+long paragraphs.
+
+    python benchmarks/bench_streaming.py [--sentences N] [--repeat N]
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from preprocesor import OrpheusTextNormalizer
+
+SENTENCES = [
+    "Your account XX1234 was debited with ₹12,500 on 05/06/2024 at 3:45 pm.",
+    "The SEBI circular dated March 15, 2024 applies to every listed company.",
+    "Call our helpline at +91-98765-43210 between 9am and 6pm.",
+    "Vehicle KA 05 AB 1234 was registered in 2019 under PAN ABCDE1234F.",
+    "Thank you for banking with us and have a pleasant day!",
+]
+
+
+def paragraph(sentences):
+    return " ".join(SENTENCES[i % len(SENTENCES)] for i in range(sentences))
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--sentences", nargs="+", type=int, default=[5, 20, 80])
+    arg_parser.add_argument("--repeat", type=int, default=10)
+    arg_parser.add_argument("--lang", default="en")
+    args = arg_parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    normalizer = OrpheusTextNormalizer()
+    normalizer.process_text(paragraph(len(SENTENCES)), to_lang=args.lang)
+
+    print(f"{'sentences':>10}{'whole ms':>12}{'first ms':>12}{'stream ms':>12}")
+    for count in args.sentences:
+        text = paragraph(count)
+        whole = first = total = 0.0
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            normalizer.process_text(text, to_lang=args.lang)
+            whole += time.perf_counter() - start
+
+            start = time.perf_counter()
+            chunks = normalizer.iter_normalized(text, to_lang=args.lang)
+            next(chunks)
+            first += time.perf_counter() - start
+            for _ in chunks:
+                pass
+            total += time.perf_counter() - start
+        n = args.repeat
+        print(f"{count:>10}{whole / n * 1e3:>12.2f}{first / n * 1e3:>12.2f}{total / n * 1e3:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
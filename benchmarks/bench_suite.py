@@ -0,0 +1,313 @@
+"""
+Reproducible process_text benchmark per entity type and language, with per-stage timing.
+
+Builds a seeded synthetic corpus for every (entity type, language) cell, reports
+throughput and p50/p95/p99 latency for process_text, and the mean time each
+_process_* stage and the text cleaner take per text. Results are written as JSON;
+pass an earlier result file to --compare to flag p50/p95 regressions.
+
+    python benchmarks/bench_suite.py [--langs en hi ...] [--entities date currency ...]
+        [--texts N] [--repeat N] [--output results.json]
+        [--compare baseline.json] [--threshold 0.10]
+
+Results go to benchmarks/results/ (ignored by git) unless --output says otherwise.
+Stages that raise are counted per cell and reported; the run then exits non-zero.
+"""
+import argparse
+import datetime
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+DEFAULT_OUTPUT = os.path.join(ROOT, "benchmarks", "results", "bench_suite.json")
+
+from acronym_lexicon import DEFAULT_ACRONYMS
+from preprocesor import OrpheusTextNormalizer
+from schema import EntityType
+
+SUITE_VERSION = 1
+
+LANGS = ["en", "hi", "ta", "te", "ml", "kn", "mr", "gu", "od", "bn", "pa"]
+
+# A short native-script phrase per language so each text carries realistic script context.
+LANG_PHRASES = {
+    "en": "Please note",
+    "hi": "कृपया ध्यान दें",
+    "ta": "தயவுசெய்து கவனிக்கவும்",
+    "te": "దయచేసి గమనించండి",
+    "ml": "ദയവായി ശ്രദ്ധിക്കുക",
+    "kn": "ದಯವಿಟ್ಟು ಗಮನಿಸಿ",
+    "mr": "कृपया लक्षात घ्या",
+    "gu": "કૃપા કરીને નોંધ લો",
+    "od": "ଦୟାକରି ଧ୍ୟାନ ଦିଅନ୍ତୁ",
+    "bn": "অনুগ্রহ করে লক্ষ্য করুন",
+    "pa": "ਕਿਰਪਾ ਕਰਕੇ ਧਿਆਨ ਦਿਓ",
+}
+
+MONTHS = ["January", "February", "March", "April", "May", "June", "July",
+          "August", "September", "October", "November", "December"]
+STATES = ["KA", "MH", "DL", "TN", "UP", "GJ", "WB", "KL"]
+
+
+def ordinal_suffix(n):
+    if 10 <= n % 100 <= 20:
+        return "th"
+    return {1: "st", 2: "nd", 3: "rd"}.get(n % 10, "th")
+
+
+def digits(rng, count):
+    return "".join(rng.choice("0123456789") for _ in range(count))
+
+
+def letters(rng, count):
+    return "".join(rng.choice("ABCDEFGHJKLMNPRSTUVWXYZ") for _ in range(count))
+
+
+def gen_date(rng):
+    day, month, year = rng.randint(1, 28), rng.randint(1, 12), rng.randint(1950, 2049)
+    return rng.choice([
+        f"{day:02d}/{month:02d}/{year}",
+        f"{day}{ordinal_suffix(day)} {MONTHS[month - 1]} {year}",
+        f"{year}-{month:02d}-{day:02d}",
+        f"{MONTHS[month - 1][:3]} {day}, {year}",
+    ])
+
+
+def gen_time(rng):
+    hour, minute = rng.randint(1, 12), rng.randint(0, 59)
+    return rng.choice([
+        f"{hour}:{minute:02d} {rng.choice(['AM', 'PM'])}",
+        f"{hour}{rng.choice(['am', 'pm'])}",
+        f"{rng.randint(13, 23)}:{minute:02d}",
+        f"{rng.randint(0, 23):02d}{minute:02d} hours",
+    ])
+
+
+def gen_currency(rng):
+    amount = rng.randint(1, 99999)
+    return rng.choice([
+        f"₹{amount:,}",
+        f"Rs. {amount}",
+        f"${amount / 100:.2f}",
+        f"USD {rng.randint(1, 9)}.{rng.randint(1, 9)}M",
+        f"{rng.randint(2, 50)} crore rupees",
+        f"€{amount:,}",
+    ])
+
+
+def gen_phone(rng):
+    return rng.choice([
+        f"+91-9{digits(rng, 4)}-{digits(rng, 5)}",
+        f"9{digits(rng, 9)}",
+        f"080-{digits(rng, 4)}-{digits(rng, 4)}",
+    ])
+
+
+def gen_vehicle(rng):
+    state, district, series, number = rng.choice(STATES), rng.randint(1, 99), letters(rng, 2), digits(rng, 4)
+    return rng.choice([f"{state} {district:02d} {series} {number}", f"{state}{district:02d}{series}{number}"])
+
+
+def gen_alphanumeric(rng):
+    return rng.choice([f"PNR{digits(rng, 3)}", f"{letters(rng, 3)}{digits(rng, 7)}", f"XX{digits(rng, 4)}"])
+
+
+def gen_acronym(rng):
+    return rng.choice(DEFAULT_ACRONYMS) + rng.choice(["", "'s"])
+
+
+def gen_decimal(rng):
+    return f"{rng.randint(0, 999)}.{digits(rng, rng.randint(1, 3))}"
+
+
+def gen_ordinal(rng):
+    n = rng.randint(1, 120)
+    return f"{n}{ordinal_suffix(n)}"
+
+
+def gen_comma_number(rng):
+    return f"{rng.randint(1000, 99999999):,}"
+
+
+def gen_non_comma_number(rng):
+    return rng.choice([str(rng.randint(1000, 2100)), f"{rng.randint(110, 855)}{digits(rng, 3)}", digits(rng, 4)])
+
+
+GENERATORS = {
+    EntityType.DATE: gen_date,
+    EntityType.TIME: gen_time,
+    EntityType.CURRENCY: gen_currency,
+    EntityType.PHONE_NUMBERS: gen_phone,
+    EntityType.VEHICLE_NUMBER: gen_vehicle,
+    EntityType.ALPHANUMERICS: gen_alphanumeric,
+    EntityType.ACRONYMS_READ_OUT: gen_acronym,
+    EntityType.DECIMAL: gen_decimal,
+    EntityType.ORDINAL: gen_ordinal,
+    EntityType.NUM_WITH_WORDS: gen_comma_number,
+    EntityType.NON_COMMA_NUMBERS: gen_non_comma_number,
+}
+
+
+def build_corpus(entity_type, lang, size, seed):
+    """Deterministic texts with three entities of entity_type each."""
+    rng = random.Random(f"{seed}:{entity_type}:{lang}")
+    generate = GENERATORS[entity_type]
+    phrase = LANG_PHRASES[lang]
+    return [f"{phrase}: {generate(rng)}, {generate(rng)} and {generate(rng)}." for _ in range(size)]
+
+
+def percentile(cut_points, p):
+    return cut_points[p - 1] if cut_points else 0.0
+
+
+def run_stages(normalizer, text, to_lang, stage_totals, stage_errors):
+    """
+    One sequential pass over the plan, adding each stage's wall time to stage_totals.
+    A stage that raises is counted in stage_errors and leaves the text unchanged.
+    """
+    for process_fn, _ in normalizer.get_plan(to_lang):
+        name = process_fn.func.__name__
+        start = time.perf_counter()
+        try:
+            text, _ = process_fn(text)
+        except Exception:
+            stage_errors[name] = stage_errors.get(name, 0) + 1
+        stage_totals[name] = stage_totals.get(name, 0.0) + time.perf_counter() - start
+    start = time.perf_counter()
+    normalizer.text_cleaner(text)
+    stage_totals["text_cleaner"] = stage_totals.get("text_cleaner", 0.0) + time.perf_counter() - start
+
+
+def bench_cell(normalizer, texts, to_lang, repeat):
+    for text in texts:  # warm plans, patterns and the number-to-words cache
+        normalizer.process_text(text, to_lang)
+
+    latencies = []
+    for _ in range(repeat):
+        for text in texts:
+            start = time.perf_counter()
+            normalizer.process_text(text, to_lang)
+            latencies.append(time.perf_counter() - start)
+
+    stage_totals = {}
+    stage_errors = {}
+    for _ in range(repeat):
+        for text in texts:
+            run_stages(normalizer, text, to_lang, stage_totals, stage_errors)
+
+    calls = len(latencies)
+    total = sum(latencies)
+    cut_points = statistics.quantiles(latencies, n=100, method="inclusive") if calls > 1 else latencies * 99
+    return {
+        "texts": len(texts),
+        "calls": calls,
+        "chars_per_text": sum(map(len, texts)) / len(texts),
+        "throughput_texts_per_s": calls / total,
+        "throughput_chars_per_s": sum(map(len, texts)) * repeat / total,
+        "latency_ms": {
+            "mean": total / calls * 1e3,
+            "p50": percentile(cut_points, 50) * 1e3,
+            "p95": percentile(cut_points, 95) * 1e3,
+            "p99": percentile(cut_points, 99) * 1e3,
+        },
+        "stage_ms": {name: seconds / calls * 1e3 for name, seconds in stage_totals.items()},
+        "stage_errors": stage_errors,
+    }
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline_path, threshold):
+    """Print cells whose p50 or p95 latency grew by more than threshold; return their count."""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {(cell["entity_type"], cell["lang"]): cell for cell in json.load(f)["results"]}
+
+    regressions = 0
+    print(f"\nagainst {baseline_path} (threshold {threshold:.0%})")
+    for cell in results:
+        previous = baseline.get((cell["entity_type"], cell["lang"]))
+        if previous is None:
+            continue
+        for key in ("p50", "p95"):
+            before, after = previous["latency_ms"][key], cell["latency_ms"][key]
+            if before and (after - before) / before > threshold:
+                regressions += 1
+                print(f"  REGRESSION {cell['entity_type']:<18}{cell['lang']:<4}{key} "
+                      f"{before:.3f} -> {after:.3f} ms ({(after - before) / before:+.0%})")
+    if not regressions:
+        print("  no regressions")
+    return regressions
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--langs", nargs="+", default=LANGS)
+    arg_parser.add_argument("--entities", nargs="+", default=[str(entity_type) for entity_type in GENERATORS],
+                            choices=[str(entity_type) for entity_type in GENERATORS])
+    arg_parser.add_argument("--texts", type=int, default=50, help="texts per (entity type, language) cell")
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    arg_parser.add_argument("--seed", type=int, default=0)
+    arg_parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    arg_parser.add_argument("--compare", help="earlier result file to check for regressions")
+    arg_parser.add_argument("--threshold", type=float, default=0.10, help="relative slowdown counted as a regression")
+    args = arg_parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    normalizer = OrpheusTextNormalizer()
+    results = []
+    print(f"{'entity':<20}{'lang':<6}{'texts/s':>10}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}  slowest stage")
+    for entity in args.entities:
+        for lang in args.langs:
+            texts = build_corpus(EntityType(entity), lang, args.texts, args.seed)
+            cell = {"entity_type": entity, "lang": lang, **bench_cell(normalizer, texts, lang, args.repeat)}
+            results.append(cell)
+            slowest = max(cell["stage_ms"], key=cell["stage_ms"].get)
+            latency = cell["latency_ms"]
+            print(f"{entity:<20}{lang:<6}{cell['throughput_texts_per_s']:>10.0f}{latency['p50']:>9.3f}"
+                  f"{latency['p95']:>9.3f}{latency['p99']:>9.3f}  {slowest} ({cell['stage_ms'][slowest]:.3f} ms)")
+            for name, count in cell["stage_errors"].items():
+                print(f"  ERROR {name} raised on {count} of {cell['calls']} texts")
+
+    report = {
+        "suite_version": SUITE_VERSION,
+        "meta": {
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "texts": args.texts,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\nwrote {args.output}")
+
+    failed = any(cell["stage_errors"] for cell in results)
+    if args.compare and compare(results, args.compare, args.threshold):
+        failed = True
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Precompiled prompt templates versus process_text on the filled strings: compile
+time per template, how many renders took the precompiled path, and latency per
+request. Checks that both give the same responses.
+
+    python benchmarks/bench_templates.py [--requests N] [--lang en]
+"""
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from preprocesor import OrpheusTextNormalizer
+
+TEMPLATES = [
+    "Your OTP is {otp}, valid till {time}. Do not share it with anyone, including our staff.",
+    "₹{amount} debited on {date} from your account. If this was not you, call {phone} immediately.",
+    "Dear customer, your EMI of Rs. {amount} is due on {due_date}. Please keep sufficient balance to avoid charges.",
+    "Your order of {quantity} items worth ₹{amount} will be delivered by {time} on {date}. Track it in the app.",
+    "Mutual fund investments are subject to market risks. Your SIP of ₹{amount} was processed on {date}.",
+]
+
+
+def values_for(template, rng):
+    return {
+        "otp": str(rng.randint(100000, 999999)),
+        "time": f"{rng.randint(1, 12)}:{rng.randint(0, 59):02d} {rng.choice(['AM', 'PM'])}",
+        "amount": f"{rng.randint(100, 999999):,}",
+        "date": f"{rng.randint(1, 28):02d}/{rng.randint(1, 12):02d}/2024",
+        "due_date": f"{rng.randint(1, 28):02d}/{rng.randint(1, 12):02d}/2024",
+        "phone": f"1800-{rng.randint(100, 999)}-{rng.randint(1000, 9999)}",
+        "quantity": str(rng.randint(1, 20)),
+    }
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--requests", type=int, default=2000)
+    arg_parser.add_argument("--lang", default="en")
+    args = arg_parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    normalizer = OrpheusTextNormalizer()
+    rng = random.Random(0)
+    requests = [(template, values_for(template, rng)) for template in rng.choices(TEMPLATES, k=args.requests)]
+
+    start = time.perf_counter()
+    compiled = {template: normalizer.compile_template(template, args.lang) for template in TEMPLATES}
+    compile_seconds = (time.perf_counter() - start) / len(TEMPLATES)
+
+    start = time.perf_counter()
+    expected = [normalizer.process_text(template.format(**values), args.lang) for template, values in requests]
+    filled_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    rendered = [compiled[template].render(**values) for template, values in requests]
+    render_seconds = time.perf_counter() - start
+    if rendered != expected:
+        print("precompiled renders differ from process_text")
+
+    fast = sum(template.fast_renders for template in compiled.values())
+    print(f"{len(TEMPLATES)} templates, {args.requests} requests, {compile_seconds * 1e3:.1f} ms to compile a template")
+    print(f"{fast / args.requests:.1%} of renders took the precompiled path")
+    print(f"{'mode':<14}{'req/s':>10}{'us/req':>10}")
+    for name, seconds in (("process_text", filled_seconds), ("render", render_seconds)):
+        print(f"{name:<14}{args.requests / seconds:>10.0f}{seconds / args.requests * 1e6:>10.1f}")
+    print(f"speedup {filled_seconds / render_seconds:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Thread scaling of process_batch(executor="thread") on one shared normalizer.
+Reports texts/s per thread count and speedup over a single thread, and whether
+the interpreter runs with the GIL. Pass --python to rerun the benchmark under
+other interpreters, e.g. a free-threaded python3.13t, and compare the builds.
+
+    python benchmarks/bench_threads.py [--texts N] [--threads 1,2,4,8] [--python python3.13t ...]
+"""
+import argparse
+import json
+import logging
+import os
+import subprocess
+import sys
+import sysconfig
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_suite import GENERATORS, build_corpus
+from preprocesor import OrpheusTextNormalizer
+
+LANGS = ["en", "hi"]
+
+
+def build_label():
+    free_threaded = bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    return f"{sys.implementation.name} {sys.version.split()[0]}{'t' if free_threaded else ''}, GIL {'on' if gil else 'off'}"
+
+
+def measure(texts, langs, thread_counts, repeats):
+    normalizer = OrpheusTextNormalizer()
+    # Warm the shared caches so every thread count sees the same hit rates.
+    normalizer.process_batch(texts, langs)
+    expected = normalizer.process_batch(texts, langs)
+    rates = {}
+    with normalizer:
+        for threads in thread_counts:
+            best = float("inf")
+            for _ in range(repeats):
+                start = time.perf_counter()
+                responses = normalizer.process_batch(texts, langs, workers=threads, executor="thread")
+                best = min(best, time.perf_counter() - start)
+                assert responses == expected
+            rates[threads] = len(texts) / best
+    return rates
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--texts", type=int, default=200, help="texts per (entity type, language) cell")
+    arg_parser.add_argument("--threads", default="1,2,4,8")
+    arg_parser.add_argument("--repeats", type=int, default=3)
+    arg_parser.add_argument("--python", nargs="*", default=[], help="other interpreters to run the benchmark under")
+    arg_parser.add_argument("--json", action="store_true", help=argparse.SUPPRESS)
+    args = arg_parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    thread_counts = [int(count) for count in args.threads.split(",")]
+    pairs = [
+        (text, to_lang)
+        for entity_type in GENERATORS for to_lang in LANGS
+        for text in build_corpus(entity_type, to_lang, args.texts, seed=0)
+    ]
+    texts, langs = [list(column) for column in zip(*pairs)]
+
+    results = {build_label(): measure(texts, langs, thread_counts, args.repeats)}
+    if args.json:
+        print(json.dumps(results))
+        return
+    for interpreter in args.python:
+        output = subprocess.run(
+            [interpreter, os.path.abspath(__file__), "--json", "--texts", str(args.texts),
+             "--threads", args.threads, "--repeats", str(args.repeats)],
+            check=True, capture_output=True, text=True,
+        ).stdout
+        for label, rates in json.loads(output).items():
+            label = label if label not in results else f"{label} ({os.path.basename(interpreter)})"
+            results[label] = {int(threads): rate for threads, rate in rates.items()}
+
+    print(f"{len(texts)} texts, os.cpu_count() = {os.cpu_count()}")
+    print(f"{'build':<40}{'threads':>8}{'texts/s':>10}{'speedup':>9}")
+    for label, rates in results.items():
+        for threads, rate in rates.items():
+            print(f"{label:<40}{threads:>8}{rate:>10.0f}{rate / rates[thread_counts[0]]:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Cost of pipeline observers: process_text with no observer, a no-op observer, a
+MetricsCollector and a SpanRecorder.
+
+    python benchmarks/bench_tracing.py [--repeat N]
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from preprocesor import OrpheusTextNormalizer
+from tracing import MetricsCollector, SpanRecorder
+
+TEXTS = [
+    "The meeting is on 15th March 2024 at 2:30 PM. Call me at +91-98765-43210.",
+    "₹50,000 debited on 12/05/2023 from A/C XX1234.",
+    "USD 1.5M was transferred to SEBI's account on 2023-11-04.",
+    "Vehicle KA 05 AB 1234 was seen near AIIMS at 0930 hours.",
+    "आपका OTP 482913 है और राशि ₹1,250.50 है।",
+    "Hello world. How are you? I am fine! Thanks.",
+]
+
+
+def timed(normalizer, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in TEXTS:
+            normalizer.process_text(text, "en")
+    return (time.perf_counter() - start) / (repeat * len(TEXTS))
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--repeat", type=int, default=300)
+    args = arg_parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    normalizer = OrpheusTextNormalizer()
+    timed(normalizer, 5)
+    baseline = timed(normalizer, args.repeat)
+
+    print(f"{'observer':<18}{'us/call':>10}{'overhead':>10}")
+    print(f"{'disabled':<18}{baseline * 1e6:>10.1f}{'':>10}")
+    for name, observer in (
+        ("no-op", lambda trace: None),
+        ("MetricsCollector", MetricsCollector()),
+        ("SpanRecorder", SpanRecorder()),
+    ):
+        normalizer.add_observer(observer)
+        seconds = timed(normalizer, args.repeat)
+        normalizer.remove_observer(observer)
+        print(f"{name:<18}{seconds * 1e6:>10.1f}{(seconds - baseline) / baseline:>+10.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+Concurrency stress run for one OrpheusTextNormalizer shared by many threads.
+
+Worker threads normalize a mixed corpus through the shared instance. Meanwhile a
+churn thread keeps replacing shared state with equivalent values: it swaps
+observers, rebuilds the acronym lexicon and currency table, and clears the shared
+caches. Short-lived threads keep adding fresh prefilter counter shards while a
+reader thread keeps summing them. Every response, including those from
+process_batch(executor="thread"), must match a single-threaded reference run.
+Prefilter counters must not lose updates. Exits 1 on any mismatch or exception.
+
+    python benchmarks/stress_threads.py [--threads N] [--rounds N]
+"""
+import argparse
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_suite import GENERATORS, build_corpus
+from preprocesor import DATE_WORDS_CACHE, NUMBER_WORDS_CACHE, OrpheusTextNormalizer
+from tracing import MetricsCollector
+
+LANGS = ["en", "hi", "ta", "bn"]
+
+
+def churn(normalizer, stop, counts):
+    words = list(normalizer.acronym_lexicon.compiled.index)
+    while not stop.is_set():
+        observer = normalizer.add_observer(MetricsCollector())
+        normalizer.acronym_lexicon.update(words)
+        normalizer.currency_mapping = dict(normalizer.currency_mapping)
+        NUMBER_WORDS_CACHE.clear()
+        DATE_WORDS_CACHE.clear()
+        normalizer.remove_observer(observer)
+        counts["churn"] += 1
+        time.sleep(0.001)
+
+
+def read_stats(normalizer, pairs, reference, stop, failures, counts):
+    reads = 0
+    while not stop.is_set():
+        # Each new thread counts into a new shard while prefilter_stats() sums the shards.
+        threads = [
+            threading.Thread(target=worker, args=(normalizer, pairs[:1], reference, 1, 0, failures, counts))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        while any(thread.is_alive() for thread in threads):
+            try:
+                normalizer.prefilter_stats()
+            except Exception as e:
+                failures.append(f"prefilter_stats() raised {type(e).__name__}: {e}")
+            reads += 1
+        for thread in threads:
+            thread.join()
+    counts["stats reads"] = reads
+
+
+def worker(normalizer, pairs, reference, rounds, seed, failures, counts):
+    rng = random.Random(seed)
+    for _ in range(rounds):
+        order = list(pairs)
+        rng.shuffle(order)
+        for text, to_lang in order:
+            try:
+                response = normalizer.process_text(text, to_lang)
+            except Exception as e:
+                failures.append(f"{type(e).__name__}: {e} on {text!r}")
+                continue
+            if response != reference[(text, to_lang)]:
+                failures.append(f"mismatch on {text!r} ({to_lang}): {response.formatted_text!r}")
+            counts["calls"] += 1
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--threads", type=int, default=8)
+    arg_parser.add_argument("--rounds", type=int, default=3)
+    arg_parser.add_argument("--texts", type=int, default=4, help="texts per (entity type, language) cell")
+    args = arg_parser.parse_args()
+    logging.disable(logging.CRITICAL)
+    # Switch threads as often as possible so GIL builds interleave too.
+    sys.setswitchinterval(1e-6)
+
+    pairs = [
+        (text, to_lang)
+        for entity_type in GENERATORS for to_lang in LANGS
+        for text in build_corpus(entity_type, to_lang, args.texts, seed=0)
+    ]
+    reference = {pair: OrpheusTextNormalizer().process_text(*pair) for pair in pairs}
+    normalizer = OrpheusTextNormalizer()
+    failures, counts = [], Counter()
+
+    stop = threading.Event()
+    churner = threading.Thread(target=churn, args=(normalizer, stop, counts))
+    reader = threading.Thread(target=read_stats, args=(normalizer, pairs, reference, stop, failures, counts))
+    threads = [
+        threading.Thread(target=worker, args=(normalizer, pairs, reference, args.rounds, seed, failures, counts))
+        for seed in range(args.threads)
+    ]
+    start = time.perf_counter()
+    churner.start()
+    reader.start()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stop.set()
+    churner.join()
+    reader.join()
+    seconds = time.perf_counter() - start
+
+    # Without churn, every pair processed once per thread must count exactly threads
+    # times the prefilter decisions of a single pass.
+    normalizer.reset_prefilter_stats()
+    for pair in pairs:
+        normalizer.process_text(*pair)
+    single = normalizer.prefilter_stats()
+    normalizer.reset_prefilter_stats()
+    threads = [
+        threading.Thread(target=worker, args=(normalizer, pairs, reference, 1, seed, failures, counts))
+        for seed in range(args.threads)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    expected = {stage: {key: value * args.threads for key, value in stats.items()} for stage, stats in single.items()}
+    if normalizer.prefilter_stats() != expected:
+        failures.append(f"prefilter counters lost updates: {normalizer.prefilter_stats()} != {expected}")
+
+    texts, langs = zip(*pairs)
+    with normalizer:
+        if normalizer.process_batch(texts, langs, workers=args.threads, executor="thread") != list(reference.values()):
+            failures.append("process_batch(executor='thread') differs from the reference")
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(
+        f"{args.threads} threads, {counts['calls']} calls in {seconds:.1f}s, {counts['churn']} churn cycles, "
+        f"{counts['stats reads']} stats reads, "
+        f"GIL {'enabled' if gil else 'disabled'}"
+    )
+    for failure in failures[:20]:
+        print(failure)
+    print(f"{len(failures)} failures")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,316 @@
+"""
+Normalize a JSONL (or plain text) corpus in a streaming fashion.
+
+Each input line is a JSON object with a text field and an optional language field
+(or, with --plain, one raw text per line). Each output line is the input record
+plus "formatted_text" and "replaced_entities". With --plain every input line,
+blank ones included, gives exactly one output line. Input is read and written a chunk at
+a time with a bounded number of chunks in flight, so memory use does not grow with
+the size of the corpus. Lines that are not valid records are reported on stderr and
+skipped; the exit status is 1 if there were any.
+
+With --mmap the input is a plain-text dump whose lines (documents) may be
+arbitrarily long. The file is memory-mapped and walked in windows of at most
+--window bytes. Sentences are normalized once no later text can change them (see
+incremental.IncrementalNormalizer), and the output, one normalized line per input
+line, is written as it is committed. Peak memory follows the window size rather than
+the file or line size.
+
+    python -m bulk_normalize corpus.jsonl -o normalized.jsonl --workers 8
+    zcat corpus.jsonl.gz | python -m bulk_normalize --lang hi --unordered > out.jsonl
+    python -m bulk_normalize dump.txt --mmap --lang hi -o normalized.txt
+"""
+import argparse
+import itertools
+import json
+import logging
+import mmap
+import sys
+import time
+import unicodedata
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import preprocesor
+from acronym_lexicon import AcronymLexicon
+
+
+def _normalize_chunk(chunk, options):
+    """
+    Normalize one chunk of (line number, raw line bytes) pairs with this process's normalizer.
+
+    Returns (output lines, [(line number, error message), ...], input bytes).
+    """
+    normalizer = preprocesor._batch_worker_normalizer
+    lines, errors, size = [], [], 0
+    for line_number, raw in chunk:
+        size += len(raw)
+        try:
+            raw = raw.decode("utf-8").rstrip("\r\n")
+            if options["plain"]:
+                # Blank lines get a record too, so output line N always matches input line N.
+                record = {options["text_field"]: raw}
+            elif not raw.strip():
+                continue
+            else:
+                record = json.loads(raw)
+                if not isinstance(record, dict):
+                    raise ValueError("record is not a JSON object")
+            text = record[options["text_field"]]
+            to_lang = record.get(options["lang_field"]) or options["lang"]
+            response = normalizer.process_text(text, to_lang=to_lang)
+        except (ValueError, KeyError, TypeError) as e:
+            errors.append((line_number, f"{type(e).__name__}: {e}"))
+            continue
+        record["formatted_text"] = response.formatted_text
+        record["replaced_entities"] = [list(entity) for entity in response.replaced_entities]
+        lines.append(json.dumps(record, ensure_ascii=False))
+    return lines, errors, size
+
+
+def _read_chunks(stream, chunk_size):
+    numbered_lines = enumerate(stream, 1)
+    while True:
+        chunk = list(itertools.islice(numbered_lines, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _run_in_process(chunks, options, config):
+    preprocesor._init_batch_worker(config)
+    for chunk in chunks:
+        yield _normalize_chunk(chunk, options)
+
+
+def _run_in_pool(chunks, options, config, workers, ordered):
+    """Run chunks on a process pool with at most workers * 4 chunks in flight."""
+    max_in_flight = workers * 4
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=preprocesor._init_batch_worker, initargs=(config,)
+    ) as pool:
+        if ordered:
+            in_flight = deque()
+            for chunk in chunks:
+                in_flight.append(pool.submit(_normalize_chunk, chunk, options))
+                if len(in_flight) >= max_in_flight:
+                    yield in_flight.popleft().result()
+            while in_flight:
+                yield in_flight.popleft().result()
+        else:
+            in_flight = set()
+            for chunk in chunks:
+                in_flight.add(pool.submit(_normalize_chunk, chunk, options))
+                if len(in_flight) >= max_in_flight:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+            for future in wait(in_flight).done:
+                yield future.result()
+
+
+def _iter_windows(mapped, window):
+    """
+    Walk a memory-mapped file in pieces of at most window bytes.
+
+    A piece ends at a line end or, when the line is longer, just after the last space
+    or tab in the window (between two characters if there is none). Yields
+    (text, whether the piece ends its line, bytes consumed). Pages already walked
+    are dropped from the mapping so resident memory stays near one window.
+    """
+    size = len(mapped)
+    position = released = 0
+    while position < size:
+        limit = min(position + window, size)
+        newline = mapped.find(b"\n", position, limit)
+        if newline != -1:
+            end, next_position, line_end = newline, newline + 1, True
+        elif limit == size:
+            end = next_position = size
+            line_end = True
+        else:
+            end = max(mapped.rfind(b" ", position, limit), mapped.rfind(b"\t", position, limit)) + 1
+            if end <= position:
+                end = limit
+                # Step back over UTF-8 continuation bytes so no character is split.
+                while end > position + 1 and mapped[end] & 0xC0 == 0x80:
+                    end -= 1
+            next_position, line_end = end, False
+        piece = mapped[position:end]
+        if line_end and piece.endswith(b"\r"):
+            piece = piece[:-1]
+        yield piece.decode("utf-8", errors="replace"), line_end, next_position - position
+        position = next_position
+        if hasattr(mmap, "MADV_DONTNEED"):
+            done = position - position % mmap.PAGESIZE
+            if done > released:
+                mapped.madvise(mmap.MADV_DONTNEED, released, done - released)
+                released = done
+
+
+# Zero width joiner and non-joiner bind the characters on either side into one cluster.
+JOINERS = "\u200c\u200d"
+
+
+def _forced_cut(text: str) -> int:
+    """
+    Where to cut text that has grown past the window inside one sentence: just after
+    its last whitespace or, without any, at its last grapheme cluster boundary. Never
+    between a base character and its combining marks, or around a virama or joiner.
+    """
+    end = max(text.rfind(" "), text.rfind("\t")) + 1
+    if end:
+        return end
+    end = len(text) - 1
+    while end > 0 and (
+        unicodedata.category(text[end]).startswith("M")
+        or text[end] in JOINERS
+        or text[end - 1] in JOINERS
+        or unicodedata.combining(text[end - 1]) == 9
+    ):
+        end -= 1
+    return end or len(text)
+
+
+def _run_mmap(path, sink, window, to_lang, config, progress):
+    """
+    Normalize the plain-text file at path window by window, writing one normalized
+    line per input line to sink. Returns how many lines had to be cut inside a
+    sentence because it ran longer than the window.
+    """
+    preprocesor._init_batch_worker(config)
+    stream = preprocesor._batch_worker_normalizer.open_stream(to_lang)
+    forced_cuts = 0
+    with open(path, "rb") as source:
+        if not source.seek(0, 2):
+            return forced_cuts
+        with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            separator = ""
+            for text, line_end, size in _iter_windows(mapped, window):
+                responses = stream.feed(text)
+                if line_end:
+                    responses += stream.flush()
+                elif len(stream.pending.encode("utf-8")) > window:
+                    # A sentence longer than the window (in bytes, like the windows) is cut.
+                    forced_cuts += 1
+                    responses += stream.flush(_forced_cut(stream.pending))
+                for response in responses:
+                    sink.write(separator)
+                    sink.write(response.formatted_text)
+                    separator = " "
+                if line_end:
+                    sink.write("\n")
+                    separator = ""
+                progress.update(line_end, 0, size)
+    return forced_cuts
+
+
+class _Progress:
+    def __init__(self, interval, stream=sys.stderr):
+        self.interval = interval
+        self.stream = stream
+        self.records = 0
+        self.errors = 0
+        self.bytes = 0
+        self.start = self.last = time.perf_counter()
+
+    def update(self, records, errors, size):
+        self.records += records
+        self.errors += errors
+        self.bytes += size
+        now = time.perf_counter()
+        if self.interval and now - self.last >= self.interval:
+            self.last = now
+            self.report("progress")
+
+    def report(self, label):
+        elapsed = max(time.perf_counter() - self.start, 1e-9)
+        print(
+            f"[{label}] {self.records} records, {self.errors} errors, {elapsed:.1f}s, "
+            f"{self.records / elapsed:.0f} records/s, {self.bytes / elapsed / 1e6:.2f} MB/s",
+            file=self.stream,
+            flush=True,
+        )
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("input", nargs="?", default="-", help="input file, or - for stdin (default)")
+    arg_parser.add_argument("-o", "--output", default="-", help="output file, or - for stdout (default)")
+    arg_parser.add_argument("--plain", action="store_true", help="input is one raw text per line, not JSONL")
+    arg_parser.add_argument("--text-field", default="text")
+    arg_parser.add_argument("--lang-field", default="lang")
+    arg_parser.add_argument("--lang", default="en", help="language for records without a language field")
+    arg_parser.add_argument("--workers", type=int, default=1, help="worker processes (default: 1, in-process)")
+    arg_parser.add_argument("--chunk-size", type=int, default=256, help="lines handed to a worker at a time")
+    arg_parser.add_argument("--unordered", action="store_true", help="write results as chunks finish")
+    arg_parser.add_argument("--lexicon", help="acronym lexicon file, one entry per line")
+    arg_parser.add_argument("--progress", type=float, default=10.0, help="seconds between progress reports; 0 disables")
+    arg_parser.add_argument("--quiet", action="store_true", help="do not report progress or bad lines")
+    arg_parser.add_argument("--mmap", action="store_true", help="memory-map a plain-text input file and walk it in windows")
+    arg_parser.add_argument("--window", type=int, default=1 << 16, help="bytes per window with --mmap (default: 64 KiB)")
+    args = arg_parser.parse_args(argv)
+    logging.disable(logging.CRITICAL)
+    if args.mmap and args.input == "-":
+        arg_parser.error("--mmap needs an input file, not stdin")
+    if args.mmap and args.workers > 1:
+        arg_parser.error("--mmap runs in one process; split the file to use more workers")
+    if args.window < 4:
+        arg_parser.error("--window must be at least 4 bytes")
+
+    options = {"plain": args.plain, "text_field": args.text_field, "lang_field": args.lang_field, "lang": args.lang}
+    config = {
+        "acronym_lexicon": AcronymLexicon.from_file(args.lexicon) if args.lexicon else None,
+    }
+
+    if args.output == "-":
+        sys.stdout.reconfigure(encoding="utf-8")
+        sink = sys.stdout
+    else:
+        sink = open(args.output, "w", encoding="utf-8")
+    progress = _Progress(0 if args.quiet else args.progress)
+    if args.mmap:
+        try:
+            forced_cuts = _run_mmap(args.input, sink, args.window, args.lang, config, progress)
+        finally:
+            if sink is not sys.stdout:
+                sink.close()
+            else:
+                sink.flush()
+        if not args.quiet:
+            progress.report("done")
+            if forced_cuts:
+                print(f"{forced_cuts} sentences were longer than --window and were cut", file=sys.stderr)
+        return 0
+
+    source = sys.stdin.buffer if args.input == "-" else open(args.input, "rb")
+    try:
+        chunks = _read_chunks(source, args.chunk_size)
+        if args.workers <= 1:
+            results = _run_in_process(chunks, options, config)
+        else:
+            results = _run_in_pool(chunks, options, config, args.workers, ordered=not args.unordered)
+        for lines, errors, size in results:
+            if lines:
+                sink.write("\n".join(lines))
+                sink.write("\n")
+            if not args.quiet:
+                for line_number, message in errors:
+                    print(f"line {line_number}: {message}", file=sys.stderr)
+            progress.update(len(lines), len(errors), size)
+    finally:
+        if source is not sys.stdin.buffer:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+        else:
+            sink.flush()
+    if not args.quiet:
+        progress.report("done")
+    return 1 if progress.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
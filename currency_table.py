@@ -0,0 +1,167 @@
+"""
+Prebuilt currency symbol/code table.
+
+Building the symbol mapping and spoken names from pycountry and Babel walks every
+ISO 4217 currency and dominates cold start, so the result is shipped as
+currency_table.json and loaded on first use. Regenerate it after upgrading pycountry or Babel with:
+
+    python currency_table.py
+"""
+import hashlib
+import json
+import os
+
+CURRENCY_TABLE_VERSION = 2
+CURRENCY_TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "currency_table.json")
+# The currency stage speaks English currency names for every target language.
+CURRENCY_NAME_LOCALE = "en_US"
+
+_currency_table = None
+
+
+class CurrencyTable:
+    """
+    Currency symbols and codes indexed for lookup inside a matched amount, plus the
+    singular and plural spoken name of each ISO code.
+    """
+
+    def __init__(self, mapping: dict, names: dict):
+        """
+        Args:
+            mapping (dict): Symbol/code -> ISO code, in priority order
+            names (dict): ISO code -> (singular name, plural name)
+        """
+        self.mapping = mapping
+        self.names = names
+        self._trie = {}
+        for rank, symbol in enumerate(mapping):
+            node = self._trie
+            for char in symbol:
+                node = node.setdefault(char, {})
+            node.setdefault("", rank)
+        self._fingerprint = None
+
+    @property
+    def fingerprint(self) -> str:
+        """Hash of the mapping and names, so cached results from another table are never reused."""
+        if self._fingerprint is None:
+            content = json.dumps([list(self.mapping.items()), sorted(self.names.items())], ensure_ascii=False)
+            self._fingerprint = hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+        return self._fingerprint
+
+    def find(self, text: str):
+        """
+        Return the symbol or code in text that comes first in mapping order, or None.
+
+        Same result as next(cur for cur in mapping if cur in text), found with one trie
+        walk from each position of text instead of a substring search per entry.
+        """
+        trie = self._trie
+        best = None
+        for start in range(len(text)):
+            node = trie.get(text[start])
+            position = start + 1
+            while node is not None:
+                rank = node.get("")
+                if rank is not None and (best is None or rank < best[0]):
+                    best = (rank, text[start:position])
+                if position == len(text):
+                    break
+                node = node.get(text[position])
+                position += 1
+        return best[1] if best else None
+
+    def spoken_name(self, code: str, amount: float) -> str:
+        """Spoken currency name for amount units of code, e.g. "US dollar" / "US dollars"."""
+        names = self.names.get(code)
+        if names is None:
+            return code.lower()
+        return names[0] if amount == 1 else names[1]
+
+
+def build_currency_mapping() -> dict:
+    """Build the symbol/code -> ISO code mapping from pycountry and Babel."""
+    import pycountry
+    from babel import numbers
+
+    currency_mapping = {}
+    for currency in pycountry.currencies:
+        currency_mapping[currency.alpha_3] = currency.alpha_3
+        if hasattr(currency, "numeric"):
+            symbol = numbers.get_currency_symbol(currency.alpha_3, locale="en_US")
+            if symbol != currency.alpha_3:
+                currency_mapping[symbol] = currency.alpha_3
+    return currency_mapping
+
+
+def build_currency_names(codes, locale: str = CURRENCY_NAME_LOCALE) -> dict:
+    """Build ISO code -> (singular, plural) spoken names with Babel."""
+    from babel import numbers
+
+    names = {}
+    for code in codes:
+        try:
+            names[code] = (
+                numbers.get_currency_name(code, count=1, locale=locale),
+                numbers.get_currency_name(code, count=2, locale=locale),
+            )
+        except Exception:
+            names[code] = (code.lower(), code.lower())
+    return names
+
+
+def build_currency_table() -> CurrencyTable:
+    """Build the table from the installed pycountry and Babel."""
+    mapping = build_currency_mapping()
+    return CurrencyTable(mapping, build_currency_names(dict.fromkeys(mapping.values())))
+
+
+def load_currency_table(path: str = CURRENCY_TABLE_PATH) -> CurrencyTable:
+    """
+    Return the currency table, reading the prebuilt file once per process.
+
+    Entries keep the order they were built in, which decides which symbol wins when
+    several occur in one amount. Falls back to building the table when the file is
+    missing or was written by an incompatible version.
+    """
+    global _currency_table
+    if _currency_table is None:
+        try:
+            with open(path, encoding="utf-8") as f:
+                table = json.load(f)
+            if table.get("version") != CURRENCY_TABLE_VERSION:
+                raise ValueError(f"unsupported currency table version {table.get('version')!r}")
+            _currency_table = CurrencyTable(
+                dict(table["symbols"]),
+                {code: tuple(names) for code, names in table["names"].items()},
+            )
+        except (OSError, ValueError, KeyError):
+            _currency_table = build_currency_table()
+    return _currency_table
+
+
+def load_currency_mapping(path: str = CURRENCY_TABLE_PATH) -> dict:
+    """Return the symbol/code -> ISO code mapping from the prebuilt table."""
+    return load_currency_table(path).mapping
+
+
+def write_currency_table(path: str = CURRENCY_TABLE_PATH):
+    """Regenerate the prebuilt table from the installed pycountry and Babel."""
+    from importlib.metadata import version
+
+    currency_table = build_currency_table()
+    table = {
+        "version": CURRENCY_TABLE_VERSION,
+        "generated_with": {"pycountry": version("pycountry"), "babel": version("babel")},
+        "name_locale": CURRENCY_NAME_LOCALE,
+        "symbols": list(currency_table.mapping.items()),
+        "names": currency_table.names,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(table, f, ensure_ascii=False, indent=1)
+        f.write("\n")
+
+
+if __name__ == "__main__":
+    write_currency_table()
+    print(f"Wrote {CURRENCY_TABLE_PATH}")
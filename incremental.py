@@ -0,0 +1,77 @@
+from schema import DeterministicPreTTSPreprocessingResponse
+from segmentation import SENTENCE_TERMINATORS, settled_sentence_spans
+
+
+class IncrementalNormalizer:
+    """
+    Normalizes text that arrives in chunks, such as an LLM token stream, without
+    normalizing anything twice.
+
+    feed() appends a chunk and normalizes each sentence that no later chunk can
+    change (see segmentation.settled_sentence_spans). Only the unsettled tail, usually
+    the sentence still being written, is kept for the next round. flush() normalizes
+    the tail at the end of the stream. Joining the formatted_text of every returned
+    response with a space gives the same text as process_text on the whole stream.
+
+    While the normalizer's acronym lexicon has entries containing sentence
+    punctuation, nothing is committed before flush().
+    """
+
+    def __init__(self, normalizer, to_lang: str = "en"):
+        """
+        Args:
+            normalizer (OrpheusTextNormalizer): Normalizer to run
+            to_lang (str): Target language code (default: "en")
+        """
+        self.normalizer = normalizer
+        self.to_lang = to_lang
+        self._pending = ""
+        # Whether _pending holds a sentence terminator; without one it has no boundary.
+        self._terminated = False
+
+    @property
+    def pending(self) -> str:
+        """Text fed but not normalized yet."""
+        return self._pending
+
+    def feed(self, chunk: str) -> list[DeterministicPreTTSPreprocessingResponse]:
+        """
+        Append chunk to the stream and normalize the sentences it settled.
+
+        Returns:
+            list[DeterministicPreTTSPreprocessingResponse]: One response per newly committed sentence that is not empty
+        """
+        self._pending += chunk
+        self._terminated = self._terminated or any(char in chunk for char in SENTENCE_TERMINATORS)
+        if not self._terminated or self.normalizer.acronym_lexicon.compiled.has_sentence_punctuation:
+            return []
+
+        text = self._pending
+        spans, rest = settled_sentence_spans(text)
+        if not spans:
+            return []
+        self._pending = text[rest:]
+        self._terminated = any(char in self._pending for char in SENTENCE_TERMINATORS)
+        return self._normalize(text[start:end] for start, end in spans)
+
+    def flush(self, end: int = None) -> list[DeterministicPreTTSPreprocessingResponse]:
+        """
+        Normalize whatever is pending at the end of the stream. The normalizer can be
+        fed a new stream afterwards.
+
+        Args:
+            end (int): Only normalize pending[:end] and keep the rest pending, to force
+                a cut inside an overlong sentence (default: all of it)
+
+        Returns:
+            list[DeterministicPreTTSPreprocessingResponse]: The last responses, if any text was pending
+        """
+        if end is None:
+            end = len(self._pending)
+        text, self._pending = self._pending[:end], self._pending[end:]
+        self._terminated = any(char in self._pending for char in SENTENCE_TERMINATORS)
+        return self._normalize([text])
+
+    def _normalize(self, sentences) -> list[DeterministicPreTTSPreprocessingResponse]:
+        responses = (self.normalizer.process_text(sentence, to_lang=self.to_lang) for sentence in sentences)
+        return [response for response in responses if response.formatted_text]
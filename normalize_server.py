@@ -0,0 +1,367 @@
+"""
+Local HTTP normalization service, for running the normalizer as a sidecar.
+
+POST /normalize with {"text": ..., "lang": "hi"} returns {"formatted_text": ...,
+"replaced_entities": [...]}, as process_text would. Concurrent requests are grouped
+into micro-batches. A batch is sent to the worker processes once it holds
+--max-batch-size requests, or once its oldest request has waited --max-wait-ms,
+whichever comes first; an idle server sends a request straight away. Identical
+(text, lang) payloads in a batch are normalized once. Each worker runs one batch at
+a time, so requests that arrive while every worker is busy form the next, larger
+batch. The workers are warmed up before the server starts listening. GET /health
+reports queue depth, batch sizes and latency percentiles. Only the standard library
+is used; listens on TCP or a Unix socket.
+
+    python -m normalize_server --port 8040 --workers 4 --langs en,hi
+    python -m normalize_server --unix /tmp/normalizer.sock
+"""
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import multiprocessing
+import os
+import signal
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+import preprocesor
+from acronym_lexicon import AcronymLexicon
+
+MAX_BODY_BYTES = 1 << 20
+# Seconds a warmed-up worker waits for the others before startup is abandoned.
+READY_TIMEOUT = 300
+# Every distinct language gets its own stage plan in each worker, so only languages the
+# normalizer knows are accepted.
+SUPPORTED_LANGS = preprocesor.DIGIT_WORD_LANGS | {"en_IN"}
+REASONS = {
+    200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+    413: "Payload Too Large", 500: "Internal Server Error",
+}
+
+
+_ready_barrier = None
+
+
+def _init_server_worker(config, langs, ready):
+    global _ready_barrier
+    gc.enable()
+    preprocesor._init_batch_worker(config)
+    preprocesor._batch_worker_normalizer.warmup(langs)
+    _ready_barrier = ready
+
+
+def _worker_ready(_):
+    # Hold this worker until every worker has warmed up, so that each readiness task
+    # lands on a different worker.
+    _ready_barrier.wait(READY_TIMEOUT)
+    return os.getpid()
+
+
+def _normalize_batch_in_worker(pairs):
+    """Normalize distinct (text, to_lang) pairs with this process's normalizer, as JSON response bodies."""
+    normalizer = preprocesor._batch_worker_normalizer
+    bodies = []
+    for text, to_lang in pairs:
+        response = normalizer.process_text(text, to_lang=to_lang)
+        bodies.append(json.dumps(
+            {
+                "formatted_text": response.formatted_text,
+                "replaced_entities": [list(entity) for entity in response.replaced_entities],
+            },
+            ensure_ascii=False,
+        ).encode("utf-8"))
+    return bodies
+
+
+class _Request(NamedTuple):
+    text: str
+    to_lang: str
+    enqueued: float
+    future: asyncio.Future
+
+
+class MicroBatcher:
+    """
+    Groups requests submitted from one event loop into batches for an executor.
+
+    A batch is cut when it holds max_batch_size requests or its oldest request has
+    waited max_wait seconds; when no batch is running, it is cut from whatever is
+    queued without waiting. At most max_in_flight batches run at once; while all of
+    them are busy new requests wait in the queue and go out together in the next batch.
+    """
+
+    def __init__(
+        self, executor, max_batch_size: int = 32, max_wait: float = 0.002, max_in_flight: int = 1,
+        latency_window: int = 10000,
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1")
+        self.executor = executor
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.max_in_flight = max_in_flight
+        self.requests = 0
+        self.batches = 0
+        self.deduplicated = 0
+        self.errors = 0
+        self.in_flight = 0
+        # Seconds from submission to result for the most recent requests.
+        self.latencies = deque(maxlen=latency_window)
+        self._queue = asyncio.Queue()
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._tasks = set()
+        self._runner = asyncio.get_running_loop().create_task(self._run())
+
+    @property
+    def queue_depth(self) -> int:
+        """Requests waiting for a batch."""
+        return self._queue.qsize()
+
+    async def submit(self, text: str, to_lang: str) -> bytes:
+        """Normalize one text in the next batch; returns its JSON response body."""
+        loop = asyncio.get_running_loop()
+        request = _Request(text, to_lang, loop.time(), loop.create_future())
+        self._queue.put_nowait(request)
+        try:
+            return await request.future
+        finally:
+            self.latencies.append(loop.time() - request.enqueued)
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            # Hold a slot before cutting a batch, so requests keep queuing while all are busy.
+            await self._slots.acquire()
+            batch = [await self._queue.get()]
+            # With every worker idle there is no load to batch, so do not make it wait.
+            deadline = batch[0].enqueued + (self.max_wait if self.in_flight else 0)
+            while len(batch) < self.max_batch_size:
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            self.in_flight += 1
+            task = loop.create_task(self._dispatch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, batch):
+        groups = {}
+        for request in batch:
+            groups.setdefault((request.text, request.to_lang), []).append(request)
+        pairs = list(groups)
+        try:
+            bodies = await asyncio.get_running_loop().run_in_executor(self.executor, _normalize_batch_in_worker, pairs)
+        except Exception as e:
+            self.errors += len(batch)
+            logging.error(f"Normalization batch of {len(batch)} requests failed. Error: {str(e)}")
+            for request in batch:
+                if not request.future.done():
+                    request.future.set_exception(e)
+        else:
+            for pair, body in zip(pairs, bodies):
+                for request in groups[pair]:
+                    if not request.future.done():
+                        request.future.set_result(body)
+        finally:
+            self.requests += len(batch)
+            self.batches += 1
+            self.deduplicated += len(batch) - len(pairs)
+            self.in_flight -= 1
+            self._slots.release()
+
+    def stats(self) -> dict:
+        latencies = sorted(self.latencies)
+
+        def percentile(p):
+            if not latencies:
+                return None
+            return round(latencies[min(len(latencies) - 1, int(len(latencies) * p / 100))] * 1e3, 3)
+
+        return {
+            "queue_depth": self.queue_depth,
+            "batches_in_flight": self.in_flight,
+            "requests": self.requests,
+            "batches": self.batches,
+            "mean_batch_size": round(self.requests / self.batches, 2) if self.batches else None,
+            "deduplicated": self.deduplicated,
+            "errors": self.errors,
+            "latency_ms": {
+                "p50": percentile(50), "p95": percentile(95), "p99": percentile(99), "window": len(latencies),
+            },
+        }
+
+    async def aclose(self):
+        self._runner.cancel()
+        await asyncio.gather(self._runner, *self._tasks, return_exceptions=True)
+
+
+class NormalizeServer:
+    """HTTP/1.1 front end for a MicroBatcher, with keep-alive connections."""
+
+    def __init__(self, batcher: MicroBatcher, default_lang: str = "en", info: dict = None):
+        self.batcher = batcher
+        self.default_lang = default_lang
+        self.info = info or {}
+        self.started = time.monotonic()
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, target, version = request_line.decode("latin-1").split()
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0))
+                if length > MAX_BODY_BYTES:
+                    await self._respond(writer, 413, {"error": f"body larger than {MAX_BODY_BYTES} bytes"}, False)
+                    break
+                body = await reader.readexactly(length)
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+                status, payload = await self.route(method, target.split("?", 1)[0], body)
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def route(self, method, path, body):
+        if path == "/health":
+            if method != "GET":
+                return 405, {"error": "use GET"}
+            return 200, self.health()
+        if path != "/normalize":
+            return 404, {"error": f"no route {path}"}
+        if method != "POST":
+            return 405, {"error": "use POST"}
+        try:
+            request = json.loads(body)
+            text = request["text"]
+            to_lang = request.get("lang") or self.default_lang
+            if not isinstance(text, str) or not isinstance(to_lang, str):
+                raise TypeError("text and lang must be strings")
+            if to_lang not in SUPPORTED_LANGS:
+                raise ValueError(f"unsupported lang {to_lang!r}, expected one of {sorted(SUPPORTED_LANGS)}")
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            return 400, {"error": f"{type(e).__name__}: {e}"}
+        try:
+            return 200, await self.batcher.submit(text, to_lang)
+        except Exception as e:
+            return 500, {"error": f"{type(e).__name__}: {e}"}
+
+    def health(self) -> dict:
+        uptime = round(time.monotonic() - self.started, 1)
+        return {"status": "ok", "uptime_s": uptime, **self.info, **self.batcher.stats()}
+
+    @staticmethod
+    async def _respond(writer, status, payload, keep_alive):
+        body = payload if isinstance(payload, bytes) else json.dumps(payload).encode("utf-8")
+        head = (
+            f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+            f"Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+
+async def serve(executor, args, info):
+    batcher = MicroBatcher(executor, args.max_batch_size, args.max_wait_ms / 1e3, max_in_flight=args.workers)
+    server = NormalizeServer(batcher, args.lang, info)
+    if args.unix:
+        listener = await asyncio.start_unix_server(server.handle_connection, path=args.unix)
+        address = f"unix:{args.unix}"
+    else:
+        listener = await asyncio.start_server(server.handle_connection, args.host, args.port)
+        host, port = listener.sockets[0].getsockname()[:2]
+        address = f"http://{host}:{port}"
+    print(f"listening on {address}", file=sys.stderr, flush=True)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
+    try:
+        async with listener:
+            await stop.wait()
+        await batcher.aclose()
+    finally:
+        if args.unix and os.path.exists(args.unix):
+            os.unlink(args.unix)
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--host", default="127.0.0.1")
+    arg_parser.add_argument("--port", type=int, default=8040, help="TCP port; 0 picks a free one")
+    arg_parser.add_argument("--unix", help="listen on this Unix socket path instead of TCP")
+    arg_parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="worker processes")
+    arg_parser.add_argument("--max-batch-size", type=int, default=32)
+    arg_parser.add_argument(
+        "--max-wait-ms", type=float, default=2.0, help="longest a request waits for its batch to fill"
+    )
+    arg_parser.add_argument(
+        "--lang", default="en", choices=sorted(SUPPORTED_LANGS), help="language for requests without one"
+    )
+    arg_parser.add_argument("--langs", help="comma-separated languages to warm up (default: all)")
+    arg_parser.add_argument("--lexicon", help="acronym lexicon file, one entry per line")
+    args = arg_parser.parse_args(argv)
+    if args.workers < 1:
+        arg_parser.error("--workers must be at least 1")
+    langs = args.langs.split(",") if args.langs else None
+    if langs and not SUPPORTED_LANGS.issuperset(langs):
+        arg_parser.error(f"--langs must be among {', '.join(sorted(SUPPORTED_LANGS))}")
+    logging.basicConfig(level=logging.WARNING)
+
+    config = {
+        "acronym_lexicon": AcronymLexicon.from_file(args.lexicon) if args.lexicon else None,
+    }
+    # Warm the shared state before the workers fork, so they start with it copy-on-write.
+    gc.disable()
+    preprocesor.OrpheusTextNormalizer(**config).warmup(langs, freeze=True)
+    ready = multiprocessing.Barrier(args.workers)
+    executor = ProcessPoolExecutor(
+        max_workers=args.workers, initializer=_init_server_worker, initargs=(config, langs, ready)
+    )
+    try:
+        try:
+            pids = set(executor.map(_worker_ready, range(args.workers)))
+        except threading.BrokenBarrierError:
+            pids = set()
+        if len(pids) != args.workers:
+            print(f"only {len(pids)} of {args.workers} workers got ready", file=sys.stderr, flush=True)
+            return 1
+        gc.enable()
+        info = {"workers": args.workers, "max_batch_size": args.max_batch_size, "max_wait_ms": args.max_wait_ms}
+        print(f"{len(pids)} workers ready", file=sys.stderr, flush=True)
+        asyncio.run(serve(executor, args, info))
+    finally:
+        executor.shutdown(cancel_futures=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
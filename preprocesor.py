@@ -1,18 +1,148 @@
 from ipa_lexicon import VALID_CHARS, VALID_NUMBERS, PUNCTUATIONS
 import logging
+from collections import Counter
 from datetime import datetime
-import pycountry
-from babel import numbers
-from num2words import num2words
-import roman
-from dateutil import parser
+from functools import partial
+import gc
 import re
-from enum import StrEnum
-from indic_numtowords import num2words as indic_num_to_words
-from pydantic import BaseModel
-import re 
+import threading
+import time
 import unicodedata
-from schema import DeterministicPreTTSPreprocessingResponse, EntityType
+import weakref
+from types import MappingProxyType
+from schema import DeterministicPreTTSPreprocessingResponse, EntityType, NormalizedText
+from acronym_lexicon import AcronymLexicon
+from cache import LRUCache
+from segmentation import sentence_spans, split_sentences
+from currency_table import CurrencyTable, load_currency_table
+from tracing import PipelineTrace, StageEvent, run_stage_traced
+from response_cache import TieredResponseCache
+from templates import CompiledTemplate
+from incremental import IncrementalNormalizer
+
+
+# Patterns are compiled once at import time so the per-request path never goes
+# through re's internal (and easily thrashed) pattern cache.
+ORDINAL_PATTERN = re.compile(r"\b(\d+)(st|nd|rd|th)\b")
+# Prefilter for the numeric stages: every one of their patterns needs a digit to match
+# anything they would change. Matches any Unicode digit, like the stages' own \d.
+DIGIT_PATTERN = re.compile(r"\d")
+
+DATE_PATTERN = re.compile(
+    r"\b(\d{1,2}(?:st|nd|rd|th)?[-/.]\d{1,2}[-/.]\d{4}|"
+    r"\d{4}[-/.]\d{2}[-/.]\d{2}|"
+    r"(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|"
+    r"Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+\d{1,2}(?:st|nd|rd|th)?,\s+\d{4}|"
+    r"\d{1,2}(?:st|nd|rd|th)?\s+(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|"
+    r"Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)(?:\s+\d{4})?)\b",
+    re.IGNORECASE,
+)
+DATE_ORDINAL_PATTERN = re.compile(r"(\d+)(st|nd|rd|th)\s+(\w+)")
+DATE_HOURS_PATTERN = re.compile(r"\d{4}\s*hours")
+# DATE_PATTERN shapes _parse_date reads without dateutil: d/m/Y and Y/m/d with one
+# separator, "d Month [Y]" and "Month d, Y" with single spaces.
+DAY_FIRST_DATE_PATTERN = re.compile(r"(\d{1,2})([-/.])(\d{1,2})\2(\d{4})")
+YEAR_FIRST_DATE_PATTERN = re.compile(r"(\d{4})([-/.])(\d{2})\2(\d{2})")
+DAY_MONTH_DATE_PATTERN = re.compile(r"(\d{1,2})(?:st|nd|rd|th)? ([a-z]+)(?: (\d{4}))?", re.IGNORECASE)
+MONTH_DAY_DATE_PATTERN = re.compile(r"([a-z]+) (\d{1,2})(?:st|nd|rd|th)?, (\d{4})", re.IGNORECASE)
+MONTH_NAMES = (
+    "january", "february", "march", "april", "may", "june",
+    "july", "august", "september", "october", "november", "december",
+)
+FULL_MONTH_NUMBERS = {name: number for number, name in enumerate(MONTH_NAMES, 1)}
+MONTH_NUMBERS = {**FULL_MONTH_NUMBERS, **{name[:3]: number for name, number in FULL_MONTH_NUMBERS.items()}}
+
+AM_PM_TIME_PATTERN = re.compile(r"(?<!\w)(1[0-2]|0?[1-9])(?::([0-5][0-9]))?\s*(am|pm|बजे)(?!\w)", re.IGNORECASE)
+CLOCK_TIME_PATTERN = re.compile(r"\b([01]?[0-9]|2[0-3]):[0-5][0-9]\b", re.IGNORECASE)
+DURATION_PATTERN = re.compile(r"\b([01]?[0-9]|2[0-3]):([0-5][0-9])\b")
+# Used by _time_to_words on already lower-cased input, hence no IGNORECASE.
+AM_PM_TIME_LOWER_PATTERN = re.compile(r"(?<!\w)(1[0-2]|0?[1-9])(?::([0-5][0-9]))?\s*(am|pm|बजे)(?!\w)")
+
+NON_DIGIT_PATTERN = re.compile(r"\D")
+
+PHONE_PATTERN = re.compile(
+    r"""
+    (?:
+        (?:\+?\d{1,3}[-\s]?)?
+        (?:\d{1,4}[-\s]?)?
+        (?:\(\d{2,4}\)|\d{2,4})
+        (?:[-\s]?\d{1,4}){0,4}
+    )
+    """, re.VERBOSE
+)
+PHONE_DATE_PATTERN = re.compile(
+    r"\b(\d{1,2}[-/]\d{1,2}[-/]\d{2,4}|\d{4}[-/]\d{1,2}[-/]\d{1,2})\b"
+)
+
+CURRENCY_PATTERN = re.compile(
+    r"([₹$£€¥]?\s*[\d,.]+(?:\s*[kmb])?(?:\s*(hundreds?|thousands?|lakhs?|millions?|crores?|billions?|rupees?|rupee))?\s*(?:USD|EUR|INR|GBP|JPY|CAD|AUD)?)"
+    r"|Rs\.?\s*[\d,]+(?:\.\d+)?(?:\s*[kmb])?(?:\s*(hundreds?|thousands?|lakhs?|millions?|crores?|billions?))?"
+    r"|\b(USD|EUR|INR|GBP|JPY|CAD|AUD)\s+[\d,]+(?:\.\d+)?(?:\s*[kmb])?(?:\s*(hundreds?|thousands?|lakhs?|millions?|crores?|billions?))?",
+    re.IGNORECASE,
+)
+LEADING_WHITESPACE_PATTERN = re.compile(r"^\s*")
+CURRENCY_AMOUNT_PATTERN = re.compile(r"([\d,]+(?:\.\d+)?)([kmb])?", re.IGNORECASE)
+CURRENCY_SCALE_PATTERN = re.compile(r"\b(hundred|thousand|lakh|million|crore|billion)s?\b", re.IGNORECASE)
+CURRENCY_CODE_PREFIX_PATTERN = re.compile(r"([A-Z]{3})\s")
+RUPEE_WORD_PATTERN = re.compile(r"\brupees?\b", re.IGNORECASE)
+BARE_NUMBER_PATTERN = re.compile(r"\b(\d+)\b")
+HUNDRED_PATTERN = re.compile(r"hundred")
+RUPEES_S_PATTERN = re.compile(r"\brupees s\b")
+TRAILING_PUNCTUATION_PATTERN = re.compile(r"([^\w\s]+)(\s*)$")
+
+COMMA_NUMBER_PATTERN = re.compile(r"-?\b\d+(?:,\d+)*(?:\.\d+)?\b")
+DECIMAL_PATTERN = re.compile(r"\b\d+\.\d+\b")
+ROMAN_NUMERAL_PATTERN = re.compile(r"\b[IVXLCDM]+\b")
+
+ALPHANUMERIC_PATTERN = re.compile(r"\b[A-Z]{2}\s\d{2}\s[A-Z]{2}\s\d{4}\b|(?<!\w)[A-Z0-9-]+(?!\w)")
+ALPHANUMERIC_PLATE_PATTERN = re.compile(r"^[A-Z]{2}\s\d{2}\s[A-Z]{2}\s\d{4}$")
+DIGITS_THEN_LETTERS_PATTERN = re.compile(r"^\d+[A-Za-z]{1,3}$")
+LETTER_OR_DIGIT_GROUP_PATTERN = re.compile(r"[A-Za-z]+|\d+")
+
+VEHICLE_NUMBER_PATTERN = re.compile(r"\b([A-Z]{2})\s?([0-9]{2})\s?([A-Z]{1,2})\s?([0-9]{4})\b")
+
+NON_COMMA_NUMBER_PATTERN = re.compile(r"\b(?<!\d,)(\d{3}\s\d{3}|\d+)(?!,\d)\b")
+PIN_CODE_PATTERN = re.compile(r"^\d{3}\s\d{3}$")
+RADIX_PREFIX_PATTERN = re.compile(r"\b(0b|0o|0x)")
+
+# Bump whenever a change alters normalized output, so response caches keyed on
+# cache_fingerprint() stop serving results from older releases.
+NORMALIZER_VERSION = "1"
+
+# Shared by every normalizer that is not given its own cache. Keys are
+# (number type, number, to_lang, conversion kind), so 5 and 5.0 stay distinct.
+NUMBER_WORDS_CACHE = LRUCache(maxsize=4096)
+
+# (date text, to_lang) -> (date text, spoken date), or None when the date is left as is.
+DATE_WORDS_CACHE = LRUCache(maxsize=4096)
+
+# num2words keeps one converter per language and stores per-call state (the decimal
+# precision) on it, so concurrent conversions must not interleave.
+NUM2WORDS_LOCK = threading.Lock()
+
+# Languages with a precomputed digit -> word table for digit-by-digit readouts:
+# English plus the Indic languages handled by _indic_num_to_words_wrapper.
+DIGIT_WORD_LANGS = frozenset({"en", "hi", "ta", "te", "ml", "kn", "mr", "gu", "or", "od", "bn", "pa"})
+
+# Probe text for warmup(): an entity for every stage, so each stage's lazy imports,
+# regex paths and caches are exercised once per language. The radix prefix comes last
+# because it changes how later numbers are read.
+WARMUP_TEXT = (
+    "On 12/05/2024 at 10:30 AM, NASA paid ₹1,250.50 and USD 2.5M to A/C 1234 for the 3rd "
+    "time; call +91-98765-43210, PIN 560001, vehicle KA 05 AB 1234, 15th March 2024, "
+    "version 1.25, 1,00,000 people and 0x1F."
+)
+
+MEASUREMENT_UNITS = frozenset({
+    "watts", "ohms", "volts", "amperes", "kg", "lbs",
+    "meters", "feet", "liters", "gallons",
+})
+
+INVISIBLE_CHARACTERS_PATTERN = re.compile(r'[\u200C\u200D\u00A0\u00AD]')
+SLASH_PATTERN = re.compile(r'(?<!\d)/(?=\D)|(?<=\D)/(?=\d)|(?<=\D)/(?=\D)')
+QUOTE_PATTERN = re.compile(r"(?<=\s)['\"]|['\"](?=\s)|^['\"]|['\"]$")
+DASH_PATTERN = re.compile(r'[-–—]')
+WHITESPACE_PATTERN = re.compile(r'\s+')
 
 
 class OrpheusTextCleaner:
@@ -31,19 +161,19 @@ class OrpheusTextCleaner:
         return unicodedata.normalize('NFC', text)
     
     def _remove_invisible_characters(self, text: str) -> str:
-        return re.sub(r'[\u200C\u200D\u00A0\u00AD]', '', text)
+        return INVISIBLE_CHARACTERS_PATTERN.sub('', text)
     
     def _handle_slashes(self, text: str) -> str:
-        return re.sub(r'(?<!\d)/(?=\D)|(?<=\D)/(?=\d)|(?<=\D)/(?=\D)', ' ', text)
+        return SLASH_PATTERN.sub(' ', text)
 
     
     def _handle_quotes(self, text: str) -> str:
-        return re.sub(r"(?<=\s)['\"]|['\"](?=\s)|^['\"]|['\"]$", '', text)
+        return QUOTE_PATTERN.sub('', text)
 
     
     def _replace_punctuation(self, text: str) -> str:
         text = text.replace(':', ',').replace(';', ',')
-        return re.sub(r'[-–—]', ' ', text)
+        return DASH_PATTERN.sub(' ', text)
     
     def _filter_characters(self, text: str) -> str:
         return ''.join(
@@ -51,21 +181,328 @@ class OrpheusTextCleaner:
             if c.lower() in VALID_CHARS or c in VALID_NUMBERS or c in PUNCTUATIONS
         )
     def _normalize_whitespace(self, text: str) -> str:
-        return re.sub(r'\s+', ' ', text).strip()
+        return WHITESPACE_PATTERN.sub(' ', text).strip()
+
+
+class _CleanerTranslationTable(dict):
+    """
+    str.translate table fusing punctuation mapping and character filtering.
+
+    Entries are filled in on first sight of each character, so the table never has
+    to enumerate the whole Unicode range up front.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._valid_chars = frozenset(VALID_CHARS)
+        self._kept = frozenset(VALID_NUMBERS) | frozenset(PUNCTUATIONS)
+
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        if char in ':;':
+            value = ','
+        elif char in '-–—':
+            value = ' '
+        elif char.lower() in self._valid_chars or char in self._kept:
+            value = char
+        else:
+            value = None
+        self[codepoint] = value
+        return value
+
+
+class CompiledOrpheusTextCleaner(OrpheusTextCleaner):
+    """
+    Drop-in OrpheusTextCleaner producing identical output in fewer passes.
+
+    NFC is skipped for already-normalized text, invisible characters go in one
+    translate, the slash and quote rules only run when those characters occur, and
+    punctuation mapping plus character filtering share a single translate.
+    """
+
+    _INVISIBLE_CHARACTERS_TABLE = dict.fromkeys(map(ord, '\u200C\u200D\u00A0\u00AD'))
+
+    def __init__(self):
+        self._table = _CleanerTranslationTable()
+
+    def __call__(self, text):
+        if not unicodedata.is_normalized('NFC', text):
+            text = unicodedata.normalize('NFC', text)
+        text = text.translate(self._INVISIBLE_CHARACTERS_TABLE)
+        if '/' in text:
+            text = SLASH_PATTERN.sub(' ', text)
+        if "'" in text or '"' in text:
+            text = QUOTE_PATTERN.sub('', text)
+        text = text.translate(self._table)
+        # Filtering leaves ' ' as the only whitespace character.
+        return ' '.join(text.split())
     
 
+class NormalizationPlan:
+    """
+    The stage pipeline for a single target language, built once per normalizer and
+    reused by every process_text call for that language.
+    """
+
+    def __init__(self, to_lang, stages, triggers=None, lexicon=None):
+        self.to_lang = to_lang
+        # (process_fn, entity_type) pairs; each process_fn has to_lang already bound.
+        self.stages = tuple(stages)
+        # Per stage, a pattern the text must contain for the stage to change anything,
+        # or None if the stage always runs.
+        self.triggers = tuple(triggers) if triggers is not None else (None,) * len(self.stages)
+        # Acronym lexicon snapshot the acronym stage's trigger came from.
+        self.lexicon = lexicon
+
+    def __iter__(self):
+        return iter(self.stages)
+
+    def __len__(self):
+        return len(self.stages)
+
+
+class _StageCountShard:
+    """One thread's prefilter (runs, skips) counters, owned by that thread's local storage."""
+
+    __slots__ = ("counts", "__weakref__")
+
+    def __init__(self):
+        self.counts = (Counter(), Counter())
+
+
+def _fold_stage_counts(lock, shards, totals, key):
+    """Move an exited thread's prefilter counters into the normalizer's totals."""
+    with lock:
+        runs, skips = shards.pop(key)
+        totals[0].update(runs)
+        totals[1].update(skips)
+
+
 class OrpheusTextNormalizer:
     """
     A comprehensive text preprocessing class for converting various text entities 
     to their spoken word equivalents across multiple languages.
+
+    One instance can be shared by any number of threads. Each call keeps its working
+    state (text, entity lists, prefilter memo) in locals; what the instance shares
+    between calls is either an immutable snapshot that is replaced as a whole (stage
+    plans, acronym lexicon, currency table, observers) or guarded by a lock (caches,
+    worker pools). Prefilter counters are kept per thread.
     """
+
+    # Processing stages for English
+    STAGES_EN = (
+        ("_process_dates", EntityType.DATE),
+        ("_process_time_and_duration", EntityType.TIME),
+        ("_process_currency_entities", EntityType.CURRENCY),
+        ("_process_numbers_to_words", EntityType.NUM_WITH_WORDS),
+        ("_process_phone_numbers_with_hyphens", EntityType.PHONE_NUMBERS),
+        ("_process_decimal_to_spoken", EntityType.DECIMAL),
+        ("_process_ordinal_to_word", EntityType.ORDINAL),
+        ("_process_vehicle_number", EntityType.VEHICLE_NUMBER),
+        ("_process_alphanumerics", EntityType.ALPHANUMERICS),
+        ("_process_non_comma_numbers", EntityType.NON_COMMA_NUMBERS),
+        ("_process_acronyms_read_out", EntityType.ACRONYMS_READ_OUT),
+    )
+
+    # Processing stages for other languages
+    STAGES_OTHERS = (
+        ("_process_dates", EntityType.DATE),
+        ("_process_time_and_duration", EntityType.TIME),
+        ("_process_currency_entities", EntityType.CURRENCY),
+        ("_process_numbers_to_words", EntityType.NUM_WITH_WORDS),
+        ("_process_phone_numbers_with_hyphens", EntityType.PHONE_NUMBERS),
+        ("_process_vehicle_number", EntityType.VEHICLE_NUMBER),
+        ("_process_decimal_to_spoken", EntityType.DECIMAL),
+        ("_process_non_comma_numbers", EntityType.NON_COMMA_NUMBERS), 
+        ("_process_alphanumerics", EntityType.ALPHANUMERICS),
+        ("_process_acronyms_read_out", EntityType.ACRONYMS_READ_OUT),
+    )
     
-    def __init__(self):
-        self.lang_mapping = {
+    # Patterns of the stages that apply more than one pass, in the order the stage applies
+    # them, used to put stitched segment entities back in whole-text order.
+    STAGE_PASSES = {
+        "_process_time_and_duration": (AM_PM_TIME_PATTERN, CLOCK_TIME_PATTERN, DURATION_PATTERN),
+    }
+
+    # Cheap precondition per stage (see NormalizationPlan.triggers). The acronym stage's
+    # trigger is the lexicon's own.
+    STAGE_TRIGGERS = {
+        "_process_dates": DIGIT_PATTERN,
+        "_process_time_and_duration": DIGIT_PATTERN,
+        "_process_currency_entities": DIGIT_PATTERN,
+        "_process_numbers_to_words": DIGIT_PATTERN,
+        "_process_phone_numbers_with_hyphens": DIGIT_PATTERN,
+        "_process_decimal_to_spoken": DIGIT_PATTERN,
+        "_process_ordinal_to_word": DIGIT_PATTERN,
+        "_process_vehicle_number": DIGIT_PATTERN,
+        "_process_alphanumerics": DIGIT_PATTERN,
+        "_process_non_comma_numbers": DIGIT_PATTERN,
+    }
+
+    def __init__(
+        self,
+        acronym_lexicon: AcronymLexicon = None,
+        number_words_cache: LRUCache = None,
+        response_cache: TieredResponseCache = None,
+        segment_cache: LRUCache = None,
+        prefilter: bool = True,
+    ):
+        self.lang_mapping = MappingProxyType({
             'od': 'or',
+        })
+        # Guards lazy initialization and copy-on-write updates of shared state.
+        self._lock = threading.Lock()
+        self._currency_table = None
+        self.text_cleaner=CompiledOrpheusTextCleaner()
+        self.acronym_lexicon = acronym_lexicon if acronym_lexicon is not None else AcronymLexicon()
+        self.number_words_cache = number_words_cache if number_words_cache is not None else NUMBER_WORDS_CACHE
+        self._plans = {}
+        self._digit_words = {}
+        self._process_pool = None
+        self._process_pool_workers = 0
+        self._thread_pool = None
+        self._thread_pool_workers = 0
+        self.observers = ()
+        self.response_cache = response_cache
+        self.segment_cache = segment_cache
+        self.prefilter = prefilter
+        # Prefilter counters, one (runs, skips) pair of Counters per live thread so that
+        # counting never contends; prefilter_stats() adds them up. A thread's pair is
+        # folded into _stage_count_totals when the thread exits.
+        self._stage_counts = threading.local()
+        self._stage_count_shards = {}
+        self._stage_count_totals = (Counter(), Counter())
+
+    def add_observer(self, observer):
+        """
+        Register a callable that receives a tracing.PipelineTrace after every process_text
+        call, e.g. a tracing.MetricsCollector or tracing.SpanRecorder. Stages are only
+        timed while at least one observer is registered.
+        """
+        with self._lock:
+            self.observers = (*self.observers, observer)
+        return observer
+
+    def remove_observer(self, observer):
+        with self._lock:
+            observers = list(self.observers)
+            observers.remove(observer)
+            self.observers = tuple(observers)
+
+    def cache_fingerprint(self) -> str:
+        """
+        Identifies everything besides the text and language that decides the output:
+        the normalizer version, acronym lexicon entries and currency table entries.
+        """
+        return f"{NORMALIZER_VERSION}:{self.acronym_lexicon.compiled.fingerprint}:{self.currency_table.fingerprint}"
+
+    @property
+    def currency_mapping(self) -> dict:
+        """Currency symbol/code -> ISO code mapping, loaded from the prebuilt table on first use."""
+        return self.currency_table.mapping
+
+    @currency_mapping.setter
+    def currency_mapping(self, mapping: dict):
+        """Swap in a new mapping. In-flight calls keep using the previous table."""
+        table = CurrencyTable(dict(mapping), load_currency_table().names)
+        with self._lock:
+            self._currency_table = table
+
+    @property
+    def currency_table(self) -> CurrencyTable:
+        """Index over currency_mapping with precomputed spoken currency names."""
+        table = self._currency_table
+        if table is None:
+            with self._lock:
+                if self._currency_table is None:
+                    self._currency_table = load_currency_table()
+                table = self._currency_table
+        return table
+
+    def get_plan(self, to_lang: str = "en") -> NormalizationPlan:
+        """Return the compiled stage plan for to_lang, building it on first use."""
+        lexicon = self.acronym_lexicon.compiled
+        plan = self._plans.get(to_lang)
+        if plan is None or plan.lexicon is not lexicon:
+            stages = self.STAGES_EN if to_lang == "en" else self.STAGES_OTHERS
+            plan = NormalizationPlan(
+                to_lang,
+                [(partial(getattr(self, name), to_lang=to_lang), entity_type) for name, entity_type in stages],
+                [
+                    lexicon.trigger if name == "_process_acronyms_read_out" else self.STAGE_TRIGGERS.get(name)
+                    for name, _ in stages
+                ],
+                lexicon,
+            )
+            self._plans[to_lang] = plan
+        return plan
+
+    def _stage_triggered(self, process_fn, trigger, text, present, counts) -> bool:
+        """
+        Whether a stage with this trigger can change text. present memoizes the answer per
+        trigger and must be cleared whenever a stage changes the text. Runs and skips are
+        counted in counts, this thread's pair from _thread_stage_counts().
+        """
+        if not self.prefilter or trigger is None:
+            return True
+        found = present.get(trigger)
+        if found is None:
+            found = present[trigger] = trigger.search(text) is not None
+        if counts is not None:
+            counts[not found][process_fn.func.__name__] += 1
+        return found
+
+    def _thread_stage_counts(self):
+        """This thread's (runs, skips) Counter pair, or None when the prefilter is off."""
+        if not self.prefilter:
+            return None
+        shard = getattr(self._stage_counts, "shard", None)
+        if shard is None:
+            shard = self._stage_counts.shard = _StageCountShard()
+            with self._lock:
+                self._stage_count_shards[id(shard)] = shard.counts
+            # The thread-local slot is cleared when the thread exits, which drops the shard.
+            weakref.finalize(
+                shard, _fold_stage_counts, self._lock, self._stage_count_shards, self._stage_count_totals, id(shard)
+            )
+        return shard.counts
+
+    def _sum_stage_counts(self, index) -> Counter:
+        # Other threads keep adding keys to their shards, so each shard is copied with
+        # dict(), a single copy that never sees a shard change size mid-iteration, and
+        # only those copies are summed.
+        with self._lock:
+            total = Counter(self._stage_count_totals[index])
+            snapshots = [dict(counts[index]) for counts in self._stage_count_shards.values()]
+        for snapshot in snapshots:
+            total.update(snapshot)
+        return total
+
+    @property
+    def stage_runs(self) -> Counter:
+        """Times each prefiltered stage ran, over all threads."""
+        return self._sum_stage_counts(0)
+
+    @property
+    def stage_skips(self) -> Counter:
+        """Times each prefiltered stage was skipped, over all threads."""
+        return self._sum_stage_counts(1)
+
+    def prefilter_stats(self) -> dict:
+        """How often each prefiltered stage ran and how often its trigger let it be skipped."""
+        stage_runs, stage_skips = self.stage_runs, self.stage_skips
+        return {
+            stage: {"runs": stage_runs[stage], "skipped": stage_skips[stage]}
+            for stage in dict.fromkeys([*stage_runs, *stage_skips])
         }
-        self.currency_mapping = self._get_currency_mapping()
-        self.text_cleaner=OrpheusTextCleaner()
+
+    def reset_prefilter_stats(self):
+        """Zero the prefilter counters of every thread."""
+        with self._lock:
+            for runs, skips in [self._stage_count_totals, *self._stage_count_shards.values()]:
+                runs.clear()
+                skips.clear()
         
     def process_text(self, text: str, to_lang: str = "en") -> DeterministicPreTTSPreprocessingResponse:
         """
@@ -78,66 +515,399 @@ class OrpheusTextNormalizer:
         Returns:
             DeterministicPreTTSPreprocessingResponse: Processed text with replacement entities
         """
+        if self.response_cache is not None:
+            return self._process_text_cached(text, to_lang)
+        return self._process_text_uncached(text, to_lang)
+
+    def process_text_lean(self, text: str, to_lang: str = "en", entities: bool = False) -> NormalizedText:
+        """
+        Hot-path variant of process_text that returns a NormalizedText tuple instead of
+        a validated pydantic response, and by default does not collect entities.
+
+        formatted_text is the same as process_text's. response_cache, segment_cache and
+        observers are not used; call .to_response() on the result for the pydantic model.
+
+        Args:
+            text (str): Input text to process
+            to_lang (str): Target language code (default: "en")
+            entities (bool): Also collect (original, replacement, entity_type) tuples
+
+        Returns:
+            NormalizedText: Processed text, with replacement entities if requested
+        """
+        collected = [] if entities else None
+        formatted_text = self._run_sequential(text, to_lang, None, collected)
+        return NormalizedText(formatted_text, tuple(collected) if entities else ())
+
+    def _process_text_uncached(self, text: str, to_lang: str = "en") -> DeterministicPreTTSPreprocessingResponse:
+        if self.segment_cache is not None:
+            return self._process_text_segmented(text, to_lang)
+        return self._process_text_whole(text, to_lang)
+
+    def _process_text_whole(self, text: str, to_lang: str = "en") -> DeterministicPreTTSPreprocessingResponse:
+        if self.observers:
+            return self._process_text_observed(text, to_lang)
+        return self._process_text_sequential(text, to_lang)
+
+    def _process_text_cached(self, text: str, to_lang: str = "en") -> DeterministicPreTTSPreprocessingResponse:
+        """process_text through response_cache; only misses run the pipeline (and reach observers)."""
+        fingerprint = self.cache_fingerprint()
+        response = self.response_cache.get(text, to_lang, fingerprint)
+        if response is None:
+            response = self._process_text_uncached(text, to_lang)
+            self.response_cache.put(text, to_lang, fingerprint, response)
+        return response
+
+    def _process_text_segmented(self, text: str, to_lang: str = "en") -> DeterministicPreTTSPreprocessingResponse:
+        """
+        Segment-cache mode: normalize each sentence span on its own through segment_cache
+        and stitch the results into the response process_text gives for the whole text.
+
+        Entities are regrouped by stage, and within a stage by pass, so they come out in
+        the whole-text order; acronyms are deduplicated across sentences in lexicon order.
+        Texts with a single sentence, lexicons whose entries contain sentence punctuation,
+        and texts where a stage fails are processed as a whole instead. Observers only
+        see texts processed as a whole.
+        """
+        lexicon = self.acronym_lexicon.compiled
+        spans = sentence_spans(text)
+        if len(spans) == 1 or lexicon.has_sentence_punctuation:
+            return self._process_text_whole(text, to_lang)
+
+        plan = self.get_plan(to_lang)
+        fingerprint = self.cache_fingerprint()
+        try:
+            segments = [
+                self.segment_cache.get_or_compute(
+                    (text[start:end], to_lang, fingerprint),
+                    partial(self._normalize_segment, text[start:end], plan),
+                )
+                for start, end in spans
+            ]
+            all_replaced_entities = self._stitch_entities(plan, segments)
+        except Exception as e:
+            logging.warning(f"Segment-cache mode failed, processing the whole text. Error: {str(e)}")
+            return self._process_text_whole(text, to_lang)
+
+        return DeterministicPreTTSPreprocessingResponse(
+            formatted_text=" ".join(formatted for formatted, _ in segments if formatted),
+            replaced_entities=all_replaced_entities,
+        )
+
+    def _stitch_entities(self, plan: NormalizationPlan, segments) -> list:
+        """
+        Combine the per-stage entities of consecutive (formatted, stage entities) segment
+        results into the entity list process_text gives for the text they were cut from.
+        """
+        lexicon = plan.lexicon
         all_replaced_entities = []
-        
-        # Define processing functions for English
-        process_fns_en = [
-            (self._process_dates, EntityType.DATE),
-            (self._process_time_and_duration, EntityType.TIME),
-            (self._process_currency_entities, EntityType.CURRENCY),
-            (self._process_numbers_to_words, EntityType.NUM_WITH_WORDS),
-            (self._process_phone_numbers_with_hyphens, EntityType.PHONE_NUMBERS),
-            (self._process_decimal_to_spoken, EntityType.DECIMAL),
-            (self._process_ordinal_to_word, EntityType.ORDINAL),
-            (self._process_vehicle_number, EntityType.VEHICLE_NUMBER),
-            (self._process_alphanumerics, EntityType.ALPHANUMERICS),
-            (self._process_non_comma_numbers, EntityType.NON_COMMA_NUMBERS),
-            (self._process_acronyms_read_out, EntityType.ACRONYMS_READ_OUT),
-        ]
-        
-        # Define processing functions for other languages
-        process_fns_others = [
-            (self._process_dates, EntityType.DATE),
-            (self._process_time_and_duration, EntityType.TIME),
-            (self._process_currency_entities, EntityType.CURRENCY),
-            (self._process_numbers_to_words, EntityType.NUM_WITH_WORDS),
-            (self._process_phone_numbers_with_hyphens, EntityType.PHONE_NUMBERS),
-            (self._process_vehicle_number, EntityType.VEHICLE_NUMBER),
-            (self._process_decimal_to_spoken, EntityType.DECIMAL),
-            (self._process_non_comma_numbers, EntityType.NON_COMMA_NUMBERS), 
-            (self._process_alphanumerics, EntityType.ALPHANUMERICS),
-            (self._process_acronyms_read_out, EntityType.ACRONYMS_READ_OUT),
-        ]
+        for stage_index, (process_fn, entity_type) in enumerate(plan):
+            entities = [entity for _, stage_entities in segments for entity in stage_entities[stage_index]]
+            if entity_type == EntityType.ACRONYMS_READ_OUT:
+                keyed = {}
+                for entity in entities:
+                    keyed.setdefault(lexicon.entity_key(entity[0]), entity)
+                entities = lexicon.ordered_entities(keyed)
+            else:
+                passes = self.STAGE_PASSES.get(process_fn.func.__name__)
+                if passes:
+                    entities.sort(key=lambda entity: self._pass_index(passes, entity[0]))
+            all_replaced_entities.extend((r[0], r[1], entity_type) for r in entities)
+        return all_replaced_entities
+
+    def _normalize_segment(self, segment: str, plan: NormalizationPlan):
+        """Run every stage of plan over one segment, raising instead of returning partial text."""
+        stage_entities = []
+        present = {}
+        counts = self._thread_stage_counts()
+        for (process_fn, _), trigger in zip(plan, plan.triggers):
+            if not self._stage_triggered(process_fn, trigger, segment, present, counts):
+                stage_entities.append(())
+                continue
+            new_segment, replaced_entities = process_fn(segment)
+            if new_segment is not segment:
+                present.clear()
+            segment = new_segment
+            stage_entities.append(tuple(replaced_entities))
+        return self.text_cleaner(segment), tuple(stage_entities)
+
+    @staticmethod
+    def _pass_index(passes, original):
+        """Index of the first of a stage's passes whose pattern matches all of original."""
+        for index, pattern in enumerate(passes):
+            if pattern.fullmatch(original):
+                return index
+        return len(passes)
+
+    def _process_text_observed(self, text: str, to_lang: str = "en") -> DeterministicPreTTSPreprocessingResponse:
+        """process_text with every stage timed, reporting a PipelineTrace to each observer."""
+        stage_events = []
+        start_time_ns = time.time_ns()
+        start = time.perf_counter()
+        response = self._process_text_sequential(text, to_lang, stage_events)
+        trace = PipelineTrace(
+            to_lang=to_lang,
+            start_time_ns=start_time_ns,
+            start=start,
+            duration=time.perf_counter() - start,
+            input_length=len(text),
+            output_length=len(response.formatted_text),
+            entities=len(response.replaced_entities),
+            stages=tuple(stage_events),
+            # The last stage only failed if the pipeline gave up on the text.
+            error=stage_events[-1].error if stage_events else None,
+        )
+        for observer in self.observers:
+            try:
+                observer(trace)
+            except Exception as e:
+                logging.warning(f"Pipeline observer {observer!r} failed. Error: {str(e)}")
+        return response
+
+    def _process_text_sequential(self, text: str, to_lang: str = "en", stage_events: list = None) -> DeterministicPreTTSPreprocessingResponse:
+        """
+        Run the plan's stages one after another over the whole text, then clean it.
+        When stage_events is a list, a StageEvent is appended to it for every stage run.
+        """
+        all_replaced_entities = []
+        text = self._run_sequential(text, to_lang, stage_events, all_replaced_entities)
+        return DeterministicPreTTSPreprocessingResponse(
+            formatted_text=text, replaced_entities=all_replaced_entities
+        )
 
+    def _run_sequential(self, text: str, to_lang: str = "en", stage_events: list = None, entities: list = None) -> str:
+        """
+        Pipeline proper: returns the formatted text and, when entities is a
+        list, extends it with (original, replacement, entity_type) tuples. On error the
+        text as far as the pipeline got is returned.
+        """
         try:
             #text=self._clean_text(text)
-            process_fns = process_fns_en if to_lang == "en" else process_fns_others
-
-            for process_fn, entity_type in process_fns:
-                text, replaced_entities = process_fn(text, to_lang=to_lang)
-                replaced_entities = [
-                    (r[0], r[1], entity_type) for r in replaced_entities
-                ]
-                all_replaced_entities.extend(replaced_entities)
+            plan = self.get_plan(to_lang)
+            present = {}
+            counts = self._thread_stage_counts()
+            for (process_fn, entity_type), trigger in zip(plan, plan.triggers):
+                if not self._stage_triggered(process_fn, trigger, text, present, counts):
+                    continue
+                if stage_events is None:
+                    new_text, replaced_entities = process_fn(text)
+                else:
+                    new_text, replaced_entities = run_stage_traced(
+                        stage_events, process_fn.func.__name__, entity_type, process_fn, text
+                    )
+                if new_text is not text:
+                    present.clear()
+                text = new_text
+                if entities is not None:
+                    entities.extend((r[0], r[1], entity_type) for r in replaced_entities)
             
-            text=self.text_cleaner(text)
+            if stage_events is None:
+                text=self.text_cleaner(text)
+            else:
+                text = run_stage_traced(stage_events, "text_cleaner", None, self.text_cleaner, text)
             
         except Exception as e:
             logging.error(
                 f"Error during text preprocessing pipeline. Original text: '{text[:100]}...'. Error: {str(e)}",
                 exc_info=True,
             )
-            return DeterministicPreTTSPreprocessingResponse(
-                formatted_text=text, replaced_entities=all_replaced_entities
-            )
-        
-        return DeterministicPreTTSPreprocessingResponse(
-            formatted_text=text, replaced_entities=all_replaced_entities
-        )
+        return text
+
+    def compile_template(self, template: str, to_lang: str = "en", slots: dict = None) -> CompiledTemplate:
+        """
+        Precompile a str.format-style prompt template; see templates.CompiledTemplate.
+
+        Args:
+            template (str): Template with named fields, e.g. "₹{amount} debited on {date}"
+            to_lang (str): Target language code (default: "en")
+            slots (dict): Slot name -> EntityType for slots whose name does not give it
+
+        Returns:
+            CompiledTemplate: Call .render(**values) to normalize a filled template
+        """
+        return CompiledTemplate(self, template, to_lang, slots)
+
+    def open_stream(self, to_lang: str = "en") -> IncrementalNormalizer:
+        """
+        Start normalizing a text that arrives in chunks, such as an LLM token stream;
+        see incremental.IncrementalNormalizer.
+
+        Args:
+            to_lang (str): Target language code (default: "en")
+
+        Returns:
+            IncrementalNormalizer: Call .feed(chunk) per chunk and .flush() at the end
+        """
+        return IncrementalNormalizer(self, to_lang)
+
+    def iter_normalized(self, text: str, to_lang: str = "en"):
+        """
+        Normalize text one sentence at a time, yielding each chunk as soon as it is done.
+
+        Text is only split at boundaries no entity can cross (see
+        segmentation.sentence_spans), so joining the chunks with a space gives the
+        same formatted text as process_text.
+
+        Args:
+            text (str): Input text to process
+            to_lang (str): Target language code (default: "en")
+
+        Yields:
+            DeterministicPreTTSPreprocessingResponse: A normalized chunk and the entities replaced in it
+        """
+        for sentence in split_sentences(text):
+            response = self.process_text(sentence, to_lang=to_lang)
+            if response.formatted_text:
+                yield response
+
+    def process_batch(
+        self, texts, to_lang="en", workers: int = 1, chunksize: int = None, executor: str = "process"
+    ) -> list[DeterministicPreTTSPreprocessingResponse]:
+        """
+        Process many texts, normalizing each distinct (text, to_lang) pair only once.
+
+        With workers > 1 the distinct pairs are spread over a pool that is kept for
+        later batches until close() is called. A process pool's workers each build
+        their own normalizer once; a thread pool's workers share this normalizer,
+        which only scales on free-threaded Python builds.
+
+        Args:
+            texts (list[str]): Input texts to process
+            to_lang (str | list[str]): Target language for all texts, or one per text
+            workers (int): Number of workers; 1 processes in the calling thread
+            chunksize (int): Pairs handed to a worker process at a time (default: derived from batch size)
+            executor (str): "process" or "thread"
+
+        Returns:
+            list[DeterministicPreTTSPreprocessingResponse]: One response per input text, in input order
+        """
+        if executor not in ("process", "thread"):
+            raise ValueError(f"Unknown executor {executor!r}, expected 'process' or 'thread'")
+        texts = list(texts)
+        langs = [to_lang] * len(texts) if isinstance(to_lang, str) else list(to_lang)
+        if len(langs) != len(texts):
+            raise ValueError(f"Got {len(texts)} texts but {len(langs)} target languages")
+
+        pairs = list(zip(texts, langs))
+        unique_pairs = list(dict.fromkeys(pairs))
+
+        if workers <= 1 or len(unique_pairs) <= 1:
+            responses_by_pair = {(text, lang): self.process_text(text, to_lang=lang) for text, lang in unique_pairs}
+        elif executor == "thread":
+            pool = self._get_thread_pool(workers)
+            unique_texts, unique_langs = zip(*unique_pairs)
+            responses_by_pair = dict(zip(unique_pairs, pool.map(self.process_text, unique_texts, unique_langs)))
+        else:
+            responses_by_pair = {}
+            if self.response_cache is not None:
+                fingerprint = self.cache_fingerprint()
+                for text, lang in unique_pairs:
+                    response = self.response_cache.get(text, lang, fingerprint)
+                    if response is not None:
+                        responses_by_pair[(text, lang)] = response
+            pending_pairs = [pair for pair in unique_pairs if pair not in responses_by_pair]
+
+            if chunksize is None:
+                chunksize = max(1, len(pending_pairs) // (workers * 4))
+            pool = self._get_process_pool(workers)
+            for pair, response in zip(pending_pairs, pool.map(_process_in_batch_worker, pending_pairs, chunksize=chunksize)):
+                responses_by_pair[pair] = response
+                if self.response_cache is not None:
+                    # Workers already wrote the shared store; keep a copy in this process too.
+                    self.response_cache.put(*pair, fingerprint, response, memory_only=True)
+        responses = []
+        seen = set()
+        for pair in pairs:
+            response = responses_by_pair[pair]
+            # Repeated inputs get their own copy so callers can mutate results independently.
+            if pair in seen:
+                response = response.model_copy(deep=True)
+            seen.add(pair)
+            responses.append(response)
+        return responses
+
+    def _get_process_pool(self, workers):
+        with self._lock:
+            if self._process_pool is None or self._process_pool_workers != workers:
+                from concurrent.futures import ProcessPoolExecutor
+
+                if self._process_pool is not None:
+                    self._process_pool.shutdown()
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_batch_worker,
+                    initargs=(self.worker_config(),),
+                )
+                self._process_pool_workers = workers
+            return self._process_pool
+
+    def _get_thread_pool(self, workers):
+        with self._lock:
+            if self._thread_pool is None or self._thread_pool_workers != workers:
+                from concurrent.futures import ThreadPoolExecutor
+
+                if self._thread_pool is not None:
+                    self._thread_pool.shutdown()
+                self._thread_pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="normalizer")
+                self._thread_pool_workers = workers
+            return self._thread_pool
+
+    def worker_config(self) -> dict:
+        """Constructor arguments for building an equivalent normalizer in a worker process."""
+        return {"acronym_lexicon": self.acronym_lexicon, "response_cache": self.response_cache}
+
+    def warmup(self, langs=None, numbers=range(101), freeze: bool = False):
+        """
+        Do the work otherwise left to the first requests: import the number and date
+        libraries, load the currency table, build each language's stage plan and digit
+        table, cache the words for numbers, and run a probe text through every stage.
+        Call it in a server's parent process before forking workers, so the workers
+        share all of this copy-on-write instead of each building their own.
+
+        Args:
+            langs (Iterable[str]): Languages to prepare (default: DIGIT_WORD_LANGS)
+            numbers (Iterable[int]): Numbers whose words are cached for each language
+            freeze (bool): Finish with gc.freeze(), so that collections in forked workers
+                never write to, and so never copy, the memory of what was built here
+
+        Returns:
+            OrpheusTextNormalizer: This normalizer
+        """
+        import dateutil.parser  # noqa: F401
+        import indic_numtowords  # noqa: F401
+        import num2words  # noqa: F401
+
+        self.currency_table
+        for to_lang in sorted(DIGIT_WORD_LANGS) if langs is None else langs:
+            self.get_plan(to_lang)
+            self._get_digit_words(to_lang)
+            for number in numbers:
+                self._num_to_words_wrapper(number, to_lang=to_lang)
+            self.process_text_lean(WARMUP_TEXT, to_lang, entities=True).to_response()
+        if freeze:
+            gc.freeze()
+        return self
+
+    def close(self):
+        """Shut down the worker processes and threads started by process_batch, if any."""
+        with self._lock:
+            pools = (self._process_pool, self._thread_pool)
+            self._process_pool = self._thread_pool = None
+            self._process_pool_workers = self._thread_pool_workers = 0
+        for pool in pools:
+            if pool is not None:
+                pool.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
-    
     def _indic_num_to_words_wrapper(self, number, lang):
         """Convert numbers to words in Indic languages with decimal support."""
+        from indic_numtowords import num2words as indic_num_to_words
+
         number_str = str(number)
         
         if '.' not in number_str:
@@ -167,118 +937,207 @@ class OrpheusTextNormalizer:
         return f"{whole_words} {point_word} {' '.join(decimal_words)}"
 
     def _num_to_words_wrapper(self, number, to_lang='en', **kwargs):
-        """Universal number to words converter supporting multiple languages."""
+        """Universal number to words converter supporting multiple languages, memoized."""
+        kind = kwargs.get("to", "cardinal")
+        if len(kwargs) > ("to" in kwargs):
+            return self._convert_num_to_words(number, to_lang=to_lang, **kwargs)
+        return self.number_words_cache.get_or_compute(
+            (type(number), number, to_lang, kind),
+            partial(self._convert_num_to_words, number, to_lang=to_lang, **kwargs),
+        )
+
+    def _convert_num_to_words(self, number, to_lang='en', **kwargs):
+        from num2words import num2words
+
         if to_lang == 'en':
-            return num2words(number, **kwargs)
+            with NUM2WORDS_LOCK:
+                return num2words(number, **kwargs)
         elif to_lang == 'en_IN':
-            return num2words(number, lang=to_lang, **kwargs)
+            with NUM2WORDS_LOCK:
+                return num2words(number, lang=to_lang, **kwargs)
         else:
             return self._indic_num_to_words_wrapper(number, lang=to_lang)
 
+    def _get_digit_words(self, to_lang='en'):
+        """Return the digit -> word table for to_lang, covering ASCII and native-script digits."""
+        table = self._digit_words.get(to_lang)
+        if table is None:
+            if to_lang not in DIGIT_WORD_LANGS:
+                return {}
+            words = [self._num_to_words_wrapper(digit, to_lang=to_lang) for digit in range(10)]
+            table = {char: words[unicodedata.digit(char)] for char in VALID_NUMBERS}
+            self._digit_words[to_lang] = table
+        return table
+
+    def _digits_to_words(self, digits, to_lang='en'):
+        """Read a string of digits out one digit at a time."""
+        table = self._get_digit_words(to_lang)
+        return [
+            table[digit] if digit in table else self._num_to_words_wrapper(int(digit), to_lang=to_lang)
+            for digit in digits
+        ]
+
     def _process_ordinal_to_word(self, text, to_lang='en'):
         """Convert ordinal numbers (1st, 2nd, etc.) to words."""
         if to_lang != 'en':
             return text, []
         
         entities_replaced = []
-
-        def replace_ordinal(match):
-            num = int(match.group(1))
-            original = match.group(0)
-            replaced = self._num_to_words_wrapper(num, to="ordinal", to_lang=to_lang)
-            entities_replaced.append((original, replaced))
-            return replaced
-
-        pattern = r"\b(\d+)(st|nd|rd|th)\b"
-        modified_text = re.sub(pattern, replace_ordinal, text)
+        modified_text = ORDINAL_PATTERN.sub(
+            partial(self._replace_ordinal, to_lang=to_lang, entities=entities_replaced), text
+        )
         return modified_text, entities_replaced
 
+    def _replace_ordinal(self, match, to_lang, entities):
+        num = int(match.group(1))
+        original = match.group(0)
+        replaced = self._num_to_words_wrapper(num, to="ordinal", to_lang=to_lang)
+        entities.append((original, replaced))
+        return replaced
+
     def _process_dates(self, text, to_lang='en'):
         """Convert date formats to spoken words."""
         extracted_entities = []
+        replaced_text = DATE_PATTERN.sub(
+            partial(self._replace_date, to_lang=to_lang, entities=extracted_entities), text
+        )
+        return replaced_text, extracted_entities
 
-        def year_to_words(year):
-            if year < 2000:
-                return (
-                    self._num_to_words_wrapper(year // 100, to_lang=to_lang).replace("-", " ")
-                    + " "
-                    + self._num_to_words_wrapper(year % 100, to_lang=to_lang).replace("-", " ")
-                )
-            else:
-                return self._num_to_words_wrapper(year, to_lang=to_lang, to="year").replace("-", " ")
+    def _year_to_words(self, year, to_lang='en'):
+        if year < 2000:
+            return (
+                self._num_to_words_wrapper(year // 100, to_lang=to_lang).replace("-", " ")
+                + " "
+                + self._num_to_words_wrapper(year % 100, to_lang=to_lang).replace("-", " ")
+            )
+        else:
+            return self._num_to_words_wrapper(year, to_lang=to_lang, to="year").replace("-", " ")
 
-        def date_to_words(date, original, date_after_month=False, to_lang=to_lang):
-            parts = []
-            day_representation = self._num_to_words_wrapper(date.day, to="ordinal", to_lang=to_lang).replace("-", " ")
-            month_representation = date.strftime("%B")
-            
-            if date_after_month:
-                parts.append(month_representation)
-                parts.append(day_representation)
-            else:
-                parts.append(day_representation)
-                parts.append(month_representation)
+    def _date_to_words(self, date, original, date_after_month=False, to_lang='en'):
+        parts = []
+        day_representation = self._num_to_words_wrapper(date.day, to="ordinal", to_lang=to_lang).replace("-", " ")
+        month_representation = date.strftime("%B")
+        
+        if date_after_month:
+            parts.append(month_representation)
+            parts.append(day_representation)
+        else:
+            parts.append(day_representation)
+            parts.append(month_representation)
 
-            if date.year != 1900 and str(date.year) in original:
-                parts.append(year_to_words(date.year))
-            
-            return " ".join(parts)
-
-        def is_likely_measurement(text, start, end):
-            measurements = {
-                "watts", "ohms", "volts", "amperes", "kg", "lbs",
-                "meters", "feet", "liters", "gallons",
-            }
-            after = text[end:].strip().lower().split()
-            return after and after[0] in measurements
-
-        def replace_date(match):
-            original = match.group()
-            start, end = match.span()
-            if is_likely_measurement(text, start, end):
-                return original
-            
-            try:
-                ordinal_match = re.match(r"(\d+)(st|nd|rd|th)\s+(\w+)", original)
-                if ordinal_match:
-                    day = int(ordinal_match.group(1))
-                    month_name = ordinal_match.group(3)
-                    if day < 1 or day > 31:
-                        return original
-
-                    month = datetime.strptime(month_name, "%B").month
-                    if (month == 2 and day > 29) or (month in [4, 6, 9, 11] and day > 30):
-                        return original
-
-                time_info = re.search(r"\d{4}\s*hours", original)
-                if time_info:
-                    original = original.replace(time_info.group(), "").strip()
-
-                if re.match(r"\d{4}-\d{2}-\d{2}", original):
-                    date = datetime.strptime(original, "%Y-%m-%d")
-                else:
-                    date = parser.parse(original, dayfirst=True)
-                
-                date_after_month = True if to_lang in ['ta', 'kn', 'te', 'ml'] else False
-                if 1000 <= date.year <= 2100:
-                    replacement = date_to_words(date, original, date_after_month, to_lang=to_lang)
-                    extracted_entities.append((original, replacement))
-                    return replacement
-            except ValueError:
-                pass
+        if date.year != 1900 and str(date.year) in original:
+            parts.append(self._year_to_words(date.year, to_lang=to_lang))
+        
+        return " ".join(parts)
+
+    def _is_likely_measurement(self, text, start, end):
+        after = text[end:].strip().lower().split()
+        return after and after[0] in MEASUREMENT_UNITS
+
+    def _replace_date(self, match, to_lang, entities):
+        original = match.group()
+        start, end = match.span()
+        if self._is_likely_measurement(match.string, start, end):
             return original
 
-        date_pattern = (
-            r"\b(\d{1,2}(?:st|nd|rd|th)?[-/.]\d{1,2}[-/.]\d{4}|"
-            r"\d{4}[-/.]\d{2}[-/.]\d{2}|"
-            r"(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|"
-            r"Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+\d{1,2}(?:st|nd|rd|th)?,\s+\d{4}|"
-            r"\d{1,2}(?:st|nd|rd|th)?\s+(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|"
-            r"Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)(?:\s+\d{4})?)\b"
-        )
+        key = (original, to_lang)
+        entity = DATE_WORDS_CACHE.get(key, False)
+        if entity is False:
+            entity, cacheable = self._date_entity(original, to_lang)
+            if cacheable:
+                DATE_WORDS_CACHE.put(key, entity)
+        if entity is None:
+            return original
+        entities.append(entity)
+        return entity[1]
 
-        replaced_text = re.sub(date_pattern, replace_date, text, flags=re.IGNORECASE)
-        return replaced_text, extracted_entities
+    def _date_entity(self, original, to_lang):
+        """
+        (date text, spoken date) for a DATE_PATTERN match, or None if it is not a date,
+        and whether that can be cached: dateutil fills in missing fields from today's date.
+        """
+        cacheable = True
+        try:
+            ordinal_match = DATE_ORDINAL_PATTERN.match(original)
+            if ordinal_match:
+                day = int(ordinal_match.group(1))
+                month_name = ordinal_match.group(3)
+                if day < 1 or day > 31:
+                    return None, cacheable
+
+                month = FULL_MONTH_NUMBERS.get(month_name.lower())
+                if month is None:
+                    return None, cacheable
+                if (month == 2 and day > 29) or (month in [4, 6, 9, 11] and day > 30):
+                    return None, cacheable
+
+            time_info = DATE_HOURS_PATTERN.search(original)
+            if time_info:
+                original = original.replace(time_info.group(), "").strip()
+
+            date = self._parse_date(original)
+            if date is None:
+                from dateutil import parser
+
+                cacheable = False
+                date = parser.parse(original, dayfirst=True)
+            
+            date_after_month = True if to_lang in ['ta', 'kn', 'te', 'ml'] else False
+            if 1000 <= date.year <= 2100:
+                return (original, self._date_to_words(date, original, date_after_month, to_lang=to_lang)), cacheable
+        except ValueError:
+            pass
+        return None, cacheable
+
+    @staticmethod
+    def _parse_date(original):
+        """
+        Read a date in one of the common DATE_PATTERN shapes the way the slow path would:
+        strptime for Y-m-d, otherwise dateutil.parser.parse(original, dayfirst=True).
+        Returns None for shapes left to dateutil; raises ValueError for impossible dates.
+        """
+        match = DAY_FIRST_DATE_PATTERN.fullmatch(original)
+        if match:
+            return OrpheusTextNormalizer._day_first_date(int(match.group(1)), int(match.group(3)), int(match.group(4)))
+
+        match = YEAR_FIRST_DATE_PATTERN.fullmatch(original)
+        if match:
+            year, first, second = int(match.group(1)), int(match.group(3)), int(match.group(4))
+            if match.group(2) == "-":
+                return datetime(year, first, second)
+            return OrpheusTextNormalizer._day_first_date(first, second, year)
+
+        match = DAY_MONTH_DATE_PATTERN.fullmatch(original)
+        if match:
+            day, month_name, year = match.groups()
+        else:
+            match = MONTH_DAY_DATE_PATTERN.fullmatch(original)
+            if match is None:
+                return None
+            month_name, day, year = match.groups()
+        month = MONTH_NUMBERS.get(month_name.lower())
+        day = int(day)
+        # dateutil reads a number that cannot be a day as a year and takes the day from today.
+        if month is None or not 1 <= day <= 31:
+            return None
+        if year is None:
+            # dateutil fills in the current year, which decides whether 29 February exists.
+            if month == 2 and day == 29:
+                return None
+            return datetime(datetime.now().year, month, day)
+        # dateutil reads years below 1000 in "Month" shapes as two-digit years.
+        if int(year) < 1000:
+            return None
+        return datetime(int(year), month, day)
+
+    @staticmethod
+    def _day_first_date(first, second, year):
+        """dateutil's dayfirst reading of two numeric fields: day/month, or month/day if second > 12."""
+        if second <= 12:
+            return datetime(year, second, first)
+        if first <= 12:
+            return datetime(year, first, second)
+        raise ValueError(f"no month in {first}/{second}")
 
     def _time_to_words(self, time, to_lang='en'):
         """Convert time format to spoken words."""
@@ -288,7 +1147,7 @@ class OrpheusTextNormalizer:
             'बजे': ''
         }
 
-        am_pm_match = re.match(r"(?<!\w)(1[0-2]|0?[1-9])(?::([0-5][0-9]))?\s*(am|pm|बजे)(?!\w)", time.lower())
+        am_pm_match = AM_PM_TIME_LOWER_PATTERN.match(time.lower())
         if am_pm_match:
             hours = int(am_pm_match.group(1))
             minutes = int(am_pm_match.group(2) or 0)
@@ -323,32 +1182,28 @@ class OrpheusTextNormalizer:
     def _process_time_and_duration(self, text, to_lang='en'):
         """Process time and duration entities in text."""
         extracted_entities = []
+        replace_time = partial(self._replace_time, to_lang=to_lang, entities=extracted_entities)
 
-        def replace_time(match):
-            original = match.group()
-            replaced = self._time_to_words(original, to_lang=to_lang)
-            extracted_entities.append((original, replaced))
-            return replaced
-
-        def replace_duration(match):
-            original = match.group()
-            if 0 <= int(match.group(1)) <= 23 and 0 <= int(match.group(2)) <= 59:
-                replaced = self._duration_to_words(original)
-                extracted_entities.append((original, replaced))
-                return replaced
-            return original
+        for pattern in (AM_PM_TIME_PATTERN, CLOCK_TIME_PATTERN):
+            text = pattern.sub(replace_time, text)
 
-        time_patterns = [
-            r"(?<!\w)(1[0-2]|0?[1-9])(?::([0-5][0-9]))?\s*(am|pm|बजे)(?!\w)",
-            r"\b([01]?[0-9]|2[0-3]):[0-5][0-9]\b",
-        ]
-        
-        for pattern in time_patterns:
-            text = re.sub(pattern, replace_time, text, flags=re.IGNORECASE)
-
-        text = re.sub(r"\b([01]?[0-9]|2[0-3]):([0-5][0-9])\b", replace_duration, text)
+        text = DURATION_PATTERN.sub(partial(self._replace_duration, to_lang=to_lang, entities=extracted_entities), text)
         return text, extracted_entities
 
+    def _replace_time(self, match, to_lang, entities):
+        original = match.group()
+        replaced = self._time_to_words(original, to_lang=to_lang)
+        entities.append((original, replaced))
+        return replaced
+
+    def _replace_duration(self, match, to_lang, entities):
+        original = match.group()
+        if 0 <= int(match.group(1)) <= 23 and 0 <= int(match.group(2)) <= 59:
+            replaced = self._duration_to_words(original)
+            entities.append((original, replaced))
+            return replaced
+        return original
+
     def _number_to_spoken(self, number):
         """Convert phone number digits to spoken words."""
         digit_to_word = {
@@ -361,7 +1216,7 @@ class OrpheusTextNormalizer:
             spoken.append("plus")
             number = number[1:]
 
-        number = re.sub(r"\D", "", number)
+        number = NON_DIGIT_PATTERN.sub("", number)
         for i in range(0, len(number), 4):
             chunk = number[i:i + 4]
             spoken_chunk = " ".join(digit_to_word[d] for d in chunk)
@@ -370,55 +1225,43 @@ class OrpheusTextNormalizer:
         return ", ".join(spoken)
     
     def _process_phone_numbers_with_hyphens(self, text, to_lang='en'):
-
-        def num_to_words(num):
-            words = []
-            current_group = []
-
-            for char in num:
-                if char == "+":
-                    words.append("plus")
-                elif char.isdigit():
-                    current_group.append(self._num_to_words_wrapper(char, to_lang=to_lang))
-                elif char in "-() ":
-                    if current_group:
-                        words.extend(self._process_group(current_group))
-                        current_group = []
-                    # Comma removed here
-
-            if current_group:
-                words.extend(self._process_group(current_group))
-
-            return " ".join(words)
-
-        phone_pattern = re.compile(
-            r"""
-            (?:
-                (?:\+?\d{1,3}[-\s]?)?
-                (?:\d{1,4}[-\s]?)?
-                (?:\(\d{2,4}\)|\d{2,4})
-                (?:[-\s]?\d{1,4}){0,4}
-            )
-            """, re.VERBOSE
-        )
-
-        date_pattern = re.compile(
-            r"\b(\d{1,2}[-/]\d{1,2}[-/]\d{2,4}|\d{4}[-/]\d{1,2}[-/]\d{1,2})\b"
-        )
-
         replacements = []
-
-        def replace_func(match):
-            match_text = match.group(0)
-            if len(match_text) < 8 or date_pattern.match(match_text):
-                return match_text
-            spoken = num_to_words(match_text)
-            replacements.append((match_text, spoken))
-            return spoken
-
-        formatted_text = phone_pattern.sub(replace_func, text)
+        formatted_text = PHONE_PATTERN.sub(
+            partial(self._replace_phone_number, to_lang=to_lang, entities=replacements), text
+        )
         return formatted_text, tuple(replacements)
 
+    def _phone_number_to_words(self, num, to_lang='en'):
+        words = []
+        current_group = []
+        digit_words = self._get_digit_words(to_lang)
+
+        for char in num:
+            if char == "+":
+                words.append("plus")
+            elif char in digit_words:
+                current_group.append(digit_words[char])
+            elif char.isdigit():
+                current_group.append(self._num_to_words_wrapper(int(char), to_lang=to_lang))
+            elif char in "-() ":
+                if current_group:
+                    words.extend(self._process_group(current_group))
+                    current_group = []
+                # Comma removed here
+
+        if current_group:
+            words.extend(self._process_group(current_group))
+
+        return " ".join(words)
+
+    def _replace_phone_number(self, match, to_lang, entities):
+        match_text = match.group(0)
+        if len(match_text) < 8 or PHONE_DATE_PATTERN.match(match_text):
+            return match_text
+        spoken = self._phone_number_to_words(match_text, to_lang=to_lang)
+        entities.append((match_text, spoken))
+        return spoken
+
     def _process_group(self, group):
         """Helper method for processing phone number groups."""
         if len(group) <= 4:
@@ -430,17 +1273,6 @@ class OrpheusTextNormalizer:
             result.append(word)
         return result
 
-    def _get_currency_mapping(self):
-        """Get currency symbol to code mapping."""
-        currency_mapping = {}
-        for currency in pycountry.currencies:
-            currency_mapping[currency.alpha_3] = currency.alpha_3
-            if hasattr(currency, "numeric"):
-                symbol = numbers.get_currency_symbol(currency.alpha_3, locale="en_US")
-                if symbol != currency.alpha_3:
-                    currency_mapping[symbol] = currency.alpha_3
-        return currency_mapping
-
     def _word_to_number(self, word):
         """Convert scale words to numbers."""
         scale = {
@@ -548,139 +1380,130 @@ class OrpheusTextNormalizer:
     def _process_currency_entities(self, text, to_lang='en'):
         """Normalize currency expressions into spoken format."""
         extracted_replacements = []
+        replaced_text = CURRENCY_PATTERN.sub(
+            partial(self._replace_currency, to_lang=to_lang, entities=extracted_replacements), text
+        )
+        return replaced_text, extracted_replacements
 
-        def replace_currency(match):
-            full_match = match.group(0)
-            leading_whitespace = re.match(r"^\s*", full_match).group(0)
-            core_match = full_match[len(leading_whitespace):]
-
-            # Extract number and optional suffix like k/m/b
-            amount_str = re.search(r"([\d,]+(?:\.\d+)?)([kmb])?", core_match, re.IGNORECASE)
-            if not amount_str or not amount_str.group(1):
-                return full_match
-
-            amount_without_commas = amount_str.group(1).replace(",", "")
-            try:
-                amount = float(amount_without_commas)
-            except ValueError:
-                return full_match
-
-            # Apply short suffix scaling (k/m/b)
-            if amount_str.group(2):
-                amount *= self._word_to_number(amount_str.group(2))
-
-            # Apply scale words like crore, lakh, etc.
-            scale_words = re.findall(r"\b(hundred|thousand|lakh|million|crore|billion)s?\b", core_match, re.IGNORECASE)
-            if scale_words:
-                amount *= self._word_to_number(scale_words[0])  # Only take the first one
-
-            # Determine currency code
-            currency = next((cur for cur in self.currency_mapping if cur in core_match), None)
-            if not currency:
-                currency_match = re.match(r"([A-Z]{3})\s", core_match)
-                if currency_match and currency_match.group(1) in self.currency_mapping:
-                    currency = currency_match.group(1)
-                elif "Rs." in core_match or "₹" in core_match or re.search(r"\brupees?\b", core_match, re.IGNORECASE):
-                    currency = "INR"
-
-            if not currency:
-                return full_match
-
-            # Language-specific formatting
-            to_pass_lang = to_lang if to_lang != "en" else "en_IN"
-            amount_words = self._num_to_words_wrapper(amount, to="cardinal", to_lang=to_pass_lang).replace("-", " ")
-            amount_words = amount_words.capitalize()
-
-            # Insert 'and' for numbers like 1200 -> one thousand and two hundred
-            if "hundred" in amount_words and re.search(r"\b(\d+)\b", amount_words.split("hundred")[-1].strip()):
-                amount_words = re.sub(r"hundred", "hundred and", amount_words)
-
-            # Get currency name
-            currency_code = self.currency_mapping[currency]
-
-            if currency_code == "INR":
-                currency_name = "rupee" if amount == 1 else "rupees"
-            else:
-                try:
-                    currency_name = numbers.get_currency_name(currency_code, count=amount, locale="en_US")
-                except:
-                    currency_name = currency_code.lower()
-
-            # Build replacement
-            replaced_text = f"{amount_words} {currency_name}".strip()
-
-            # Fix overpluralization bug
-            replaced_text = re.sub(r"\brupees s\b", "rupees", replaced_text)
-
-            # Preserve trailing punctuation
-            punctuation_match = re.search(r"([^\w\s]+)(\s*)$", core_match)
-            if punctuation_match:
-                replaced_text += punctuation_match.group(1) + punctuation_match.group(2)
-            else:
-                replaced_text += " " if match.end() < len(text) and text[match.end()].isalnum() else ""
+    def _replace_currency(self, match, to_lang, entities):
+        text = match.string
+        full_match = match.group(0)
+        leading_whitespace = LEADING_WHITESPACE_PATTERN.match(full_match).group(0)
+        core_match = full_match[len(leading_whitespace):]
 
-            replaced_text = leading_whitespace + replaced_text
-            extracted_replacements.append((full_match, replaced_text))
-            return replaced_text
+        # Extract number and optional suffix like k/m/b
+        amount_str = CURRENCY_AMOUNT_PATTERN.search(core_match)
+        if not amount_str or not amount_str.group(1):
+            return full_match
 
-        # Patterns
-        currency_pattern = r"([₹$£€¥]?\s*[\d,.]+(?:\s*[kmb])?(?:\s*(hundreds?|thousands?|lakhs?|millions?|crores?|billions?|rupees?|rupee))?\s*(?:USD|EUR|INR|GBP|JPY|CAD|AUD)?)"
-        rs_pattern = r"Rs\.?\s*[\d,]+(?:\.\d+)?(?:\s*[kmb])?(?:\s*(hundreds?|thousands?|lakhs?|millions?|crores?|billions?))?"
-        currency_code_prefix_pattern = r"\b(USD|EUR|INR|GBP|JPY|CAD|AUD)\s+[\d,]+(?:\.\d+)?(?:\s*[kmb])?(?:\s*(hundreds?|thousands?|lakhs?|millions?|crores?|billions?))?"
+        amount_without_commas = amount_str.group(1).replace(",", "")
+        try:
+            amount = float(amount_without_commas)
+        except ValueError:
+            return full_match
+
+        # Apply short suffix scaling (k/m/b)
+        if amount_str.group(2):
+            amount *= self._word_to_number(amount_str.group(2))
+
+        # Apply scale words like crore, lakh, etc.
+        scale_words = CURRENCY_SCALE_PATTERN.findall(core_match)
+        if scale_words:
+            amount *= self._word_to_number(scale_words[0])  # Only take the first one
+
+        # Determine currency code
+        currency_table = self.currency_table
+        currency = currency_table.find(core_match)
+        if not currency:
+            currency_match = CURRENCY_CODE_PREFIX_PATTERN.match(core_match)
+            if currency_match and currency_match.group(1) in currency_table.mapping:
+                currency = currency_match.group(1)
+            elif "Rs." in core_match or "₹" in core_match or RUPEE_WORD_PATTERN.search(core_match):
+                currency = "INR"
+
+        if not currency:
+            return full_match
+
+        # Language-specific formatting
+        to_pass_lang = to_lang if to_lang != "en" else "en_IN"
+        amount_words = self._num_to_words_wrapper(amount, to="cardinal", to_lang=to_pass_lang).replace("-", " ")
+        amount_words = amount_words.capitalize()
+
+        # Insert 'and' for numbers like 1200 -> one thousand and two hundred
+        if "hundred" in amount_words and BARE_NUMBER_PATTERN.search(amount_words.split("hundred")[-1].strip()):
+            amount_words = HUNDRED_PATTERN.sub("hundred and", amount_words)
+
+        # Get currency name
+        currency_code = currency_table.mapping[currency]
+
+        if currency_code == "INR":
+            currency_name = "rupee" if amount == 1 else "rupees"
+        else:
+            currency_name = currency_table.spoken_name(currency_code, amount)
 
-        # Combined pattern
-        combined_pattern = f"{currency_pattern}|{rs_pattern}|{currency_code_prefix_pattern}"
+        # Build replacement
+        replaced_text = f"{amount_words} {currency_name}".strip()
 
-        replaced_text = re.sub(combined_pattern, replace_currency, text, flags=re.IGNORECASE)
-        return replaced_text, extracted_replacements
+        # Fix overpluralization bug
+        replaced_text = RUPEES_S_PATTERN.sub("rupees", replaced_text)
 
+        # Preserve trailing punctuation
+        punctuation_match = TRAILING_PUNCTUATION_PATTERN.search(core_match)
+        if punctuation_match:
+            replaced_text += punctuation_match.group(1) + punctuation_match.group(2)
+        else:
+            replaced_text += " " if match.end() < len(text) and text[match.end()].isalnum() else ""
 
+        replaced_text = leading_whitespace + replaced_text
+        entities.append((full_match, replaced_text))
+        return replaced_text
 
-    
     def _process_numbers_to_words(self, text, to_lang='en'):
         """Process numbers with commas and convert to words."""
         extracted_replacements = []
+        replaced_text = COMMA_NUMBER_PATTERN.sub(
+            partial(self._replace_comma_number, to_lang=to_lang, entities=extracted_replacements), text
+        )
+        return replaced_text, extracted_replacements
 
-        def replace_number(match):
-            number_str = match.group()
-            if ',' in number_str:
-                cleaned_str = number_str.replace(",", "")
-                try:
-                    number = float(cleaned_str)
-                    to_pass_lang = to_lang if to_lang != "en" else "en_IN"
+    def _replace_comma_number(self, match, to_lang, entities):
+        number_str = match.group()
+        if ',' in number_str:
+            cleaned_str = number_str.replace(",", "")
+            try:
+                number = float(cleaned_str)
+                to_pass_lang = to_lang if to_lang != "en" else "en_IN"
+                
+                if number < 0:
+                    word = " minus " + self._num_to_words_wrapper(abs(number), to_lang=to_pass_lang).replace("-", " ")
+                else:
+                    word = self._num_to_words_wrapper(number, to_lang=to_pass_lang).replace("-", " ")
                     
-                    if number < 0:
-                        word = " minus " + self._num_to_words_wrapper(abs(number), to_lang=to_pass_lang).replace("-", " ")
-                    else:
-                        word = self._num_to_words_wrapper(number, to_lang=to_pass_lang).replace("-", " ")
-                        
-                    extracted_replacements.append((number_str, word))
-                    return word
-                except ValueError:
-                    return number_str
-            else:
+                entities.append((number_str, word))
+                return word
+            except ValueError:
                 return number_str
-
-        pattern = r"-?\b\d+(?:,\d+)*(?:\.\d+)?\b"
-        replaced_text = re.sub(pattern, replace_number, text)
-        return replaced_text, extracted_replacements
+        else:
+            return number_str
 
     def _process_decimal_to_spoken(self, text, to_lang='en'):
         """Process decimal numbers and convert to spoken format."""
         extracted_entities = []
-
-        def replace_decimal(match):
-            integer_part, decimal_part = match.group().split(".")
-            to_pass_lang = to_lang if to_lang != "en" else "en_IN"  
-            spoken_decimal = self._num_to_words_wrapper(float(match.group()), to_lang=to_pass_lang)
-            extracted_entities.append((match.group(), spoken_decimal))
-            return spoken_decimal
-
-        replaced_text = re.sub(r"\b\d+\.\d+\b", replace_decimal, text)
+        replaced_text = DECIMAL_PATTERN.sub(
+            partial(self._replace_decimal, to_lang=to_lang, entities=extracted_entities), text
+        )
         return replaced_text, extracted_entities
 
+    def _replace_decimal(self, match, to_lang, entities):
+        to_pass_lang = to_lang if to_lang != "en" else "en_IN"  
+        spoken_decimal = self._num_to_words_wrapper(float(match.group()), to_lang=to_pass_lang)
+        entities.append((match.group(), spoken_decimal))
+        return spoken_decimal
+
     def _replace_roman_numerals(self, text):
         """Replace Roman numerals with word equivalents."""
+        import roman
+
         entities_extracted_replaced = []
 
         def replace(match):
@@ -693,8 +1516,7 @@ class OrpheusTextNormalizer:
             except roman.InvalidRomanNumeralError:
                 return roman_numeral
 
-        pattern = r"\b[IVXLCDM]+\b"
-        replaced_text = re.sub(pattern, replace, text)
+        replaced_text = ROMAN_NUMERAL_PATTERN.sub(replace, text)
         return replaced_text, entities_extracted_replaced
 
     """def _process_alphanumerics(self, sentence, to_lang='en'):
@@ -734,51 +1556,47 @@ class OrpheusTextNormalizer:
     def _process_alphanumerics(self, sentence, to_lang='en'):
         """Process alphanumeric entities like vehicle numbers and IDs."""
         extracted_entities = []
+        # Pattern: Vehicle numbers or uppercase alphanumerics
+        replaced_text = ALPHANUMERIC_PATTERN.sub(
+            partial(self._replace_alphanumeric, to_lang=to_lang, entities=extracted_entities), sentence
+        )
+        return replaced_text, tuple(extracted_entities)
 
-        def process_match(match):
-            s = match.group(0)
-
-            # Case 1: Specific format like vehicle numbers (e.g., KA 05 AB 1234)
-            if re.match(r"^[A-Z]{2}\s\d{2}\s[A-Z]{2}\s\d{4}$", s):
-                words = s.split()
-                replaced_words = []
-                for word in words:
-                    for char in word:
-                        if char.isalpha():
-                            replaced_words.append(char)
-                        else:
-                            replaced_words.append(self._num_to_words_wrapper(int(char), to_lang=to_lang))
-                replaced_value = self._add_commas(replaced_words)
-                extracted_entities.append((s, replaced_value))
-                return replaced_value
-
-            # Case 2: General alphanumerics like AMZ9900876, PNR567
-            if any(char.isalpha() for char in s) and any(char.isdigit() for char in s):
-                # Skip digit+letters like 123ABC if needed
-                if re.match(r"^\d+[A-Za-z]{1,3}$", s):
-                    return s
-
-                # Split into letter and digit groups
-                groups = re.findall(r'[A-Za-z]+|\d+', s)
-                replaced_words = []
-                for group in groups:
-                    if group.isalpha():
-                        replaced_words.extend(list(group))
-                    else:
-                        replaced_words.extend([
-                            self._num_to_words_wrapper(int(d), to_lang=to_lang)
-                            for d in group
-                        ])
-                replaced_value = self._merge_with_spaces(replaced_words)
-                extracted_entities.append((s, replaced_value))
-                return replaced_value
+    def _replace_alphanumeric(self, match, to_lang, entities):
+        s = match.group(0)
 
-            return s
+        # Case 1: Specific format like vehicle numbers (e.g., KA 05 AB 1234)
+        if ALPHANUMERIC_PLATE_PATTERN.match(s):
+            words = s.split()
+            replaced_words = []
+            for word in words:
+                if word.isalpha():
+                    replaced_words.extend(word)
+                else:
+                    replaced_words.extend(self._digits_to_words(word, to_lang=to_lang))
+            replaced_value = self._add_commas(replaced_words)
+            entities.append((s, replaced_value))
+            return replaced_value
+
+        # Case 2: General alphanumerics like AMZ9900876, PNR567
+        if any(char.isalpha() for char in s) and any(char.isdigit() for char in s):
+            # Skip digit+letters like 123ABC if needed
+            if DIGITS_THEN_LETTERS_PATTERN.match(s):
+                return s
+
+            # Split into letter and digit groups
+            groups = LETTER_OR_DIGIT_GROUP_PATTERN.findall(s)
+            replaced_words = []
+            for group in groups:
+                if group.isalpha():
+                    replaced_words.extend(list(group))
+                else:
+                    replaced_words.extend(self._digits_to_words(group, to_lang=to_lang))
+            replaced_value = self._merge_with_spaces(replaced_words)
+            entities.append((s, replaced_value))
+            return replaced_value
 
-        # Pattern: Vehicle numbers or uppercase alphanumerics
-        pattern = r"\b[A-Z]{2}\s\d{2}\s[A-Z]{2}\s\d{4}\b|(?<!\w)[A-Z0-9-]+(?!\w)"
-        replaced_text = re.sub(pattern, process_match, sentence)
-        return replaced_text, tuple(extracted_entities)
+        return s
 
     def _add_commas(self, words):
         """Add commas to word lists for better readability."""
@@ -800,169 +1618,101 @@ class OrpheusTextNormalizer:
 
     def _process_vehicle_number(self, text, to_lang='en'):
         """Process vehicle number plates."""
-        def add_space_between_letters(text):
-            return " ".join(text)
-
-        def replace_format(match):
-            parts = match.group(0).replace(" ", "")
-            state = add_space_between_letters(parts[:2])
-            district = " ".join(self._num_to_words_wrapper(int(digit), to_lang=to_lang) for digit in parts[2:4])
-            series = add_space_between_letters(parts[4:-4])
-            number = " ".join(self._num_to_words_wrapper(int(digit), to_lang=to_lang) for digit in parts[-4:])
-            return f"{state} {district} {series} {number}"
-
-        pattern = r"\b([A-Z]{2})\s?([0-9]{2})\s?([A-Z]{1,2})\s?([0-9]{4})\b"
         replaced_entities = []
-
-        def replacement_func(match):
-            original = match.group(0)
-            replaced = replace_format(match)
-            replaced_entities.append((original, replaced))
-            return replaced
-
-        new_text = re.sub(pattern, replacement_func, text)
+        new_text = VEHICLE_NUMBER_PATTERN.sub(
+            partial(self._replace_vehicle_number, to_lang=to_lang, entities=replaced_entities), text
+        )
         return new_text, replaced_entities
+
+    def _replace_vehicle_number(self, match, to_lang, entities):
+        original = match.group(0)
+        parts = original.replace(" ", "")
+        state = " ".join(parts[:2])
+        district = " ".join(self._digits_to_words(parts[2:4], to_lang=to_lang))
+        series = " ".join(parts[4:-4])
+        number = " ".join(self._digits_to_words(parts[-4:], to_lang=to_lang))
+        replaced = f"{state} {district} {series} {number}"
+        entities.append((original, replaced))
+        return replaced
     
     def _process_non_comma_numbers(self, text, to_lang='en'):
-        def replace_number(match):
-            num_str = match.group()
-
-            def convert_and_format(n):
-                return self._num_to_words_wrapper(n, to_lang=to_lang).replace("-", " ")
-
-            def add_commas_to_words(words):
-                if len(words.split()) > 4:
-                    word_groups = [
-                        words.split()[i : i + 3]
-                        for i in range(0, len(words.split()), 3)
-                    ]
-                    return ", ".join(" ".join(group) for group in word_groups)
-                return words
-
-            # Check if it's a pin code format (e.g., 400 001)
-            if re.match(r"^\d{3}\s\d{3}$", num_str):
-                digits = "".join(digit for digit in num_str if digit.isdigit())
-                worded = " ".join(
-                    convert_and_format(int(digit)) for digit in digits
-                )
-                return add_commas_to_words(worded)
+        replacements = []
+        processed_text = NON_COMMA_NUMBER_PATTERN.sub(
+            partial(self._replace_non_comma_number, to_lang=to_lang, entities=replacements), text
+        )
 
-            # For numbers with leading zeros or all zeros, read digit by digit
-            if num_str.startswith("0") or all(digit == "0" for digit in num_str):
-                worded = " ".join(
-                    convert_and_format(int(digit)) for digit in num_str
-                )
-                replacement = add_commas_to_words(worded)
-            else:
-                # For all other cases, convert to int
-                num = int(num_str.replace(" ", ""))
-
-                # Check if it's a year (4 digits between 1980 and 2050)
-                if len(num_str) == 4 and 1980 <= num <= 2050:
-                    replacement = convert_and_format(num)
-
-                # For numbers with more than 4 digits, add commas and read out digit-wise
-                elif len(num_str) > 4:
-                    worded = " ".join(
-                        convert_and_format(int(digit))
-                        for digit in num_str
-                        if digit.isdigit()
-                    )
-                    replacement = add_commas_to_words(worded)
+        return (processed_text, tuple(replacements))
 
-                # For binary, octal, or hexadecimal representations
-                elif re.search(r"\b(0b|0o|0x)", match.string[: match.start()]):
-                    replacement = " ".join(
-                        convert_and_format(int(digit)) for digit in num_str
-                    )
+    def _add_commas_to_words(self, words):
+        if len(words.split()) > 4:
+            word_groups = [
+                words.split()[i : i + 3]
+                for i in range(0, len(words.split()), 3)
+            ]
+            return ", ".join(" ".join(group) for group in word_groups)
+        return words
+
+    def _replace_non_comma_number(self, match, to_lang, entities):
+        num_str = match.group()
+
+        def convert_and_format(n):
+            return self._num_to_words_wrapper(n, to_lang=to_lang).replace("-", " ")
+
+        # Check if it's a pin code format (e.g., 400 001)
+        if PIN_CODE_PATTERN.match(num_str):
+            digits = "".join(digit for digit in num_str if digit.isdigit())
+            worded = " ".join(self._digits_to_words(digits, to_lang=to_lang))
+            return self._add_commas_to_words(worded)
+
+        # For numbers with leading zeros or all zeros, read digit by digit
+        if num_str.startswith("0") or all(digit == "0" for digit in num_str):
+            worded = " ".join(self._digits_to_words(num_str, to_lang=to_lang))
+            replacement = self._add_commas_to_words(worded)
+        else:
+            # For all other cases, convert to int
+            num = int(num_str.replace(" ", ""))
+
+            # Check if it's a year (4 digits between 1980 and 2050)
+            if len(num_str) == 4 and 1980 <= num <= 2050:
+                replacement = convert_and_format(num)
 
-                # For numbers 1000-9999 (excluding years in the specified range)
-                elif 1000 <= num <= 9999:
-                    replacement = " ".join(
-                        convert_and_format(int(digit)) for digit in num_str
+            # For numbers with more than 4 digits, add commas and read out digit-wise
+            elif len(num_str) > 4:
+                worded = " ".join(
+                    self._digits_to_words(
+                        (digit for digit in num_str if digit.isdigit()), to_lang=to_lang
                     )
+                )
+                replacement = self._add_commas_to_words(worded)
 
-                # For all other numbers
-                else:
-                    replacement = convert_and_format(num)
+            # For binary, octal, or hexadecimal representations
+            elif RADIX_PREFIX_PATTERN.search(match.string[: match.start()]):
+                replacement = " ".join(self._digits_to_words(num_str, to_lang=to_lang))
 
-            replacements.append((num_str, replacement))
-            return replacement
+            # For numbers 1000-9999 (excluding years in the specified range)
+            elif 1000 <= num <= 9999:
+                replacement = " ".join(self._digits_to_words(num_str, to_lang=to_lang))
 
-        replacements = []
-        pattern = r"\b(?<!\d,)(\d{3}\s\d{3}|\d+)(?!,\d)\b"
-        processed_text = re.sub(pattern, replace_number, text)
+            # For all other numbers
+            else:
+                replacement = convert_and_format(num)
 
-        return (processed_text, tuple(replacements))
+        entities.append((num_str, replacement))
+        return replacement
 
     def _process_acronyms_read_out(self, input_string, to_lang='en'):
-        words_to_replace = [
-            "AADHAAR",
-            "AADHAR",
-            "NITI Aayog",
-            "ISRO",
-            "NABARD",
-            "NASSCOM",
-            "SEBI",
-            "NIFT",
-            "NIMHANS",
-            "AIIMS",
-            "BARC",
-            "TRAI",
-            "BHEL",
-            "SAIL",
-            "GAIL",
-            "NHAI",
-            "CREDAI",
-            "ASSOCHAM",
-            "NASSCOM",
-            "UIDAI",
-            "NITI",
-            "NABI",
-            "BITS",
-            "TERI",
-            "HUDCO",
-            "NALCO",
-            "BALCO",
-            "CIDCO",
-            "ICAR",
-            "AMUL",
-            "HAL",
-            "e-NACH",
-            "NASDAQ",
-            "SENSEX",
-            "CIBIL",
-            "NIFTY",
-            "PAN",
-        ]
-
-        extracted_replaced = []
-        modified_string = input_string
-
-        for word in words_to_replace:
-            # Replace word + "'s"
-            pattern = rf"\b{re.escape(word)}\'s\b"
-            if re.search(pattern, modified_string):
-                replacement = f"{word.lower()}s"
-                modified_string = re.sub(pattern, replacement, modified_string)
-                extracted_replaced.append((f"{word}'s", replacement))
-
-            # Replace word + "s"
-            pattern = rf"\b{re.escape(word)}s\b"
-            if re.search(pattern, modified_string):
-                replacement = f"{word.lower()}s"
-                modified_string = re.sub(pattern, replacement, modified_string)
-                extracted_replaced.append((f"{word}s", replacement))
+        return self.acronym_lexicon.replace(input_string)
 
-            # Replace the word itself
-            pattern = rf"\b{re.escape(word)}\b"
-            if re.search(pattern, modified_string):
-                replacement = word.lower()
-                modified_string = re.sub(pattern, replacement, modified_string)
-                extracted_replaced.append((word, replacement))
 
-        return (modified_string, tuple(extracted_replaced))
+# Per-process normalizer used by process_batch workers, built once by the pool initializer.
+_batch_worker_normalizer = None
 
 
+def _init_batch_worker(config):
+    global _batch_worker_normalizer
+    _batch_worker_normalizer = OrpheusTextNormalizer(**config)
 
 
+def _process_in_batch_worker(pair):
+    text, to_lang = pair
+    return _batch_worker_normalizer.process_text(text, to_lang=to_lang)
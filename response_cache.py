@@ -0,0 +1,188 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+from cache import LRUCache
+from schema import DeterministicPreTTSPreprocessingResponse
+
+
+def response_cache_key(text: str, to_lang: str, fingerprint: str) -> str:
+    """Stable key for a (text, to_lang, normalizer fingerprint) triple, usable across processes."""
+    return hashlib.sha256("\0".join((fingerprint, to_lang, text)).encode("utf-8")).hexdigest()
+
+
+class SQLiteResponseStore:
+    """
+    Response payloads in a SQLite file that every worker process on a host can share.
+
+    Entries expire ttl seconds after they were written. Once the store holds more
+    than max_entries, the oldest entries are evicted; expiry and eviction run every
+    evict_interval writes rather than on every write. Each process opens its own
+    connection on first use, so a store can be handed to pool workers.
+    """
+
+    def __init__(self, path: str, ttl: float = None, max_entries: int = 100_000, evict_interval: int = 256):
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.evict_interval = evict_interval
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._connection = None
+        self._pid = None
+
+    def __getstate__(self):
+        return {"path": self.path, "ttl": self.ttl, "max_entries": self.max_entries, "evict_interval": self.evict_interval}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def _connect(self):
+        if self._connection is None or self._pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, payload TEXT NOT NULL, created REAL NOT NULL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS responses_created ON responses (created)")
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    def get(self, key: str):
+        """Return the stored payload for key, or None if it is missing or expired."""
+        with self._lock:
+            row = self._connect().execute("SELECT payload, created FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None or (self.ttl is not None and time.time() - row[1] > self.ttl):
+                self.misses += 1
+                return None
+            self.hits += 1
+            return row[0]
+
+    def put(self, key: str, payload: str):
+        with self._lock:
+            connection = self._connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO responses (key, payload, created) VALUES (?, ?, ?)", (key, payload, time.time())
+            )
+            self.writes += 1
+            if self.writes % self.evict_interval == 0:
+                self._evict(connection)
+
+    def evict(self):
+        """Drop expired entries and trim the store to max_entries now."""
+        with self._lock:
+            self._evict(self._connect())
+
+    def _evict(self, connection):
+        evicted = 0
+        if self.ttl is not None:
+            evicted += connection.execute("DELETE FROM responses WHERE created < ?", (time.time() - self.ttl,)).rowcount
+        excess = connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0] - self.max_entries
+        if excess > 0:
+            evicted += connection.execute(
+                "DELETE FROM responses WHERE key IN (SELECT key FROM responses ORDER BY created LIMIT ?)", (excess,)
+            ).rowcount
+        self.evictions += evicted
+
+    def __len__(self):
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def clear(self):
+        """Delete every entry and reset the counters."""
+        with self._lock:
+            self._connect().execute("DELETE FROM responses")
+            self.hits = self.misses = self.writes = self.evictions = 0
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class TieredResponseCache:
+    """
+    Whole-response cache for OrpheusTextNormalizer: a size-bounded in-process LRU in
+    front of an optional shared store such as SQLiteResponseStore.
+
+    Responses are kept as JSON and parsed on every hit, so each caller gets its own
+    response object and cannot change what later callers see. The store's ttl is
+    applied when reading from the store; the LRU tier is bounded only by size.
+    """
+
+    def __init__(self, maxsize: int = 4096, store: SQLiteResponseStore = None):
+        """
+        Args:
+            maxsize (int): Entries kept in the in-process LRU
+            store (SQLiteResponseStore): Second tier shared between processes (default: none)
+        """
+        self.memory = LRUCache(maxsize=maxsize)
+        self.store = store
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        return {"maxsize": self.memory.maxsize, "store": self.store}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def get(self, text: str, to_lang: str, fingerprint: str):
+        """Return the cached response for (text, to_lang, fingerprint), or None."""
+        memory_key = (text, to_lang, fingerprint)
+        payload = self.memory.get(memory_key)
+        if payload is None and self.store is not None:
+            payload = self.store.get(response_cache_key(text, to_lang, fingerprint))
+            if payload is not None:
+                self.memory.put(memory_key, payload)
+        with self._lock:
+            if payload is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return DeterministicPreTTSPreprocessingResponse.model_validate_json(payload)
+
+    def put(self, text: str, to_lang: str, fingerprint: str, response: DeterministicPreTTSPreprocessingResponse, memory_only: bool = False):
+        """Cache response in both tiers, or only in the in-process LRU when memory_only is set."""
+        payload = response.model_dump_json()
+        self.memory.put((text, to_lang, fingerprint), payload)
+        if self.store is not None and not memory_only:
+            self.store.put(response_cache_key(text, to_lang, fingerprint), payload)
+
+    def clear(self):
+        self.memory.clear()
+        if self.store is not None:
+            self.store.clear()
+        with self._lock:
+            self.hits = self.misses = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "memory": self.memory.stats(),
+            "store": self.store.stats() if self.store is not None else None,
+        }
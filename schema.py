@@ -1,10 +1,24 @@
 from pydantic import BaseModel
 from enum import StrEnum
+from typing import NamedTuple
 
 class DeterministicPreTTSPreprocessingResponse(BaseModel):
     formatted_text: str
     replaced_entities: list[tuple[str, str, str]]
 
+class NormalizedText(NamedTuple):
+    """
+    Lightweight result of OrpheusTextNormalizer.process_text_lean: a plain tuple,
+    no validation. replaced_entities is empty unless entities were asked for.
+    """
+    formatted_text: str
+    replaced_entities: tuple = ()
+
+    def to_response(self) -> DeterministicPreTTSPreprocessingResponse:
+        return DeterministicPreTTSPreprocessingResponse(
+            formatted_text=self.formatted_text, replaced_entities=list(self.replaced_entities)
+        )
+
 class EntityType(StrEnum):
     DATE = "date"
     TIME = "time"
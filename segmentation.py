@@ -0,0 +1,89 @@
+import re
+
+
+# A sentence terminator, the plain whitespace after it, and the letter that starts
+# the next sentence. The text cleaner deletes every whitespace character except the
+# space (non-breaking spaces included), so the whitespace must hold at least one space
+# for the sentences to come out separated by one.
+SENTENCE_TERMINATORS = ".?!।"
+SENTENCE_BOUNDARY_PATTERN = re.compile(
+    rf"([{SENTENCE_TERMINATORS}])[\t\n\r\f\v]* [ \t\n\r\f\v]*(?=[^\W\d_])"
+)
+
+# The currency stage can start a match at a sentence-final "." and run on into a
+# currency code (or a scale suffix and code) at the start of the next sentence. A
+# scale suffix or word followed by whitespace is swallowed too, together with that
+# whitespace, which shifts where the next currency match starts.
+CURRENCY_CONTINUATION_PATTERN = re.compile(
+    r"\s*(?:[kmb])?(?:\s*(?:hundreds?|thousands?|lakhs?|millions?|crores?|billions?|rupees?))?"
+    r"(?:\s*(?:USD|EUR|INR|GBP|JPY|CAD|AUD)|(?<=[a-z])(?=\s))",
+    re.IGNORECASE,
+)
+
+# Letters in the longest currency continuation, a scale letter, scale word and code
+# ("m thousands USD"). Text after a "." that holds more letters than this, or any
+# character other than letters and whitespace, can no longer start one.
+CURRENCY_CONTINUATION_LETTERS = 13
+
+# After a 0b/0o/0x prefix the non-comma number stage reads later numbers digit by
+# digit, so text that follows one must not be split off from it.
+RADIX_PREFIX_PATTERN = re.compile(r"\b0[box]")
+
+
+def sentence_spans(text: str) -> list[tuple[int, int]]:
+    """
+    Split text into (start, end) spans at sentence boundaries that no entity can cross.
+
+    A boundary is a ".", "?", "!" or "।" followed by whitespace that includes a space,
+    and a letter. A "." is not a boundary when it directly follows a digit, comma or
+    period, or when the next sentence opens with a currency code or a lone scale suffix
+    or word, because the currency stage matches across both ("$5. M...", ". USD 5",
+    ". m 10 USD"). The whitespace between sentences
+    is not part of any span. Normalizing each span separately and joining the results with a
+    single space gives the same text as normalizing the whole input.
+    """
+    radix_match = RADIX_PREFIX_PATTERN.search(text)
+    limit = radix_match.start() if radix_match else len(text)
+
+    spans = []
+    start = 0
+    for match in SENTENCE_BOUNDARY_PATTERN.finditer(text, 0, limit):
+        terminator_start = match.start(1)
+        if match.group(1) == ".":
+            previous = text[terminator_start - 1] if terminator_start else ""
+            if previous and (previous.isdigit() or previous in ",."):
+                continue
+            if CURRENCY_CONTINUATION_PATTERN.match(text, match.end(1)):
+                continue
+        spans.append((start, match.end(1)))
+        start = match.end()
+    spans.append((start, len(text)))
+    return spans
+
+
+def split_sentences(text: str) -> list[str]:
+    """Split text at safe sentence boundaries; see sentence_spans."""
+    return [text[start:end] for start, end in sentence_spans(text)]
+
+
+def settled_sentence_spans(text: str) -> tuple[list[tuple[int, int]], int]:
+    """
+    The leading sentence_spans of a text that is still growing which no appended
+    text can change, and the offset at which the unsettled rest begins.
+
+    The last span is never settled, since it may still continue. A "." boundary
+    before it stays unsettled while the text after the "." could still grow into a
+    currency continuation, which would merge the two sentences.
+    """
+    spans = sentence_spans(text)
+    settled = spans[:-1]
+    if settled:
+        end = settled[-1][1]
+        rest = text[end:]
+        if (
+            text[end - 1] == "."
+            and all(char.isalpha() or char.isspace() for char in rest)
+            and sum(char.isalpha() for char in rest) <= CURRENCY_CONTINUATION_LETTERS
+        ):
+            settled.pop()
+    return settled, spans[len(settled)][0]
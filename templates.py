@@ -0,0 +1,325 @@
+import logging
+import re
+import string
+
+from schema import DeterministicPreTTSPreprocessingResponse, EntityType
+from segmentation import RADIX_PREFIX_PATTERN
+
+
+# Value shapes a slot of each entity type takes on the precompiled path, and the
+# probe values used to check a template against whole-text normalization. Probes
+# cover every alternative of the shape, the digit counts the stages care about and
+# values a stage gives up on (impossible dates).
+SLOT_SHAPES = {
+    EntityType.CURRENCY: (
+        re.compile(r"\d{1,3}(?:,\d{2,3})+(?:\.\d{1,2})?|\d{1,9}(?:\.\d{1,2})?"),
+        (
+            "1", "5", "10", "99", "100", "250", "1000", "2499", "10000", "99999", "100000",
+            "1500000", "123456789", "1,000", "1,500", "12,500", "99,999", "1,00,000", "1,23,456",
+            "12,34,567", "1,234,567", "0.5", "0.50", "9.99", "99.95", "1500.75", "1,23,456.78",
+        ),
+    ),
+    EntityType.DATE: (
+        re.compile(
+            r"(?:0?[1-9]|[12]\d|3[01])[/-](?:0?[1-9]|1[0-2])[/-]\d{4}"
+            r"|\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\d|3[01])"
+        ),
+        (
+            "1/1/2024", "01/01/2024", "12/05/2023", "5/11/2025", "31/12/1999", "28/02/2024",
+            "29/02/2024", "15-08-2025", "9-3-2030", "30-06-2000", "2023-11-04", "2024-01-31",
+            "1999-12-31", "2030-06-15", "31/04/2024", "30-02-2023", "2023-02-30",
+        ),
+    ),
+    EntityType.TIME: (
+        re.compile(r"(?:[01]?\d|2[0-3]):[0-5]\d|(?:1[0-2]|0?[1-9])(?::[0-5]\d)? ?(?:AM|PM|am|pm)"),
+        (
+            "0:00", "00:30", "9:05", "09:45", "12:00", "13:15", "18:30", "23:59",
+            "1 PM", "9am", "10:30 AM", "12:45 pm", "11:59 PM", "7:05 am", "12 AM",
+        ),
+    ),
+    EntityType.NON_COMMA_NUMBERS: (
+        re.compile(r"\d{1,12}"),
+        (
+            "0", "7", "05", "10", "42", "100", "999", "1000", "1999", "2024", "48291", "482913",
+            "000123", "1234567", "12345678", "123456789", "9876543210", "12345678901", "123456789012",
+        ),
+    ),
+    EntityType.DECIMAL: (
+        re.compile(r"\d{1,9}\.\d{1,4}"),
+        ("0.5", "1.0", "3.14", "7.25", "10.75", "99.99", "100.5", "12.3456", "2024.01", "123456789.1"),
+    ),
+    EntityType.PHONE_NUMBERS: (
+        re.compile(r"\+?\d{1,4}(?:[- ]\d{2,5}){1,3}|\d{10}"),
+        (
+            "9876543210", "98765-43210", "98765 43210", "+91-98765-43210", "+91 98765 43210",
+            "022-24567890", "1800-222-3344", "+1-415-555-1234", "+44 20 7946 0958",
+        ),
+    ),
+    EntityType.ORDINAL: (
+        re.compile(r"\d{1,4}(?:st|nd|rd|th)"),
+        ("1st", "2nd", "3rd", "4th", "11th", "12th", "13th", "21st", "22nd", "23rd", "101st", "111th", "1000th"),
+    ),
+}
+
+# Entity type assumed for a slot from its name, or the last "_" part of its name.
+SLOT_NAME_TYPES = {
+    "amount": EntityType.CURRENCY,
+    "price": EntityType.CURRENCY,
+    "balance": EntityType.CURRENCY,
+    "fee": EntityType.CURRENCY,
+    "total": EntityType.CURRENCY,
+    "emi": EntityType.CURRENCY,
+    "date": EntityType.DATE,
+    "dob": EntityType.DATE,
+    "time": EntityType.TIME,
+    "otp": EntityType.NON_COMMA_NUMBERS,
+    "pin": EntityType.NON_COMMA_NUMBERS,
+    "code": EntityType.NON_COMMA_NUMBERS,
+    "count": EntityType.NON_COMMA_NUMBERS,
+    "days": EntityType.NON_COMMA_NUMBERS,
+    "number": EntityType.NON_COMMA_NUMBERS,
+    "quantity": EntityType.NON_COMMA_NUMBERS,
+    "rate": EntityType.DECIMAL,
+    "phone": EntityType.PHONE_NUMBERS,
+    "mobile": EntityType.PHONE_NUMBERS,
+    "rank": EntityType.ORDINAL,
+}
+
+# Template words a stage pattern can join to a neighbouring number across whitespace:
+# am/pm, scale suffixes and words, currency names and codes, month names and the one-
+# or two-letter parts of a vehicle number. Whether they join depends on the value
+# ("+4-36976-12 pm" reads "12 pm" as a time), which probes cannot rule out, so a
+# static token that holds one, a digit or a currency symbol always stays in the window
+# next to it.
+COMBINING_WORDS = frozenset({
+    "am", "pm", "बजे", "hours", "k", "m", "b",
+    "hundred", "hundreds", "thousand", "thousands", "lakh", "lakhs", "million", "millions",
+    "crore", "crores", "billion", "billions", "rupee", "rupees", "rs",
+    "usd", "eur", "inr", "gbp", "jpy", "cad", "aud",
+    "jan", "january", "feb", "february", "mar", "march", "apr", "april", "may", "jun", "june",
+    "jul", "july", "aug", "august", "sep", "september", "oct", "october", "nov", "november",
+    "dec", "december",
+})
+_COMBINING_CHARACTER_PATTERN = re.compile(r"[\d₹$£€¥]")
+_TOKEN_EDGE_PATTERN = re.compile(r"^\W+|\W+$")
+_SLOT_MARKER_PATTERN = re.compile(r"\x00(\d+)\x00")
+_FORMATTER = string.Formatter()
+
+
+def slot_type(name: str):
+    """Entity type SLOT_NAME_TYPES gives a slot name, or None."""
+    name = name.lower()
+    return SLOT_NAME_TYPES.get(name) or SLOT_NAME_TYPES.get(name.rsplit("_", 1)[-1])
+
+
+def _combines(token: str) -> bool:
+    """Whether a static template token can join a neighbouring slot value's entity."""
+    if _COMBINING_CHARACTER_PATTERN.search(token):
+        return True
+    word = _TOKEN_EDGE_PATTERN.sub("", token)
+    return word.lower() in COMBINING_WORDS or (word.isascii() and word.isupper() and len(word) <= 2)
+
+
+class CompiledTemplate:
+    """
+    A str.format-style prompt template precompiled for one normalizer and language.
+
+    The template is cut at whitespace into static pieces and slot windows (each slot
+    with the template text around it that its entity can reach). Static pieces are
+    normalized once, at compile time. render() normalizes only the slot windows and
+    stitches in the static results, so a template's static text is never scanned again.
+
+    A slot's window always takes in the static tokens next to it that a value can
+    combine with (see COMBINING_WORDS). It is widened from there until rendering every
+    probe value of its slots' types (SLOT_SHAPES) this way gives exactly the response
+    process_text gives for the filled string. Probes catch context that affects every
+    value alike; the combining tokens cover context that only some values reach. Values
+    that do not have their slot type's shape, templates that could not be precompiled
+    and normalizer configuration changes fall back to normalizing the filled string
+    (recompiling first in the last case).
+    """
+
+    def __init__(self, normalizer, template: str, to_lang: str = "en", slots: dict = None):
+        """
+        Args:
+            normalizer (OrpheusTextNormalizer): Normalizer to render with
+            template (str): Template with named str.format fields, e.g. "Your OTP is {otp}."
+            to_lang (str): Target language code (default: "en")
+            slots (dict): Slot name -> EntityType, overriding SLOT_NAME_TYPES
+        """
+        self.normalizer = normalizer
+        self.template = template
+        self.to_lang = to_lang
+        self.fields = []
+        # (literal text, index of the field after it or None) in template order.
+        self.parts = []
+        marked = []
+        for literal, field_name, format_spec, conversion in _FORMATTER.parse(template):
+            if "\x00" in literal:
+                raise ValueError("template must not contain NUL characters")
+            marked.append(literal)
+            if field_name is None:
+                self.parts.append((literal, None))
+                continue
+            if not field_name.isidentifier():
+                raise ValueError(f"template fields must be plain names, got {{{field_name}}}")
+            marked.append(f"\x00{len(self.fields)}\x00")
+            self.parts.append((literal, len(self.fields)))
+            self.fields.append((field_name, conversion, format_spec or ""))
+        # Each token is a list alternating literal text and field indices.
+        self.tokens = [_SLOT_MARKER_PATTERN.split(token) for token in "".join(marked).split()]
+        self._combining = [len(token) == 1 and _combines(token[0]) for token in self.tokens]
+        self.slots = {name: slot_type(name) for name, _, _ in self.fields}
+        self.slots.update(slots or {})
+        self.fast_renders = 0
+        self.fallback_renders = 0
+        self._compile()
+
+    @property
+    def pieces(self):
+        return self._compiled[1]
+
+    @property
+    def precompiled(self) -> bool:
+        return self.pieces is not None
+
+    def _compile(self):
+        # (normalizer fingerprint, pieces), replaced as a whole so concurrent renders
+        # never pair pieces with the wrong fingerprint.
+        fingerprint = self.normalizer.cache_fingerprint()
+        self._compiled = (fingerprint, self._find_pieces())
+
+    def _find_pieces(self):
+        """The narrowest slot windows that pass every probe, or None."""
+        # A radix prefix changes how every later number is read.
+        if (
+            RADIX_PREFIX_PATTERN.search(self.template)
+            or any(self.slots.get(name) not in SLOT_SHAPES for name, _, _ in self.fields)
+        ):
+            return None
+        slot_tokens = [index for index, token in enumerate(self.tokens) if len(token) > 1]
+        probe_fills = self._probe_fills()
+        expected = [
+            self.normalizer._process_text_sequential(self._fill_text(filled), self.to_lang) for filled in probe_fills
+        ]
+        for reach in range(len(self.tokens)):
+            windows = self._windows(slot_tokens, reach)
+            if len(windows) == 1 and windows[0] == (0, len(self.tokens)):
+                return None
+            try:
+                pieces = self._pieces(windows)
+                if all(
+                    self._render_pieces(pieces, filled) == response
+                    for filled, response in zip(probe_fills, expected)
+                ):
+                    return pieces
+            except Exception as e:
+                logging.warning(f"Template precompilation failed, rendering filled strings. Error: {str(e)}")
+                return None
+        return None
+
+    def _probe_fills(self) -> list:
+        """Formatted field values for each probe; every probe of every slot's type is used."""
+        names = list(dict.fromkeys(name for name, _, _ in self.fields))
+        probes = {name: SLOT_SHAPES[self.slots[name]][1] for name in names}
+        count = max((len(values) for values in probes.values()), default=1)
+        fills = []
+        for fill in range(count):
+            values = {name: probes[name][(fill + offset) % len(probes[name])] for offset, name in enumerate(names)}
+            fills.append([values[name] for name, _, _ in self.fields])
+        return fills
+
+    def _windows(self, slot_tokens, reach) -> list:
+        """
+        Token ranges covering each slot token, reach tokens either side and any run of
+        combining static tokens beyond those, overlaps merged.
+        """
+        windows = []
+        for index in slot_tokens:
+            start, end = max(index - reach, 0), min(index + reach + 1, len(self.tokens))
+            while start > 0 and self._combining[start - 1]:
+                start -= 1
+            while end < len(self.tokens) and self._combining[end]:
+                end += 1
+            if windows and start <= windows[-1][1]:
+                windows[-1] = (windows[-1][0], max(windows[-1][1], end))
+            else:
+                windows.append((start, end))
+        return windows
+
+    def _pieces(self, windows) -> list:
+        """Precomputed (formatted, stage entities) for static runs, token lists for windows."""
+        plan = self.normalizer.get_plan(self.to_lang)
+        pieces, last = [], 0
+        for start, end in windows + [(len(self.tokens), len(self.tokens))]:
+            if start > last:
+                static = " ".join(token[0] for token in self.tokens[last:start])
+                pieces.append(self.normalizer._normalize_segment(static, plan))
+            if end > start:
+                pieces.append(self.tokens[start:end])
+            last = end
+        return pieces
+
+    def _fill_slots(self, values: dict) -> list:
+        """The formatted value of every field, in field order."""
+        return [
+            _FORMATTER.format_field(_FORMATTER.convert_field(values[name], conversion), format_spec)
+            for name, conversion, format_spec in self.fields
+        ]
+
+    def _fill_tokens(self, tokens, filled) -> str:
+        return " ".join(
+            "".join(filled[int(part)] if part_index % 2 else part for part_index, part in enumerate(token))
+            for token in tokens
+        )
+
+    def _fill_text(self, filled) -> str:
+        """The filled template, as str.format would give it."""
+        return "".join(literal if index is None else literal + filled[index] for literal, index in self.parts)
+
+    def _render_pieces(self, pieces, filled) -> DeterministicPreTTSPreprocessingResponse:
+        normalizer = self.normalizer
+        plan = normalizer.get_plan(self.to_lang)
+        segments = [
+            normalizer._normalize_segment(self._fill_tokens(piece, filled), plan) if isinstance(piece, list) else piece
+            for piece in pieces
+        ]
+        return DeterministicPreTTSPreprocessingResponse(
+            formatted_text=" ".join(formatted for formatted, _ in segments if formatted),
+            replaced_entities=normalizer._stitch_entities(plan, segments),
+        )
+
+    def render(self, **values) -> DeterministicPreTTSPreprocessingResponse:
+        """
+        Normalize the template filled with values, as process_text would.
+
+        Args:
+            **values: One value per template field
+
+        Returns:
+            DeterministicPreTTSPreprocessingResponse: Processed text with replacement entities
+        """
+        fingerprint, pieces = self._compiled
+        if self.normalizer.cache_fingerprint() != fingerprint:
+            self._compile()
+            fingerprint, pieces = self._compiled
+        filled = self._fill_slots(values)
+        if pieces is not None and all(
+            SLOT_SHAPES[self.slots[name]][0].fullmatch(value) for (name, _, _), value in zip(self.fields, filled)
+        ):
+            try:
+                response = self._render_pieces(pieces, filled)
+                self.fast_renders += 1
+                return response
+            except Exception as e:
+                logging.warning(f"Precompiled template failed, rendering the filled string. Error: {str(e)}")
+        self.fallback_renders += 1
+        return self.normalizer.process_text(self._fill_text(filled), self.to_lang)
+
+    def stats(self) -> dict:
+        return {
+            "precompiled": self.precompiled,
+            "static_pieces": sum(not isinstance(piece, list) for piece in self.pieces or ()),
+            "fast_renders": self.fast_renders,
+            "fallback_renders": self.fallback_renders,
+        }
@@ -0,0 +1,247 @@
+import random
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from typing import NamedTuple, Optional
+
+from schema import EntityType
+
+
+class StageEvent(NamedTuple):
+    """One pipeline stage run over one text."""
+
+    stage: str
+    entity_type: Optional[EntityType]
+    start: float  # time.perf_counter() when the stage started
+    duration: float  # seconds
+    matches: int  # entities the stage replaced
+    input_length: int
+    output_length: int
+    error: Optional[str] = None  # exception class name if the stage raised
+
+
+class PipelineTrace(NamedTuple):
+    """One process_text call, passed to every observer when it finishes."""
+
+    to_lang: str
+    start_time_ns: int  # wall clock, time.time_ns()
+    start: float  # time.perf_counter() at the same moment
+    duration: float  # seconds
+    input_length: int
+    output_length: int
+    entities: int
+    stages: tuple  # StageEvent, in the order they ran
+    error: Optional[str] = None  # set when the pipeline gave up and returned partial text
+
+
+DEFAULT_BUCKETS = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1)
+
+
+class _Histogram:
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self, buckets):
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, buckets, value):
+        # The last slot counts values above every bound (the +Inf bucket).
+        self.counts[bisect_left(buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+
+def _escape_label(value) -> str:
+    # The text exposition format escapes backslash, double quote and line feed in label values.
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels):
+    return "{" + ",".join(f'{key}="{_escape_label(value)}"' for key, value in labels.items()) + "}"
+
+
+class MetricsCollector:
+    """
+    Observer that aggregates traces into per-request and per-stage counters and latency
+    histograms, labelled by stage, target language and entity type.
+
+    Export with to_prometheus() for a /metrics endpoint or read snapshot() directly.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            # to_lang -> [requests, errors, histogram]
+            self._requests = {}
+            # (stage, to_lang, entity_type) -> [calls, errors, matches, input chars, output chars, histogram]
+            self._stages = {}
+
+    def __call__(self, trace: PipelineTrace):
+        with self._lock:
+            request = self._requests.get(trace.to_lang)
+            if request is None:
+                request = self._requests[trace.to_lang] = [0, 0, _Histogram(self.buckets)]
+            request[0] += 1
+            request[1] += trace.error is not None
+            request[2].observe(self.buckets, trace.duration)
+
+            for event in trace.stages:
+                key = (event.stage, trace.to_lang, str(event.entity_type or ""))
+                stage = self._stages.get(key)
+                if stage is None:
+                    stage = self._stages[key] = [0, 0, 0, 0, 0, _Histogram(self.buckets)]
+                stage[0] += 1
+                stage[1] += event.error is not None
+                stage[2] += event.matches
+                stage[3] += event.input_length
+                stage[4] += event.output_length
+                stage[5].observe(self.buckets, event.duration)
+
+    def snapshot(self) -> dict:
+        """Plain-dict copy of the aggregated counters."""
+        with self._lock:
+            return {
+                "requests": [
+                    {"to_lang": to_lang, "requests": requests, "errors": errors, "seconds": histogram.total}
+                    for to_lang, (requests, errors, histogram) in self._requests.items()
+                ],
+                "stages": [
+                    {"stage": stage, "to_lang": to_lang, "entity_type": entity_type, "calls": calls,
+                     "errors": errors, "matches": matches, "input_chars": input_chars,
+                     "output_chars": output_chars, "seconds": histogram.total}
+                    for (stage, to_lang, entity_type), (calls, errors, matches, input_chars, output_chars, histogram)
+                    in self._stages.items()
+                ],
+            }
+
+    def to_prometheus(self, prefix: str = "orpheus_normalizer") -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+        lines = []
+
+        def histogram_lines(name, labels, histogram):
+            cumulative = 0
+            for bound, count in zip(self.buckets, histogram.counts):
+                cumulative += count
+                lines.append(f"{name}_bucket{_labels(**labels, le=repr(bound))} {cumulative}")
+            lines.append(f"{name}_bucket{_labels(**labels, le='+Inf')} {histogram.count}")
+            lines.append(f"{name}_sum{_labels(**labels)} {histogram.total!r}")
+            lines.append(f"{name}_count{_labels(**labels)} {histogram.count}")
+
+        with self._lock:
+            lines.append(f"# TYPE {prefix}_requests_total counter")
+            for to_lang, (requests, _, _) in self._requests.items():
+                lines.append(f"{prefix}_requests_total{_labels(lang=to_lang)} {requests}")
+            lines.append(f"# TYPE {prefix}_request_errors_total counter")
+            for to_lang, (_, errors, _) in self._requests.items():
+                lines.append(f"{prefix}_request_errors_total{_labels(lang=to_lang)} {errors}")
+            lines.append(f"# TYPE {prefix}_request_duration_seconds histogram")
+            for to_lang, (_, _, histogram) in self._requests.items():
+                histogram_lines(f"{prefix}_request_duration_seconds", {"lang": to_lang}, histogram)
+
+            counters = (
+                ("stage_calls_total", 0),
+                ("stage_errors_total", 1),
+                ("stage_matches_total", 2),
+                ("stage_input_chars_total", 3),
+                ("stage_output_chars_total", 4),
+            )
+            for name, index in counters:
+                lines.append(f"# TYPE {prefix}_{name} counter")
+                for (stage, to_lang, entity_type), values in self._stages.items():
+                    labels = _labels(stage=stage, lang=to_lang, entity_type=entity_type)
+                    lines.append(f"{prefix}_{name}{labels} {values[index]}")
+            lines.append(f"# TYPE {prefix}_stage_duration_seconds histogram")
+            for (stage, to_lang, entity_type), values in self._stages.items():
+                histogram_lines(
+                    f"{prefix}_stage_duration_seconds",
+                    {"stage": stage, "lang": to_lang, "entity_type": entity_type},
+                    values[5],
+                )
+        return "\n".join(lines) + "\n"
+
+
+class SpanRecorder:
+    """
+    Observer that turns each trace into OpenTelemetry-style spans: one "process_text"
+    span with a child span per stage. Spans are buffered (oldest dropped beyond
+    maxlen) until drain() hands them to an exporter.
+    """
+
+    def __init__(self, maxlen: int = 10000):
+        self._spans = deque(maxlen=maxlen)
+
+    def __call__(self, trace: PipelineTrace):
+        trace_id = f"{random.getrandbits(128):032x}"
+        root_id = f"{random.getrandbits(64):016x}"
+        spans = [{
+            "name": "process_text",
+            "trace_id": trace_id,
+            "span_id": root_id,
+            "parent_span_id": None,
+            "start_time_unix_nano": trace.start_time_ns,
+            "end_time_unix_nano": trace.start_time_ns + int(trace.duration * 1e9),
+            "attributes": {
+                "normalizer.to_lang": trace.to_lang,
+                "normalizer.input_length": trace.input_length,
+                "normalizer.output_length": trace.output_length,
+                "normalizer.entities": trace.entities,
+            },
+            "status": {"code": "ERROR", "message": trace.error} if trace.error else {"code": "OK"},
+        }]
+        for event in trace.stages:
+            start_ns = trace.start_time_ns + int((event.start - trace.start) * 1e9)
+            spans.append({
+                "name": event.stage,
+                "trace_id": trace_id,
+                "span_id": f"{random.getrandbits(64):016x}",
+                "parent_span_id": root_id,
+                "start_time_unix_nano": start_ns,
+                "end_time_unix_nano": start_ns + int(event.duration * 1e9),
+                "attributes": {
+                    "normalizer.to_lang": trace.to_lang,
+                    "normalizer.entity_type": str(event.entity_type or ""),
+                    "normalizer.matches": event.matches,
+                    "normalizer.input_length": event.input_length,
+                    "normalizer.output_length": event.output_length,
+                },
+                "status": {"code": "ERROR", "message": event.error} if event.error else {"code": "OK"},
+            })
+        self._spans.extend(spans)
+
+    def __len__(self):
+        return len(self._spans)
+
+    def drain(self) -> list[dict]:
+        """Remove and return the buffered spans, oldest first."""
+        spans = []
+        while True:
+            try:
+                spans.append(self._spans.popleft())
+            except IndexError:
+                return spans
+
+
+def run_stage_traced(stage_events, stage, entity_type, fn, text):
+    """
+    Call fn(text) and append a StageEvent for it to stage_events. fn returns either the
+    new text or a (new text, replaced entities) pair; exceptions are recorded and re-raised.
+    """
+    start = time.perf_counter()
+    try:
+        result = fn(text)
+    except Exception as e:
+        stage_events.append(
+            StageEvent(stage, entity_type, start, time.perf_counter() - start, 0, len(text), len(text), type(e).__name__)
+        )
+        raise
+    output, entities = result if isinstance(result, tuple) else (result, ())
+    stage_events.append(
+        StageEvent(stage, entity_type, start, time.perf_counter() - start, len(entities), len(text), len(output))
+    )
+    return result